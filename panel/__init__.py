@@ -45,34 +45,98 @@ https://blog.holoviz.org/panel_0.12.0.html#JupyterLab-previews
 To learn more about Panel check out
 https://panel.holoviz.org/getting_started/index.html
 """
+import importlib
+import sys
+import types
+import typing as t
+
 from param import rx
 
-from . import layout  # noqa
-from . import links  # noqa
-from . import pane  # noqa
-from . import param  # noqa
-from . import pipeline  # noqa
-from . import reactive  # noqa
-from . import template  # noqa
-from . import viewable  # noqa
-from . import widgets  # noqa
-from .config import __version__, config, panel_extension as extension  # noqa
-from .depends import bind, depends  # noqa
-from .interact import interact  # noqa
 from .io import (  # noqa
     _jupyter_server_extension_paths, cache, ipywidget, serve, state,
 )
-from .layout import (  # noqa
-    Accordion, Card, Column, Feed, FlexBox, FloatPanel, GridBox, GridSpec,
-    GridStack, HSpacer, Modal, Row, Spacer, Swipe, Tabs, VSpacer, WidgetBox,
+from .config import __version__, config, panel_extension as extension  # noqa # isort:skip
+from .depends import bind, depends  # noqa # isort:skip
+
+if t.TYPE_CHECKING:
+    from . import (  # noqa
+        chat, custom, layout, links, pane, param, pipeline, reactive, template,
+        viewable, widgets,
+    )
+    from .interact import interact  # noqa
+    from .layout import (  # noqa
+        Accordion, Card, Column, Feed, FlexBox, FloatPanel, GridBox, GridSpec,
+        GridStack, HSpacer, Modal, Row, Spacer, Swipe, Tabs, VSpacer, WidgetBox,
+    )
+    from .pane import panel  # noqa
+    from .param import Param, ReactiveExpr  # noqa
+    from .template import Template  # noqa
+    from .widgets import indicators, widget  # noqa
+
+# Submodules which are only imported on first access to keep
+# `import panel` fast (see PEP 562)
+_LAZY_MODULES = (
+    'chat', 'custom', 'layout', 'links', 'pane', 'param', 'pipeline',
+    'reactive', 'template', 'viewable', 'widgets'
 )
-from .pane import panel  # noqa
-from .param import Param, ReactiveExpr  # noqa
-from .template import Template  # noqa
-from .widgets import indicators, widget  # noqa
 
-from . import custom  # isort:skip noqa has to be after widgets
-from . import chat  # isort:skip noqa has to be after widgets
+# Objects which are imported from the submodule providing them on
+# first access
+_LAZY_OBJECTS = {
+    'panel': 'pane',
+    'Param': 'param',
+    'ReactiveExpr': 'param',
+    'Template': 'template',
+    'indicators': 'widgets',
+    'widget': 'widgets',
+    **{
+        name: 'layout' for name in (
+            'Accordion', 'Card', 'Column', 'Feed', 'FlexBox', 'FloatPanel',
+            'GridBox', 'GridSpec', 'GridStack', 'HSpacer', 'Modal', 'Row',
+            'Spacer', 'Swipe', 'Tabs', 'VSpacer', 'WidgetBox'
+        )
+    }
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    elif name in _LAZY_OBJECTS:
+        module = importlib.import_module(f'.{_LAZY_OBJECTS[name]}', __name__)
+        obj = globals()[name] = getattr(module, name)
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _PanelModule(types.ModuleType):
+
+    # Importing the interact submodule assigns it to the package, which
+    # would otherwise shadow the interact function once it is loaded
+    @property
+    def interact(self):
+        from .interact import interact
+        return interact
+
+    @interact.setter
+    def interact(self, value):
+        pass
+
+
+sys.modules[__name__].__class__ = _PanelModule
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _load_lazy() -> None:
+    """
+    Imports all lazily loaded submodules, ensuring all components
+    are registered.
+    """
+    for name in _LAZY_MODULES:
+        __getattr__(name)
 
 __all__ = (
     "__version__",
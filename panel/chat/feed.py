@@ -506,7 +506,16 @@ class ChatFeed(ListPanel):
                 user = value.user
                 avatar = value.avatar
                 value = value.object
-            message.update(value, user=user, avatar=avatar)
+            if (isinstance(value, str) and isinstance(message.object, str) and
+                (message.stream_interval or message.stream_batch_size)):
+                # Coalesce updates, only the latest value is rendered
+                message.stream(value, replace=True)
+                if user:
+                    message.user = user
+                if avatar:
+                    message.avatar = avatar
+            else:
+                message.update(value, user=user, avatar=avatar)
             return message
         elif isinstance(value, ChatMessage):
             # ChatMessage is not created yet, but a ChatMessage is passed; use it
@@ -589,9 +598,11 @@ class ChatFeed(ListPanel):
             else:
                 response_message = self._upsert_message(response, response_message, callback_id)
             if response_message is not None:
+                response_message.flush()
                 self._run_post_hook(response_message)
         finally:
             if response_message:
+                response_message.flush()
                 response_message.show_activity_dot = False
         return response_message
 
@@ -845,6 +856,8 @@ class ChatFeed(ListPanel):
                 message.param.update(**message_params)
             self._chat_log.scroll_to_latest(scroll_limit=self.auto_scroll_limit)
             if trigger_post_hook:
+                if isinstance(message, ChatMessage):
+                    message.flush()
                 self._run_post_hook(message)
             return message
 
@@ -5,6 +5,8 @@ The message module provides a low-level API for rendering chat messages.
 from __future__ import annotations
 
 import datetime
+import threading
+import time
 import typing as t
 
 from contextlib import ExitStack
@@ -48,6 +50,8 @@ if t.TYPE_CHECKING:
     from bokeh.model import Model
     from pyviz_comms import Comm
 
+    from ..io.callbacks import PeriodicCallback
+
     class MessageParams(t.TypedDict, total=False):
         avatar: Avatar
         user: str
@@ -68,6 +72,10 @@ HOLOVIEWS_LOGO = "{dist_path}assets/logo/holoviews.svg"
 HVPLOT_LOGO = "{dist_path}assets/logo/hvplot.svg"
 PANEL_LOGO = "{dist_path}images/icon-vector.svg"
 
+# Delay (in seconds) after which tokens buffered with only a
+# stream_batch_size are rendered if no further tokens are streamed
+_STREAM_FLUSH_PERIOD = 0.5
+
 DEFAULT_AVATARS = {
     # User
     "client": USER_LOGO,
@@ -238,6 +246,19 @@ class ChatMessage(Pane):
     show_activity_dot = param.Boolean(default=False, doc="""
         Whether to show the activity dot.""")
 
+    stream_batch_size = param.Integer(default=None, bounds=(1, None), doc="""
+        Number of streamed tokens to buffer before the message is
+        updated. May be combined with stream_interval, in which case
+        the buffer is flushed when either limit is reached. Buffered
+        tokens are rendered after a short delay if no further tokens
+        are streamed.""")
+
+    stream_interval = param.Number(default=0, bounds=(0, None), doc="""
+        Minimum interval (in seconds) between updates of the message
+        while tokens are being streamed to it. Tokens streamed in
+        between are buffered and rendered together, reducing the
+        number of re-renders and messages sent to the frontend.""")
+
     renderers = param.HookList(doc="""
         A callable or list of callables that accept the object and return a
         Panel object to render the object. If a list is provided, will
@@ -256,6 +277,12 @@ class ChatMessage(Pane):
 
     def __init__(self, object=None, **params):
         self._exit_stack = ExitStack()
+        self._stream_lock = threading.Lock()
+        self._stream_buffer: list[str] = []
+        self._stream_replace = False
+        self._stream_count = 0
+        self._stream_flushed = 0.
+        self._stream_cb: PeriodicCallback | None = None
         if params.get("timestamp") is None:
             tz = params.get("timestamp_tz")
             if tz is not None:
@@ -674,6 +701,53 @@ class ChatMessage(Pane):
         replace: bool (default=False)
             Whether to replace the existing text.
         """
+        if not (self.stream_interval or self.stream_batch_size):
+            self.flush()
+            stream_to(obj=self.object, token=token, replace=replace, object_panel=self)
+            return
+        with self._stream_lock:
+            if replace:
+                self._stream_buffer.clear()
+                self._stream_replace = True
+            self._stream_buffer.append(token)
+            # Count the streamed updates rather than the buffered
+            # tokens since replacing updates are coalesced
+            self._stream_count += 1
+            interval = self.stream_interval
+            elapsed = time.monotonic() - self._stream_flushed
+            flush = bool(
+                (interval and elapsed >= interval) or
+                (self.stream_batch_size and self._stream_count >= self.stream_batch_size)
+            )
+            schedule = not flush and self._stream_cb is None
+        if flush:
+            self.flush()
+        elif schedule:
+            # Ensure the buffered tokens are rendered even if no
+            # further tokens are streamed
+            period = interval or _STREAM_FLUSH_PERIOD
+            self._stream_cb = state.add_periodic_callback(
+                self._scheduled_flush, period=int(period*1000), count=1
+            )
+
+    def _scheduled_flush(self):
+        self._stream_cb = None
+        self.flush()
+
+    def flush(self):
+        """
+        Renders any tokens which were buffered while streaming with
+        a `stream_interval` or `stream_batch_size`.
+        """
+        with self._stream_lock:
+            self._stream_flushed = time.monotonic()
+            if not self._stream_buffer:
+                return
+            token = ''.join(self._stream_buffer)
+            replace = self._stream_replace
+            self._stream_buffer.clear()
+            self._stream_replace = False
+            self._stream_count = 0
         stream_to(obj=self.object, token=token, replace=replace, object_panel=self)
 
     def update(
@@ -715,6 +789,12 @@ class ChatMessage(Pane):
             updates = t.cast("MessageParams", value.param.values())
         else:
             updates["object"] = value
+        if "object" in updates:
+            # Discard buffered tokens, which were streamed to the old object
+            with self._stream_lock:
+                self._stream_buffer.clear()
+                self._stream_replace = False
+                self._stream_count = 0
         self.param.update(**updates)
 
     def select(
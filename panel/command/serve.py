@@ -4,6 +4,7 @@ ways.
 """
 from __future__ import annotations
 
+import argparse
 import ast
 import base64
 import contextlib
@@ -11,6 +12,8 @@ import importlib
 import logging
 import os
 import pathlib
+import signal
+import ssl
 import sys
 import typing as t
 
@@ -44,7 +47,6 @@ from ..io.state import state
 from ..util import edit_readonly, fullpath
 
 if t.TYPE_CHECKING:
-    import argparse
 
     from collections.abc import Iterator
 
@@ -109,6 +111,9 @@ class AdminApplicationContext(ApplicationContext):
 
 class Serve(_BkServe):
 
+    # Index of the worker and port of the router to report load to
+    _router_worker: tuple[int, int] | None = None
+
     args = (
         tuple((arg, arg_obj) for arg, arg_obj in _BkServe.args if arg != '--dev') + (
         ('--index-titles', Argument(
@@ -314,6 +319,18 @@ class Serve(_BkServe):
             const   = True,
             nargs   = "?"
         )),
+        ('--session-pool-size', Argument(
+            action  = 'store',
+            type    = int,
+            help    = "Maximum number of pre-initialized sessions to keep ready for each application.",
+            default = 0,
+        )),
+        ('--sticky-sessions', Argument(
+            action  = 'store_true',
+            help    = ("Run a front process which routes HTTP and websocket "
+                       "traffic by session id to --num-procs worker processes, "
+                       "placing new sessions on the least loaded worker."),
+        )),
         ('--global-loading-spinner', Argument(
             action  = 'store_true',
             help    = "Whether to add a global loading spinner to the application(s).",
@@ -421,6 +438,7 @@ class Serve(_BkServe):
 
         config.global_loading_spinner = args.global_loading_spinner
         config.reuse_sessions = args.reuse_sessions
+        config.session_pool_size = args.session_pool_size
 
         if args.root_path:
             root_path = args.root_path
@@ -768,6 +786,100 @@ class Serve(_BkServe):
 
         return kwargs
 
+    def customize_server(self, server):
+        if self._router_worker is not None:
+            from ..io.router import LoadReporter
+            LoadReporter(server, *self._router_worker).start()
+        return super().customize_server(server)
+
+    def _run_router(self, args: argparse.Namespace) -> None:
+        """
+        Runs a front process which spawns --num-procs worker processes
+        serving the applications and routes each session to the worker
+        which created it.
+        """
+        import multiprocessing
+
+        from tornado.httpserver import HTTPServer
+        from tornado.ioloop import IOLoop
+        from tornado.netutil import bind_sockets
+
+        from ..io.logging import panel_log_handler
+        from ..io.router import SessionRouter
+
+        panel_log_handler.setLevel(settings.py_log_level(args.log_level) or logging.INFO)
+
+        sockets = bind_sockets(args.port, args.address)
+        port = sockets[0].getsockname()[1]
+        io_loop = IOLoop.current()
+        router = SessionRouter()
+        report_port = router.listen(io_loop)
+
+        # Workers only listen locally and trust the headers set by the router
+        worker_args = argparse.Namespace(**{k: v for k, v in vars(args).items() if k != 'invoke'})
+        worker_args.num_procs = 1
+        worker_args.port = 0
+        worker_args.address = '127.0.0.1'
+        worker_args.show = False
+        worker_args.sticky_sessions = False
+        worker_args.ssl_certfile = worker_args.ssl_keyfile = None
+        worker_args.use_xheaders = True
+        worker_args.allow_websocket_origin = args.allow_websocket_origin or [f'localhost:{port}']
+
+        context = multiprocessing.get_context('spawn')
+        num_procs = args.num_procs or os.cpu_count() or 1
+        processes = {}
+        for index in range(num_procs):
+            proc = context.Process(target=_serve_worker, args=(worker_args, index, report_port))
+            proc.start()
+            processes[index] = proc
+
+        def check_workers():
+            for index, proc in list(processes.items()):
+                if not proc.is_alive():
+                    log.error(
+                        "Worker %d (pid %s) exited with code %s.",
+                        index, proc.pid, proc.exitcode
+                    )
+                    router.remove(index)
+                    del processes[index]
+            if not processes:
+                io_loop.stop()
+
+        ssl_options = None
+        certfile = settings.ssl_certfile(getattr(args, 'ssl_certfile', None))
+        if certfile:
+            ssl_options = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            ssl_options.load_cert_chain(
+                certfile, settings.ssl_keyfile(getattr(args, 'ssl_keyfile', None)),
+                password=settings.ssl_password()
+            )
+        app = router.application(websocket_max_message_size=args.websocket_max_message_size)
+        server = HTTPServer(app, xheaders=args.use_xheaders, ssl_options=ssl_options)
+        server.add_sockets(sockets)
+        protocol = 'https' if ssl_options else 'http'
+        log.info(
+            f"Panel router running at: {protocol}://{args.address or 'localhost'}:{port}/ "
+            f"with {num_procs} worker processes"
+        )
+
+        PeriodicCallback(check_workers, 1000).start()
+        # Ensure workers are shut down when the router is terminated
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            io_loop.start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            server.stop()
+            router.close()
+            for proc in processes.values():
+                proc.terminate()
+            for proc in processes.values():
+                proc.join(5)
+
     def invoke(self, args: argparse.Namespace):
         # Autoreload must be enabled before the application(s) are executed
         # to avoid erroring out
@@ -781,4 +893,26 @@ class Serve(_BkServe):
         if "DASK_DISTRIBUTED__LOGGING__BOKEH" not in os.environ:
             os.environ["DASK_DISTRIBUTED__LOGGING__BOKEH"] = "info"
         args.dev = None
+        if args.sticky_sessions:
+            if args.num_procs == 1:
+                raise ValueError(
+                    "--sticky-sessions routes sessions to multiple worker "
+                    "processes, ensure you also supply --num-procs."
+                )
+            elif config.autoreload:
+                raise ValueError(
+                    "--sticky-sessions cannot be combined with --autoreload "
+                    "or --dev, since autoreload requires a single process."
+                )
+            self._run_router(args)
+            return
         super().invoke(args)
+
+
+def _serve_worker(args: argparse.Namespace, index: int, report_port: int) -> None:
+    """
+    Entry point of a worker process spawned by a `--sticky-sessions` router.
+    """
+    serve = Serve(parser=argparse.ArgumentParser())
+    serve._router_worker = (index, report_port)
+    serve.invoke(args)
@@ -18,6 +18,7 @@ import requests
 
 from bokeh.model import Model
 
+from . import _load_lazy
 from .config import config, panel_extension
 from .io.resources import RESOURCE_URLS
 from .models.tabulator import TABULATOR_VERSION
@@ -362,6 +363,8 @@ def patch_tabulator():
     path.write_text(text)
 
 def bundle_resources(verbose=False, external=True):
+    # Ensure all components and their models are registered
+    _load_lazy()
     download_list = []
     bundle_resource_urls(verbose=verbose, external=external, download_list=download_list)
     bundle_models(verbose=verbose, external=external, download_list=download_list)
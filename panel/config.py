@@ -138,6 +138,25 @@ class _config(_base_config):
     cache_path = param.Path(default="./cache", check_exists=False, doc="""
         Path the cache decorator will write to if diskcache is enabled.""")
 
+    cache_max_bytes = param.Integer(default=None, bounds=(0, None), doc="""
+        The maximum number of bytes all in-memory caches created by the
+        cache decorator may use in a process. When exceeded the least
+        recently used entries chosen by the policy of each cache are
+        evicted.""")
+
+    cache_store = param.Selector(default='memory', objects=['memory', 'disk', 'shared'], doc="""
+        The default store used by the cache decorator and
+        pn.state.as_cached. The 'memory' store is local to each
+        process, the 'disk' store uses diskcache and the 'shared'
+        store shares entries between all processes on a host, e.g.
+        when launching multiple processes with --num-procs.""")
+
+    content_url_threshold = param.Integer(default=None, bounds=(0, None), allow_None=True, doc="""
+        Size in bytes above which the content of image, PDF, audio and
+        video panes rendered in a server session is served from a
+        content-addressed URL instead of being embedded in the model
+        as base64. If None the content is always embedded.""")
+
     defer_load = param.Boolean(default=False, doc="""
         Whether to defer load of rendered functions.""")
 
@@ -215,6 +234,18 @@ class _config(_base_config):
         session_key_func is given a tornado.httputil.HTTPServerRequest
         and should return a key that uniquely captures a session.""")
 
+    session_pool_size = param.Integer(default=0, bounds=(0, None), doc="""
+        Maximum number of pre-initialized sessions to keep ready for each
+        route (and session_key_func key). Incoming requests are handed a
+        pooled session instead of running the application on request,
+        and the pool is refilled in the background up to a size based on
+        the observed arrival rate. As with reuse_sessions this is only
+        appropriate if the initial state of the application does not
+        depend on the request. Pooled sessions are initialized from an
+        anonymous request, pooling is therefore disabled if authentication
+        is enabled or headers or cookies are explicitly included and
+        requests with query arguments are served a new session.""")
+
     safe_embed = param.Boolean(default=False, doc="""
         Ensure all bokeh property changes trigger events which are
         embedded. Useful when only partial updates are made in an
@@ -245,9 +276,22 @@ class _config(_base_config):
     template: str = param.Selector(default=None, doc="""
         The default template to render served applications into.""")  # type: ignore[assignment, ty:invalid-assignment]
 
+    threaded_refs = param.Boolean(default=False, doc="""
+        Whether synchronous functions and references bound with
+        pn.bind or param.depends are evaluated on a thread instead of
+        blocking the event loop. Evaluations superseded by newer
+        inputs are discarded.""")
+
     throttled = param.Boolean(default=False, doc="""
         If sliders and inputs should be throttled until release of mouse.""")
 
+    websocket_queue_limit = param.Integer(default=100*1024*1024, bounds=(0, None), allow_None=True, doc="""
+        Maximum number of bytes of messages that may be queued for a
+        websocket connection which cannot keep up with the updates
+        sent by the server. Queued updates to the same property are
+        coalesced and if the queued messages still exceed the limit
+        the connection is closed. If None or 0 the queue is unbounded.""")
+
     _admin = param.Boolean(default=False, doc="Whether the admin panel is enabled.")
 
     _admin_endpoint = param.String(default=None, doc="Name to use for the admin endpoint.")
@@ -796,8 +840,12 @@ class panel_extension(_pyviz_extension):
         from bokeh.model import Model
         from bokeh.settings import settings as bk_settings
 
+        from . import _load_lazy
         from .reactive import ReactiveHTML, ReactiveHTMLMetaclass
 
+        # Ensure all lazily imported components are registered
+        _load_lazy()
+
         _in_ipython = hasattr(builtins, '__IPYTHON__')
         reactive_exts = {
             v._extension_name: v for v in _descendents(ReactiveHTML, concrete=True)
@@ -77,6 +77,8 @@ class interactive(Pane):
 
     _pane = param.ClassSelector(class_=Viewable)
 
+    _applies_by_type: t.ClassVar[bool] = True
+
     _rename: t.ClassVar[Mapping[str, str | None]] = {'_pane': None}
 
     def __init__(self, object, params={}, **kwargs):
@@ -431,6 +431,34 @@ def get_overview(doc=None):
         return layout
 
 
+CACHE_COLUMNS = ['key', 'kwargs', 'hits', 'waits', 'misses', 'time', 'total_time', 'size']
+
+def get_cache_data():
+    stats = state.cache_stats
+    for stat in stats:
+        stat['kwargs'] = ', '.join(f'{k}={v!r}' for k, v in stat['kwargs'].items())
+    return pd.DataFrame(stats, columns=CACHE_COLUMNS)
+
+def cache_component():
+    table = Tabulator(
+        get_cache_data(), disabled=True, show_index=False, theme='midnight',
+        layout='fit_data_stretch', sizing_mode='stretch_width',
+        titles={
+            'time': 'Last Computation (s)', 'total_time': 'Total Computation (s)',
+            'size': 'Size (bytes)'
+        },
+        formatters={'time': {'type': 'money', 'precision': 3},
+                    'total_time': {'type': 'money', 'precision': 3}},
+        sorters=[{'field': 'total_time', 'dir': 'desc'}]
+    )
+    def update_cache_stats():
+        table.value = get_cache_data()
+    stats_cb = state.add_periodic_callback(update_cache_stats, period=2000, start=False)
+    stats_cb.log = False
+    stats_cb.start()
+    return table
+
+
 def log_component():
     # Without this tabulator is empty after reload of website
     log_terminal.param.trigger("value")
@@ -471,6 +499,7 @@ def admin_template(doc):
     tabs = Tabs(
         ('Overview', get_overview(doc)),
         ('Timeline', get_timeline(doc)),
+        ('Cache', cache_component()),
         margin=0,
         sizing_mode='stretch_both'
     )
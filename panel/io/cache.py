@@ -3,21 +3,31 @@ Implements memoization for functions with arbitrary arguments
 """
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import functools
 import hashlib
 import inspect
 import io
+import mmap
 import os
 import pathlib
 import pickle
+import shutil
+import stat
+import struct
 import sys
+import tempfile
 import threading
 import time
 import typing as t
 import unittest.mock
+import weakref
 
+from collections import OrderedDict
+from concurrent.futures import Future
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 import param
 
@@ -31,7 +41,9 @@ from .state import state
 #---------------------------------------------------------------------
 
 if t.TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Hashable
+    from collections.abc import (
+        Awaitable, Callable, Hashable, Iterator,
+    )
     _P = t.ParamSpec("_P")
     _R = t.TypeVar("_R")
     _CallableT = t.TypeVar("_CallableT", bound=Callable)
@@ -40,6 +52,9 @@ if t.TYPE_CHECKING:
         def clear(self, func_hashes: list[str | None]=[None]) -> None:
             pass
 
+        def stats(self) -> dict[str, int]:
+            pass
+
         __call__: _CallableT
 
 _CYCLE_PLACEHOLDER = b"panel-93KZ39Q-floatingdangeroushomechose-CYCLE"
@@ -50,6 +65,8 @@ _HASH_MAP: dict[Hashable, str] = {}
 
 _INDETERMINATE = type('INDETERMINATE', (object,), {})()
 
+_MISSING = type('MISSING', (object,), {})()
+
 _NATIVE_TYPES = (
     bytes, str, float, int, bool, bytearray, type(None)
 )
@@ -62,6 +79,12 @@ _DATAFRAME_ROWS_LARGE = 100_000
 
 _DATAFRAME_SAMPLE_SIZE = 100_000
 
+# Hashes of large objects reused by the 'identity' hash mode
+_IDENTITY_HASHES: dict[int, tuple[weakref.ReferenceType, Hashable, bytes]] = {}
+
+# One of 'sample', 'identity' or 'full'
+_HASH_MODE: ContextVar[str] = ContextVar('hash_mode', default='sample')
+
 if sys.platform == 'win32':
     _TIME_FN = time.perf_counter
 else:
@@ -115,24 +138,60 @@ def _partial_hash(obj: t.Any) -> bytes:
     h.update(_generate_hash(obj.keywords))
     return h.digest()
 
+def _sample_positions(length: int, size: int):
+    """
+    Returns evenly spaced positions to sample from an object of the
+    given length, which unlike random sampling does not scale with the
+    size of the object.
+    """
+    import numpy as np
+    return np.linspace(0, length-1, size).astype('int64')
+
+def _identity_hash(obj: t.Any, hash_func: Callable[[t.Any], bytes], version: Hashable) -> bytes:
+    """
+    Reuses the hash computed for the same object as long as its version
+    fingerprint is unchanged. Entries are discarded when the object
+    is freed, ensuring the id of the object is not reused.
+    """
+    key = id(obj)
+    entry = _IDENTITY_HASHES.get(key)
+    if entry is not None and entry[0]() is obj and entry[1] == version:
+        return entry[2]
+    hash_value = hash_func(obj)
+    try:
+        ref = weakref.ref(obj, lambda _, key=key: _IDENTITY_HASHES.pop(key, None))
+    except TypeError:
+        return hash_value
+    _IDENTITY_HASHES[key] = (ref, version, hash_value)
+    return hash_value
+
 def _pandas_hash(obj: t.Any) -> bytes:
     import pandas as pd
 
     if not isinstance(obj, (pd.Series, pd.DataFrame)):
         obj = pd.Series(obj)
 
-    if len(obj) >= _DATAFRAME_ROWS_LARGE:
-        obj = obj.sample(n=_DATAFRAME_SAMPLE_SIZE, random_state=0)
+    if _HASH_MODE.get() == 'identity':
+        dtypes = tuple(map(str, obj.dtypes)) if isinstance(obj, pd.DataFrame) else str(obj.dtype)
+        return _identity_hash(obj, _pandas_content_hash, (obj.shape, dtypes))
+    return _pandas_content_hash(obj)
+
+def _pandas_content_hash(obj: t.Any) -> bytes:
+    import pandas as pd
+
+    length = b"%d" % len(obj)
+    if _HASH_MODE.get() != 'full' and len(obj) >= _DATAFRAME_ROWS_LARGE:
+        obj = obj.iloc[_sample_positions(len(obj), _DATAFRAME_SAMPLE_SIZE)]
     try:
         if isinstance(obj, pd.DataFrame):
-            return ((b"%s" % pd.util.hash_pandas_object(obj).sum())
+            return (length + (b"%s" % pd.util.hash_pandas_object(obj).sum())
                 + (b"%s" % pd.util.hash_pandas_object(obj.columns).sum())
             )
-        return b"%s" % pd.util.hash_pandas_object(obj).sum()
+        return length + b"%s" % pd.util.hash_pandas_object(obj).sum()
     except TypeError:
         # Use pickle if pandas cannot hash the object for example if
         # it contains unhashable objects.
-        return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        return length + b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
 
 def _polars_combine_hash_expr(columns):
     """
@@ -157,6 +216,17 @@ def _polars_combine_hash_expr(columns):
     return out + final_addition
 
 def _polars_hash(obj):
+    if _HASH_MODE.get() == 'identity':
+        if type(obj).__name__ == 'LazyFrame':
+            version = None
+        elif hasattr(obj, 'dtypes'):
+            version = (obj.shape, tuple(map(str, obj.dtypes)))
+        else:
+            version = (obj.shape, str(obj.dtype))
+        return _identity_hash(obj, _polars_content_hash, version)
+    return _polars_content_hash(obj)
+
+def _polars_content_hash(obj):
     import polars as pl
 
     hash_type = type(obj).__name__.encode()
@@ -166,14 +236,17 @@ def _polars_hash(obj):
 
     columns = obj.collect_schema().names()
     hash_columns = _container_hash(columns)
+    sample = _HASH_MODE.get() != 'full'
 
-    # LazyFrame does not support len and sample
-    if hash_type != b"LazyFrame" and len(obj) >= _DATAFRAME_ROWS_LARGE:
-        obj = obj.sample(n=_DATAFRAME_SAMPLE_SIZE, seed=0)
-    elif hash_type == b"LazyFrame":
-        count = obj.select(pl.col(columns[0]).count()).collect().item()
-        if count >= _DATAFRAME_ROWS_LARGE:
-            obj = obj.select(pl.all().sample(n=_DATAFRAME_SAMPLE_SIZE, seed=0))
+    # LazyFrame does not support len and positional indexing
+    if hash_type != b"LazyFrame":
+        count = len(obj)
+        if sample and count >= _DATAFRAME_ROWS_LARGE:
+            obj = obj[_sample_positions(count, _DATAFRAME_SAMPLE_SIZE)]
+    else:
+        count = obj.select(pl.len()).collect().item()
+        if sample and count >= _DATAFRAME_ROWS_LARGE:
+            obj = obj.gather_every(count // _DATAFRAME_SAMPLE_SIZE)
 
     hash_expr = _polars_combine_hash_expr(columns)
     hash_data = obj.select(hash_expr).sum()
@@ -181,15 +254,19 @@ def _polars_hash(obj):
         hash_data = hash_data.collect()
     hash_data = _int_to_bytes(hash_data.item())
 
-    return hash_type + hash_data + hash_columns
+    return hash_type + _int_to_bytes(count) + hash_data + hash_columns
 
 def _numpy_hash(obj):
+    if _HASH_MODE.get() == 'identity':
+        version = (obj.shape, obj.strides, obj.dtype.str, obj.__array_interface__['data'][0])
+        return _identity_hash(obj, _numpy_content_hash, version)
+    return _numpy_content_hash(obj)
+
+def _numpy_content_hash(obj):
     h = hashlib.new("md5")
     h.update(_generate_hash(obj.shape))
-    if obj.size >= _ARRAY_SIZE_LARGE:
-        import numpy as np
-        state = np.random.RandomState(0)
-        obj = state.choice(obj.flat, size=_ARRAY_SAMPLE_SIZE)
+    if _HASH_MODE.get() != 'full' and obj.size >= _ARRAY_SIZE_LARGE:
+        obj = obj.flat[_sample_positions(obj.size, _ARRAY_SAMPLE_SIZE)]
     h.update(obj.tobytes())
     return h.digest()
 
@@ -243,19 +320,46 @@ _hash_funcs: dict[str | type[t.Any] | tuple[type, ...] | Callable[[t.Any], bool]
 for name in _FFI_TYPE_NAMES:
     _hash_funcs[name] = b'0'
 
+# Hash functions resolved for each type, cleared when _hash_funcs change.
+# Each entry holds the predicates which have to be evaluated for every
+# object and the hash function resolved from the type and name keys.
+_HASH_FUNC_CACHE: dict[type, tuple[tuple[tuple[t.Any, t.Any], ...], t.Any]] = {}
+
+# Types which cannot contain references and therefore cannot be cyclic
+_ACYCLIC_TYPES = (bytes, str, float, int, bool, type(None))
+
 def _find_hash_func(obj):
+    obj_type = type(obj)
+    resolved = _HASH_FUNC_CACHE.get(obj_type)
+    if resolved is None:
+        resolved = _HASH_FUNC_CACHE[obj_type] = _resolve_hash_func(obj)
+    predicates, hash_func = resolved
+    for predicate, predicate_func in predicates:
+        if predicate(obj):
+            return predicate_func
+    return hash_func
+
+def _resolve_hash_func(obj):
+    """
+    Resolves the hash function for the type of the object. Since
+    predicate keys may depend on the value of the object, only the
+    hash function resolved from the type and name keys is returned
+    along with the predicates preceding it, which have to be
+    evaluated for every object.
+    """
     fqn_type = _get_fqn(obj)
     if fqn_type in _hash_funcs:
-        return _hash_funcs[fqn_type]
+        return (), _hash_funcs[fqn_type]
+    predicates = []
     for otype, hash_func in _hash_funcs.items():
         if isinstance(otype, str):
             if otype == fqn_type:
-                return hash_func
+                return tuple(predicates), hash_func
         elif inspect.isfunction(otype):
-            if otype(obj):
-                return hash_func
+            predicates.append((otype, hash_func))
         elif isinstance(obj, otype):
-            return hash_func
+            return tuple(predicates), hash_func
+    return tuple(predicates), None
 
 def _generate_hash_inner(obj):
     hash_func = _find_hash_func(obj)
@@ -280,6 +384,8 @@ def _generate_hash_inner(obj):
     return _int_to_bytes(id(obj))
 
 def _generate_hash(obj):
+    if type(obj) in _ACYCLIC_TYPES:
+        return _generate_hash_inner(obj)
     # Break recursive cycles.
     hash_stack = state._current_stack
     if obj in hash_stack:
@@ -309,44 +415,173 @@ def _key(obj):
         return id(obj)
     return _INDETERMINATE
 
-def _cleanup_cache(cache, policy, max_items, time):
+def _pandas_sizeof(obj: t.Any) -> int:
+    usage = obj.memory_usage(deep=True)
+    return int(usage.sum() if hasattr(usage, 'sum') else usage)
+
+_size_funcs: dict[str, Callable[[t.Any], int]] = {
+    'numpy.ndarray'              : lambda obj: obj.nbytes,
+    'pandas.DataFrame'           : _pandas_sizeof,
+    'pandas.Series'              : _pandas_sizeof,
+    'pandas.Index'               : _pandas_sizeof,
+    'pandas.core.frame.DataFrame': _pandas_sizeof,
+    'pandas.core.series.Series'  : _pandas_sizeof,
+    'pandas.core.indexes.base.Index': _pandas_sizeof,
+    'polars.dataframe.frame.DataFrame': lambda obj: obj.estimated_size(),
+    'polars.series.series.Series': lambda obj: obj.estimated_size(),
+}
+
+def _sizeof(obj: t.Any, seen: set[int] | None = None) -> int:
     """
-    Deletes items in the cache if the exceed the number of items or
-    their TTL (time-to-live) has expired.
+    Estimates the memory used by an object in bytes, accounting for
+    the data held by arrays and DataFrames and recursing into
+    containers.
     """
-    while len(cache) >= max_items:
-        if policy.lower() == 'fifo':
-            key = list(cache.keys())[0]
-        elif policy.lower() == 'lru':
-            key = sorted(((k, time-t) for k, (_, _, _, t) in cache.items()),
-                         key=lambda o: o[1])[-1][0]
-        elif policy.lower() == 'lfu':
-            key = sorted(cache.items(), key=lambda o: o[1][2])[0][0]
-        del cache[key]
-
-def _cleanup_ttl(cache, ttl, time):
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    fqn_type = _get_fqn(obj)
+    if fqn_type in _size_funcs:
+        try:
+            return int(_size_funcs[fqn_type](obj))
+        except Exception:
+            pass
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_sizeof(k, seen) + _sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(v, seen) for v in obj)
+    return size
+
+def _cleanup_memory(max_bytes: int, keep_store: MemoryStore, keep_key: str) -> None:
     """
-    Deletes items in the cache if their TTL (time-to-live) has expired.
+    Evicts entries from all memory stores in the process until their
+    total size fits within max_bytes. The entry to evict is chosen by
+    the policy of each store, evicting the least recently accessed of
+    the candidates first.
     """
-    for key, (_, ts, _, _) in list(cache.items()):
-        if (time-ts) > ttl:
-            del cache[key]
+    stores = [
+        store for store in state._memoize_cache.values()
+        if isinstance(store, MemoryStore)
+    ]
+    # The lock of each store is acquired in turn (never nested) since
+    # the stores may be updated concurrently by other threads
+    while sum(store.nbytes for store in stores) > max_bytes:
+        candidates = []
+        for store in stores:
+            with store._lock:
+                key = store._evict_key(store.policy, 0)
+                if key is None or (store is keep_store and key == keep_key):
+                    continue
+                candidates.append((store._entries[key][3], store, key))
+        if not candidates:
+            break
+        _, store, key = min(candidates, key=lambda c: c[0])
+        with store._lock:
+            try:
+                del store[key]
+            except KeyError:
+                pass
+
+if sys.platform == 'win32':
+    import msvcrt
+
+    def _lock_file(fd: int, blocking: bool) -> bool:
+        mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+        while True:
+            try:
+                msvcrt.locking(fd, mode, 1)
+            except OSError:
+                if blocking:
+                    # LK_LOCK gives up after 10 attempts, keep trying
+                    continue
+                return False
+            return True
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(fd: int, blocking: bool) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+def _shared_cache_dir() -> str:
+    """
+    Returns the default directory of the SharedStore, preferring the
+    shared memory filesystem where available. The directory is
+    specific to the current user since entries are unpickled.
+    """
+    if sys.platform == 'win32':
+        # The temporary directory is already specific to the user
+        return os.path.join(tempfile.gettempdir(), 'panel-cache')
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        root = shm
+    else:
+        root = tempfile.gettempdir()
+    return os.path.join(root, f'panel-cache-{os.getuid()}')
+
+def _private_dir(path: str) -> str:
+    """
+    Creates a directory only accessible to the current user and
+    ensures an existing directory is owned by the current user and
+    cannot be written to by other users.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if sys.platform == 'win32':
+        return path
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(
+            f"SharedStore path {path!r} is not a directory."
+        )
+    elif st.st_uid != os.getuid():
+        raise PermissionError(
+            f"SharedStore directory {path!r} is not owned by the current "
+            "user, refusing to load cached entries from it."
+        )
+    elif st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(
+            f"SharedStore directory {path!r} is writable by other users, "
+            "refusing to load cached entries from it."
+        )
+    return path
 
 @contextmanager
-def _override_hash_funcs(hash_funcs):
+def _override_hash_funcs(hash_funcs, hash_mode='sample'):
+    token = _HASH_MODE.set(hash_mode)
+    if not hash_funcs:
+        try:
+            yield
+        finally:
+            _HASH_MODE.reset(token)
+        return
     backup = dict(_hash_funcs)
     _hash_funcs.update(hash_funcs)
+    _HASH_FUNC_CACHE.clear()
     try:
         yield
     finally:
         _hash_funcs.clear()
         _hash_funcs.update(backup)
+        _HASH_FUNC_CACHE.clear()
+        _HASH_MODE.reset(token)
 
 #---------------------------------------------------------------------
 # Public API
 #---------------------------------------------------------------------
 
-def compute_hash(func, hash_funcs, args, kwargs):
+def compute_hash(func, hash_funcs, args, kwargs, hash_mode='sample'):
     """
     Computes a hash given a function and its arguments.
 
@@ -360,12 +595,18 @@ def compute_hash(func, hash_funcs, args, kwargs):
         Arguments to hash
     kwargs: dict
         Keyword arguments to hash
+    hash_mode: str
+        How large arrays and DataFrames are hashed, one of:
+          - sample: Hashes a fixed size sample of evenly spaced rows
+          - identity: Hashes a sample once and reuses the hash while
+            the same object with the same shape and dtypes is passed
+          - full: Hashes the full contents
     """
-    key = (func, _key(args), _key(kwargs))
+    key = (func, _key(args), _key(kwargs), hash_mode)
     if _INDETERMINATE not in key and key in _HASH_MAP:
         return _HASH_MAP[key]
     hasher = hashlib.new("md5")
-    with _override_hash_funcs(hash_funcs):
+    with _override_hash_funcs(hash_funcs, hash_mode):
         if args:
             hasher.update(_generate_hash(args))
         if kwargs:
@@ -375,16 +616,582 @@ def compute_hash(func, hash_funcs, args, kwargs):
         _HASH_MAP[key] = hash_value
     return hash_value
 
+class CacheStore:
+    """
+    Base class for the stores holding the memoized return values of a
+    cached function (or of `pn.state.as_cached`).
+
+    Each entry is stored under the hash of the arguments alongside the
+    time it was created, the number of hits and the time it was last
+    accessed, which are used to implement the TTL and the FIFO, LRU and
+    LFU eviction policies. If max_bytes is set, entries are evicted
+    according to the policy until the total size of the store fits.
+
+    Subclasses have to implement the basic mapping operations on
+    entries, i.e. `__contains__`, `__len__`, `__delitem__`, `keys`,
+    `hit`, `put`, `clear` and `metadata`, and may override `acquire`
+    and `release` to lock the computation of an entry across threads
+    or processes.
+    """
+
+    def __init__(
+        self, namespace: str, path: str | os.PathLike | None = None,
+        max_bytes: int | None = None, policy: str = 'LRU'
+    ):
+        self.namespace = namespace
+        self.path = path
+        self.max_bytes = max_bytes
+        self.policy = policy
+        # Guards the entries (and bookkeeping) of the store
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __delitem__(self, key: str) -> None:
+        raise NotImplementedError
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The total size of all entries in bytes.
+        """
+        raise NotImplementedError
+
+    def keys(self) -> list[str]:
+        raise NotImplementedError
+
+    def metadata(self) -> Iterator[tuple[str, float, int, float]]:
+        """
+        Iterates over the (key, created, hits, accessed) metadata of
+        all entries without loading their values.
+        """
+        raise NotImplementedError
+
+    def hit(self, key: str, time: float) -> t.Any:
+        """
+        Returns the value of an entry and records the access, raising
+        a KeyError if the entry does not exist.
+        """
+        raise NotImplementedError
+
+    def put(self, key: str, value: t.Any, time: float) -> None:
+        """
+        Stores a new entry.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Deletes all entries.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the store.
+        """
+
+    def acquire(self, key: str, blocking: bool = True) -> bool:
+        """
+        Acquires the lock guarding the computation of an entry.
+        """
+        return True
+
+    def release(self, key: str) -> None:
+        """
+        Releases the lock guarding the computation of an entry.
+        """
+
+    @contextmanager
+    def lock(self, key: str):
+        self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+    def cleanup(self, policy: str, max_items: int, time: float) -> None:
+        """
+        Deletes entries while the number of items in the store exceeds
+        max_items, choosing the entries according to the policy.
+        """
+        with self._lock:
+            while len(self) >= max_items:
+                key = self._evict_key(policy, time)
+                if key is None:
+                    break
+                try:
+                    del self[key]
+                except KeyError:
+                    pass
+
+    def cleanup_bytes(self, max_bytes: int, time: float, keep: str | None = None) -> None:
+        """
+        Deletes entries according to the policy until the total size
+        of the store fits within max_bytes, never deleting the entry
+        with the key to keep.
+        """
+        with self._lock:
+            while self.nbytes > max_bytes:
+                key = self._evict_key(self.policy, time)
+                if key is not None and key == keep:
+                    key = next((k for k in self.keys() if k != keep), None)
+                if key is None:
+                    break
+                try:
+                    del self[key]
+                except KeyError:
+                    pass
+
+    def cleanup_ttl(self, ttl: float, time: float) -> None:
+        """
+        Deletes entries whose TTL (time-to-live) has expired.
+        """
+        for key, created, _, _ in list(self.metadata()):
+            if (time-created) > ttl:
+                try:
+                    del self[key]
+                except KeyError:
+                    pass
+
+    def _evict_key(self, policy: str, time: float) -> str | None:
+        metadata = list(self.metadata())
+        if not metadata:
+            return None
+        policy = policy.lower()
+        if policy == 'fifo':
+            return min(metadata, key=lambda m: m[1])[0]
+        elif policy == 'lru':
+            return sorted(((m[0], time-m[3]) for m in metadata), key=lambda o: o[1])[-1][0]
+        return min(metadata, key=lambda m: m[2])[0]
+
+
+class _EntryStore(CacheStore):
+    """
+    Stores entries as (value, created, hits, accessed) tuples in a
+    mapping.
+    """
+
+    def __init__(
+        self, namespace: str, path: str | os.PathLike | None = None,
+        max_bytes: int | None = None, policy: str = 'LRU'
+    ):
+        super().__init__(namespace, path, max_bytes, policy)
+        self._entries: t.Any = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+
+    def keys(self) -> list[str]:
+        return list(self._entries.keys())
+
+    def metadata(self) -> Iterator[tuple[str, float, int, float]]:
+        for key, (_, created, hits, accessed) in list(self._entries.items()):
+            yield key, created, hits, accessed
+
+    def hit(self, key: str, time: float) -> t.Any:
+        ret, created, hits, _ = self._entries[key]
+        self._entries[key] = (ret, created, hits+1, time)
+        return ret
+
+    def put(self, key: str, value: t.Any, time: float) -> None:
+        self._entries[key] = (value, time, 0, time)
+        if self.max_bytes is not None:
+            self.cleanup_bytes(self.max_bytes, time, keep=key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class MemoryStore(_EntryStore):
+    """
+    Stores entries in a dictionary local to the current process.
+
+    The order of insertion, the recency of access and the hit counts
+    are tracked incrementally, so the entry to evict is found in
+    constant time for all policies. The size of entries is measured
+    when a byte budget is set on the store or via config.cache_max_bytes,
+    which bounds the memory used by all memory stores in the process.
+    """
+
+    def __init__(
+        self, namespace: str, path: str | os.PathLike | None = None,
+        max_bytes: int | None = None, policy: str = 'LRU'
+    ):
+        super().__init__(namespace, path, max_bytes, policy)
+        self._recency: OrderedDict[str, None] = OrderedDict()
+        self._frequencies: dict[int, dict[str, None]] = {}
+        self._min_hits: int | None = None
+        self._sizes: dict[str, int] = {}
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            _, _, hits, _ = self._entries.pop(key)
+            del self._recency[key]
+            self._remove_frequency(key, hits)
+            if hits == self._min_hits and hits not in self._frequencies:
+                self._min_hits = None
+            self._nbytes -= self._sizes.pop(key, 0)
+
+    def _remove_frequency(self, key: str, hits: int) -> None:
+        bucket = self._frequencies[hits]
+        del bucket[key]
+        if not bucket:
+            del self._frequencies[hits]
+
+    def hit(self, key: str, time: float) -> t.Any:
+        with self._lock:
+            ret = super().hit(key, time)
+            hits = self._entries[key][2]
+            self._recency.move_to_end(key)
+            self._remove_frequency(key, hits-1)
+            self._frequencies.setdefault(hits, {})[key] = None
+            if self._min_hits == hits-1 and hits-1 not in self._frequencies:
+                self._min_hits = hits
+            return ret
+
+    def put(self, key: str, value: t.Any, time: float) -> None:
+        measure = self.max_bytes is not None or config.cache_max_bytes is not None
+        size = _sizeof(value) if measure else 0
+        with self._lock:
+            if key in self._entries:
+                del self[key]
+            self._entries[key] = (value, time, 0, time)
+            self._recency[key] = None
+            self._frequencies.setdefault(0, {})[key] = None
+            self._min_hits = 0
+            if not measure:
+                return
+            self._sizes[key] = size
+            self._nbytes += size
+            if self.max_bytes is not None:
+                self.cleanup_bytes(self.max_bytes, time, keep=key)
+        # Evict from all stores without holding the lock of this store
+        # since _cleanup_memory acquires the lock of each store in turn
+        if config.cache_max_bytes is not None:
+            _cleanup_memory(config.cache_max_bytes, self, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+            self._recency.clear()
+            self._frequencies.clear()
+            self._min_hits = None
+            self._sizes.clear()
+            self._nbytes = 0
+
+    def cleanup_ttl(self, ttl: float, time: float) -> None:
+        # Entries are ordered by creation so we can stop at the
+        # first entry which has not expired
+        with self._lock:
+            while self._entries:
+                key = next(iter(self._entries))
+                if (time-self._entries[key][1]) <= ttl:
+                    break
+                del self[key]
+
+    def _evict_key(self, policy: str, time: float) -> str | None:
+        with self._lock:
+            if not self._entries:
+                return None
+            policy = policy.lower()
+            if policy == 'fifo':
+                return next(iter(self._entries))
+            elif policy == 'lru':
+                return next(iter(self._recency))
+            if self._min_hits is None:
+                self._min_hits = min(self._frequencies)
+            return next(iter(self._frequencies[self._min_hits]))
+
+
+class DiskStore(_EntryStore):
+    """
+    Stores entries on disk using a diskcache Index.
+    """
+
+    def __init__(
+        self, namespace: str, path: str | os.PathLike | None = None,
+        max_bytes: int | None = None, policy: str = 'LRU'
+    ):
+        from diskcache import Index
+
+        super().__init__(namespace, path, max_bytes, policy)
+        self.directory = os.path.join(path or config.cache_path, namespace)
+        self._entries = Index(self.directory)
+
+    @property
+    def nbytes(self) -> int:
+        return self._entries.cache.volume()
+
+    def close(self) -> None:
+        self._entries.cache.close()
+        try:
+            shutil.rmtree(self.directory)
+        except OSError:  # Windows wonkiness
+            pass
+
+
+class SharedStore(CacheStore):
+    """
+    Stores pickled entries in memory-mapped files, which are shared
+    by all processes on a host, e.g. the workers launched by
+    `panel serve --num-procs`.
+
+    By default the files are written to a directory of the current
+    user on the shared memory filesystem (/dev/shm) if available,
+    otherwise in the temporary directory. Since the entries are
+    unpickled the store refuses to use a directory owned by another
+    user or writable by other users.
+    The computation of an entry is guarded by a file lock so
+    that when multiple processes miss at the same time only one of
+    them computes the value while the others wait and load it.
+    """
+
+    # created, accessed, hits
+    _header = struct.Struct('<ddq')
+
+    def __init__(
+        self, namespace: str, path: str | os.PathLike | None = None,
+        max_bytes: int | None = None, policy: str = 'LRU'
+    ):
+        super().__init__(namespace, path, max_bytes, policy)
+        if path is None:
+            path = _private_dir(_shared_cache_dir())
+        self.directory = _private_dir(os.path.join(path, namespace))
+        self._lock_dir = _private_dir(os.path.join(self.directory, '.locks'))
+        self._lock_fds: dict[tuple[str, int], int] = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _lock_path(self, key: str) -> str:
+        return os.path.join(self._lock_dir, key)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.isfile(self._path(key))
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        self._remove_lock(key)
+
+    def _remove_lock(self, key: str) -> None:
+        """
+        Deletes the lock file of an entry unless another thread or
+        process is computing the entry.
+        """
+        held = (key, threading.get_ident()) in self._lock_fds
+        if not held and not self.acquire(key, blocking=False):
+            return
+        try:
+            # Processes waiting on the lock detect that the file was
+            # removed once they acquire it (see acquire)
+            os.remove(self._lock_path(key))
+        except OSError:
+            pass
+        finally:
+            if not held:
+                self.release(key)
+
+    def _scan(self) -> list[tuple[str, float, int, float, int]]:
+        """
+        Reads the (key, created, hits, accessed, size) of all entries.
+        """
+        entries = []
+        for key in self.keys():
+            try:
+                with open(self._path(key), 'rb') as f:
+                    created, accessed, hits = self._header.unpack(f.read(self._header.size))
+                    size = os.fstat(f.fileno()).st_size
+            except (OSError, struct.error):
+                continue
+            entries.append((key, created, hits, accessed, size))
+        return entries
+
+    def _eviction_order(
+        self, policy: str, entries: list[tuple[str, float, int, float, int]]
+    ) -> list[tuple[str, float, int, float, int]]:
+        """
+        Sorts the scanned entries in the order they are evicted in.
+        """
+        policy = policy.lower()
+        if policy == 'fifo':
+            return sorted(entries, key=lambda e: e[1])
+        elif policy == 'lru':
+            return sorted(entries, key=lambda e: e[3])
+        return sorted(entries, key=lambda e: e[2])
+
+    def keys(self) -> list[str]:
+        try:
+            return [
+                entry.name for entry in os.scandir(self.directory)
+                if entry.is_file() and not entry.name.startswith('.')
+            ]
+        except FileNotFoundError:
+            return []
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The total size of all entries in bytes.
+        """
+        nbytes = 0
+        for key in self.keys():
+            try:
+                nbytes += os.path.getsize(self._path(key))
+            except OSError:
+                pass
+        return nbytes
+
+    def metadata(self) -> Iterator[tuple[str, float, int, float]]:
+        for key, created, hits, accessed, _ in self._scan():
+            yield key, created, hits, accessed
+
+    def cleanup(self, policy: str, max_items: int, time: float) -> None:
+        # Evict from a single scan instead of re-reading all entries
+        # to find each entry to evict
+        entries = self._scan()
+        for key, *_ in self._eviction_order(policy, entries)[:len(entries)-max_items+1]:
+            try:
+                del self[key]
+            except KeyError:
+                pass
+
+    def cleanup_bytes(self, max_bytes: int, time: float, keep: str | None = None) -> None:
+        entries = self._scan()
+        nbytes = sum(entry[-1] for entry in entries)
+        for key, *_, size in self._eviction_order(self.policy, entries):
+            if nbytes <= max_bytes:
+                break
+            elif key == keep:
+                continue
+            try:
+                del self[key]
+            except KeyError:
+                pass
+            nbytes -= size
+
+    def hit(self, key: str, time: float) -> t.Any:
+        try:
+            f = open(self._path(key), 'r+b')
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        with f, mmap.mmap(f.fileno(), 0) as mm:
+            created, _, hits = self._header.unpack_from(mm)
+            self._header.pack_into(mm, 0, created, time, hits+1)
+            with memoryview(mm) as view:
+                return pickle.loads(view[self._header.size:])
+
+    def put(self, key: str, value: t.Any, time: float) -> None:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._header.pack(time, time, 0))
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.max_bytes is not None:
+            self.cleanup_bytes(self.max_bytes, time, keep=key)
+
+    def clear(self) -> None:
+        for key in self.keys():
+            try:
+                del self[key]
+            except KeyError:
+                pass
+        # Remove lock files left behind by entries which were never stored
+        try:
+            locks = os.listdir(self._lock_dir)
+        except FileNotFoundError:
+            return
+        for key in locks:
+            self._remove_lock(key)
+
+    def acquire(self, key: str, blocking: bool = True) -> bool:
+        path = self._lock_path(key)
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT)
+            if not _lock_file(fd, blocking):
+                os.close(fd)
+                return False
+            # The lock file may have been removed (and recreated) while
+            # waiting on it, in which case the lock has to be acquired
+            # on the new file
+            try:
+                current = os.stat(path).st_ino == os.fstat(fd).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                break
+            _unlock_file(fd)
+            os.close(fd)
+        self._lock_fds[(key, threading.get_ident())] = fd
+        return True
+
+    def release(self, key: str) -> None:
+        fd = self._lock_fds.pop((key, threading.get_ident()), None)
+        if fd is None:
+            return
+        try:
+            _unlock_file(fd)
+        finally:
+            os.close(fd)
+
+
+_CACHE_STORES: dict[str, type[CacheStore]] = {
+    'memory': MemoryStore,
+    'disk': DiskStore,
+    'shared': SharedStore,
+}
+
+def _get_store_type(store: str | Callable[..., CacheStore] | None, to_disk: bool = False) -> Callable[..., CacheStore]:
+    if store is None:
+        store = 'disk' if to_disk else config.cache_store
+    if isinstance(store, str):
+        if store not in _CACHE_STORES:
+            raise ValueError(
+                f"Cache store must be one of {list(_CACHE_STORES)}, not {store!r}."
+            )
+        return _CACHE_STORES[store]
+    return store
+
 @t.overload
 def cache(
     func: t.Literal[None] = ...,
     hash_funcs: dict[type[t.Any], Callable[[t.Any], bytes]] | None = ...,
     max_items: int | None = ...,
+    max_bytes: int | None = ...,
     policy: t.Literal['FIFO', 'LRU', 'LFU'] = ...,
     ttl: float | None = ...,
     to_disk: bool = ...,
     cache_path: str | os.PathLike | None = ...,
     per_session: bool = ...,
+    store: str | Callable[..., CacheStore] | None = ...,
+    hash_mode: t.Literal['sample', 'identity', 'full'] = ...,
 ) -> Callable[[Callable[_P, _R]], _CachedFunc[Callable[_P, _R]]]:
     ...
 
@@ -393,11 +1200,14 @@ def cache(
     func: Callable[_P, _R],
     hash_funcs: dict[type[t.Any], Callable[[t.Any], bytes]] | None = ...,
     max_items: int | None = ...,
+    max_bytes: int | None = ...,
     policy: t.Literal['FIFO', 'LRU', 'LFU'] = ...,
     ttl: float | None = ...,
     to_disk: bool = ...,
     cache_path: str | os.PathLike | None = ...,
     per_session: bool = ...,
+    store: str | Callable[..., CacheStore] | None = ...,
+    hash_mode: t.Literal['sample', 'identity', 'full'] = ...,
 ) -> _CachedFunc[Callable[_P, _R]]:
     ...
 
@@ -405,17 +1215,26 @@ def cache(
     func: Callable[_P, _R] | None = None,
     hash_funcs: dict[type[t.Any], Callable[[t.Any], bytes]] | None = None,
     max_items: int | None = None,
+    max_bytes: int | None = None,
     policy: t.Literal['FIFO', 'LRU', 'LFU'] = 'LRU',
     ttl: float | None = None,
     to_disk: bool = False,
     cache_path: str | os.PathLike | None = None,
-    per_session: bool = False
+    per_session: bool = False,
+    store: str | Callable[..., CacheStore] | None = None,
+    hash_mode: t.Literal['sample', 'identity', 'full'] = 'sample',
 ) -> _CachedFunc[Callable[_P, _R]] | Callable[[Callable[_P, _R]], _CachedFunc[Callable[_P, _R]]]:
     """
     Memoizes functions for a user session. Can be used as function annotation or just directly.
 
     For global caching across user sessions use `pn.state.as_cached`.
 
+    Concurrent calls missing the cache with the same arguments are
+    coalesced, i.e. the function is computed once while the other
+    callers wait for the result. The number of hits, misses and
+    coalesced calls can be retrieved by calling the `stats` method
+    of the cached function.
+
     Parameters
     ----------
     func: callable
@@ -427,8 +1246,14 @@ def cache(
     max_items: int or None
         The maximum items to keep in the cache. Default is None, which does
         not limit number of items stored in the cache.
+    max_bytes: int or None
+        The maximum size of the cache in bytes. The size of arrays and
+        DataFrames is measured from the memory held by their data.
+        Default is None, which does not limit the size of the cache.
+        A limit for all in-memory caches in the process can be set
+        with config.cache_max_bytes.
     policy: str
-        A caching policy when max_items is set, must be one of:
+        A caching policy when max_items or max_bytes is set, must be one of:
           - FIFO: First in - First out
           - LRU: Least recently used
           - LFU: Least frequently used
@@ -439,16 +1264,36 @@ def cache(
         Whether to cache to disk using diskcache.
     cache_path: str
         Directory to cache to on disk (if not provided default will be
-        inherited from config.cache_path).
+        inherited from config.cache_path). For the 'shared' store it
+        defaults to a directory on the shared memory filesystem.
     per_session: bool
         Whether to cache data only for the current session.
+    store: str or CacheStore or None
+        The store to cache to, one of 'memory', 'disk' or 'shared' or a
+        CacheStore subclass. The 'shared' store shares entries between
+        all processes on a host. If not provided defaults to 'disk' if
+        to_disk is enabled and otherwise to config.cache_store.
+    hash_mode: str
+        How large arrays and DataFrames arguments are hashed, must be
+        one of:
+          - sample: Hashes a sample of evenly spaced rows (default)
+          - identity: Hashes a sample the first time an object is
+            passed and reuses the hash while the same object with the
+            same shape and dtypes is passed again. Fastest, but does
+            not detect in-place modifications.
+          - full: Hashes the full contents of the object.
     """
     if policy.lower() not in ('fifo', 'lru', 'lfu'):
         raise ValueError(
             f"Cache policy must be one of 'FIFO', 'LRU' or 'LFU', not {policy}."
         )
+    if hash_mode not in ('sample', 'identity', 'full'):
+        raise ValueError(
+            f"Cache hash_mode must be one of 'sample', 'identity' or 'full', not {hash_mode}."
+        )
 
-    if cache_path is None:
+    store_type = _get_store_type(store, to_disk)
+    if cache_path is None and store_type is DiskStore:
         cache_path = config.cache_path
 
     hash_funcs = hash_funcs or {}
@@ -458,10 +1303,14 @@ def cache(
                 func=func,
                 hash_funcs=hash_funcs,
                 max_items=max_items,
+                max_bytes=max_bytes,
+                policy=policy,
                 ttl=ttl,
                 to_disk=to_disk,
                 cache_path=cache_path,
                 per_session=per_session,
+                store=store,
+                hash_mode=hash_mode,
             )
         return decorator
     func_hashes = [None] # noqa
@@ -480,7 +1329,7 @@ def cache(
             dinfo = getattr(wrapped_func, '_dinfo', {})
             hash_args = tuple(getattr(args[0], d) for d in dinfo.get('dependencies', ())) + args[1:]
             hash_kwargs = dict(dinfo.get('kw', {}), **kwargs)
-        hash_value = compute_hash(func, hash_funcs, hash_args, hash_kwargs)
+        hash_value = compute_hash(func, hash_funcs, hash_args, hash_kwargs, hash_mode)
 
         time = _TIME_FN()
 
@@ -498,52 +1347,118 @@ def cache(
         func_hash = hashlib.sha256(_generate_hash(func_hash)).hexdigest()
 
         func_hashes[0] = func_hash
-        func_cache = state._memoize_cache.get(func_hash)
+        with lock:
+            func_cache = state._memoize_cache.get(func_hash)
 
-        if func_cache is None:
-            if to_disk:
-                from diskcache import Index
-                cache = Index(os.path.join(cache_path, func_hash))
-            else:
-                cache = {}
-            state._memoize_cache[func_hash] = func_cache = cache
+            if func_cache is None:
+                func_cache = store_type(func_hash, cache_path, max_bytes=max_bytes, policy=policy)
+                state._memoize_cache[func_hash] = func_cache
 
-        if ttl is not None:
-            _cleanup_ttl(func_cache, ttl, time)
+            if ttl is not None:
+                func_cache.cleanup_ttl(ttl, time)
 
-        if hash_value in func_cache:
-            return func_cache, hash_value, time
+            if hash_value in func_cache:
+                return func_cache, hash_value, time
 
-        if max_items is not None:
-            _cleanup_cache(func_cache, policy, max_items, time)
+            if max_items is not None:
+                func_cache.cleanup(policy, max_items, time)
 
         return func_cache, hash_value, time
 
+    # Computations in flight indexed by function and argument hash,
+    # which callers missing the cache concurrently wait on
+    inflight: dict[tuple[str, str], tuple[Future, int]] = {}
+    stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+
+    def lookup(func_cache, hash_value, time, reentrant=True):
+        """
+        Returns the cached value or the future of the computation the
+        caller has to wait on or, if no computation is in flight, a new
+        future the caller is responsible for resolving.
+
+        Synchronous calls made by the thread computing the value (i.e.
+        recursive calls) compute the value themselves to avoid deadlocks.
+        """
+        with lock:
+            try:
+                ret = func_cache.hit(hash_value, time)
+            except KeyError:
+                pass
+            else:
+                stats['hits'] += 1
+                return ret, None, False
+            key = (func_cache.namespace, hash_value)
+            if key in inflight:
+                future, thread_id = inflight[key]
+                if not reentrant or thread_id != threading.get_ident():
+                    stats['coalesced'] += 1
+                    return _MISSING, future, False
+            future = Future()
+            inflight[key] = (future, threading.get_ident())
+            stats['misses'] += 1
+            return _MISSING, future, True
+
+    def resolve(func_cache, hash_value, future, ret=_MISSING, exception=None):
+        with lock:
+            key = (func_cache.namespace, hash_value)
+            if key in inflight and inflight[key][0] is future:
+                del inflight[key]
+        if exception is None:
+            future.set_result(ret)
+        else:
+            future.set_exception(exception)
+
     if iscoroutinefunction(func):
         @functools.wraps(func)
         async def wrapped_func(*args: _P.args, **kwargs: _P.kwargs) -> _R:
             func_cache, hash_value, time = hash_func(*args, **kwargs)
-            if hash_value in func_cache:
-                with lock:
-                    ret, ts, count, _ = func_cache[hash_value]
-                    func_cache[hash_value] = (ret, ts, count+1, time)
-            else:
-                ret = await t.cast("Awaitable[t.Any]", func(*args, **kwargs))
-                with lock:
-                    func_cache[hash_value] = (ret, time, 0, time)
+            ret, future, compute = lookup(func_cache, hash_value, time, reentrant=False)
+            if future is None:
+                return ret
+            elif not compute:
+                return await asyncio.wrap_future(future)
+            try:
+                # Poll the lock to avoid blocking the event loop while
+                # another process computes the entry
+                while not func_cache.acquire(hash_value, blocking=False):
+                    await asyncio.sleep(0.01)
+                try:
+                    with lock:
+                        ret = func_cache.hit(hash_value, time)
+                except KeyError:
+                    ret = await t.cast("Awaitable[t.Any]", func(*args, **kwargs))
+                    with lock:
+                        func_cache.put(hash_value, ret, time)
+                finally:
+                    func_cache.release(hash_value)
+            except BaseException as e:
+                resolve(func_cache, hash_value, future, exception=e)
+                raise
+            resolve(func_cache, hash_value, future, ret)
             return ret
     else:
         @functools.wraps(func)
         def wrapped_func(*args: _P.args, **kwargs: _P.kwargs) -> _R:
             func_cache, hash_value, time = hash_func(*args, **kwargs)
-            if hash_value in func_cache:
-                with lock:
-                    ret, ts, count, _ = func_cache[hash_value]
-                    func_cache[hash_value] = (ret, ts, count+1, time)
-            else:
-                ret = func(*args, **kwargs)
-                with lock:
-                    func_cache[hash_value] = (ret, time, 0, time)
+            ret, future, compute = lookup(func_cache, hash_value, time)
+            if future is None:
+                return ret
+            elif not compute:
+                return future.result()
+            try:
+                with func_cache.lock(hash_value):
+                    # Another process may have computed the entry
+                    try:
+                        with lock:
+                            ret = func_cache.hit(hash_value, time)
+                    except KeyError:
+                        ret = func(*args, **kwargs)
+                        with lock:
+                            func_cache.put(hash_value, ret, time)
+            except BaseException as e:
+                resolve(func_cache, hash_value, future, exception=e)
+                raise
+            resolve(func_cache, hash_value, future, ret)
             return ret
 
     def clear(func_hashes=func_hashes):
@@ -554,7 +1469,12 @@ def cache(
         if cache:
             cache.clear()
 
+    def get_stats():
+        with lock:
+            return dict(stats)
+
     wrapped_func.clear = clear  # type: ignore[attr-defined]
+    wrapped_func.stats = get_stats  # type: ignore[attr-defined]
 
     if per_session and state.curdoc and state.curdoc.session_context:
         def server_clear(session_context, clear=clear):
@@ -5,20 +5,135 @@ on a running bokeh server.
 import asyncio
 import inspect
 import logging
+import threading
 import time
 import uuid
+import weakref
 
 from functools import partial
 
 import param
 
+from tornado.ioloop import IOLoop, PeriodicCallback as _TornadoPeriodicCallback
+
 from ..util import function_name
+from .document import hold
 from .logging import LOG_PERIODIC_END, LOG_PERIODIC_START
 from .state import curdoc_locked, set_curdoc, state
 
 log = logging.getLogger('panel.callbacks')
 _periodic_logger = logging.getLogger(f'{__name__}.PeriodicCallback')
 
+
+class _PeriodicScheduler:
+    """
+    Schedules session scoped periodic callbacks on a shared timer per
+    event loop and period instead of one timer per callback. On each
+    tick the callbacks of each Document are executed together under
+    a single hold, skipping sessions which are currently
+    disconnected.
+    """
+
+    def __init__(self):
+        # Documents and callbacks are referenced weakly, the Document
+        # owns its callbacks via its session destroyed hooks.
+        self._groups = {}
+        self._timers = {}
+        # Documents whose session had a websocket connection
+        self._connected = weakref.WeakSet()
+
+    def _session_destroyed(self, doc):
+        """
+        Whether the session of the Document no longer exists.
+        """
+        session_context = doc.session_context
+        if session_context is None:
+            return True
+        session = getattr(session_context, 'session', None)
+        return getattr(session, 'destroyed', False)
+
+    def _session_connected(self, doc):
+        """
+        Whether the websocket connection of the session is open or,
+        if the session never had a connection, whether it may still
+        connect. A session may reconnect after losing its connection
+        so this is checked on every tick.
+        """
+        session = getattr(doc.session_context, 'session', None)
+        if session is None:
+            return True
+        elif getattr(session, 'connection_count', 0):
+            self._connected.add(doc)
+            return True
+        return doc not in self._connected
+
+    def add(self, cb):
+        key = (IOLoop.current(), cb.period)
+        docs = self._groups.setdefault(key, weakref.WeakKeyDictionary())
+        docs.setdefault(cb._doc, []).append(weakref.ref(cb))
+        if key not in self._timers:
+            timer = _TornadoPeriodicCallback(partial(self._tick, key), cb.period)
+            self._timers[key] = timer
+            timer.start()
+        return key
+
+    def remove(self, cb, key):
+        docs = self._groups.get(key, {})
+        callbacks = docs.get(cb._doc, []) if cb._doc is not None else []
+        callbacks[:] = [ref for ref in callbacks if ref() not in (None, cb)]
+        if not callbacks:
+            docs.pop(cb._doc, None)
+        self._discard_empty(key)
+
+    def _discard_empty(self, key):
+        if self._groups.get(key):
+            return
+        self._groups.pop(key, None)
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.stop()
+
+    def _tick(self, key):
+        docs = self._groups.get(key, {})
+        for doc, refs in list(docs.items()):
+            callbacks = [cb for cb in (ref() for ref in refs) if cb is not None]
+            if not callbacks or self._session_destroyed(doc):
+                docs.pop(doc, None)
+            elif self._session_connected(doc):
+                doc.add_next_tick_callback(partial(self._run, doc, callbacks))
+        self._discard_empty(key)
+
+    def _handle_exception(self, cb, e):
+        try:
+            state._handle_exception(e)
+        except Exception:
+            log.exception(f'Error in periodic callback {function_name(cb.callback)}')
+
+    async def _run(self, doc, callbacks):
+        awaitables, awaiting = [], []
+        with set_curdoc(doc), hold(doc):
+            for cb in callbacks:
+                if cb._doc is not doc or not cb.running:
+                    continue
+                try:
+                    awaitable = cb._execute()
+                except Exception as e:
+                    self._handle_exception(cb, e)
+                    continue
+                if awaitable is not None:
+                    awaitables.append(awaitable)
+                    awaiting.append(cb)
+        if not awaitables:
+            return
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+        for cb, result in zip(awaiting, results):
+            if isinstance(result, Exception):
+                with set_curdoc(doc):
+                    self._handle_exception(cb, result)
+
+
+_scheduler = _PeriodicScheduler()
+
 class PeriodicCallback(param.Parameterized):
     """
     Periodic encapsulates a periodic callback which will run both
@@ -64,6 +179,24 @@ class PeriodicCallback(param.Parameterized):
         self._cb = None
         self._updating = False
         self._doc = None
+        self._scheduled = None
+        self._inflight = 0
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'executions': 0, 'overruns': 0, 'last_duration': 0, 'max_duration': 0
+        }
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """
+        Execution statistics of the callback, i.e. the number of
+        executions, the number of overruns, i.e. executions which
+        took longer than the period or ticks which were skipped or
+        overlapped because the previous execution was still running,
+        and the duration of the last and slowest execution (in
+        seconds).
+        """
+        return dict(self._stats)
 
     @param.depends('running', watch=True)
     def _start(self):
@@ -111,7 +244,49 @@ class PeriodicCallback(param.Parameterized):
         if self.counter == self.count:
             self.stop()
 
-    async def _periodic_callback(self):
+    def _record_execution(self, start):
+        duration = time.monotonic() - start
+        with self._stats_lock:
+            stats = self._stats
+            stats['executions'] += 1
+            stats['last_duration'] = duration
+            stats['max_duration'] = max(stats['max_duration'], duration)
+            if duration * 1000 > self.period:
+                stats['overruns'] += 1
+
+    def _finish_threaded(self, start, future):
+        with self._stats_lock:
+            self._inflight -= 1
+        self._record_execution(start)
+
+    async def _await_callback(self, cb, busy_event_id, start):
+        try:
+            if self._doc:
+                with set_curdoc(self._doc):
+                    await cb
+            else:
+                await cb
+        finally:
+            self._inflight -= 1
+            self._record_execution(start)
+            self._post_callback(busy_event_id)
+
+    def _execute(self):
+        """
+        Executes the callback, returning an awaitable if the callback
+        is asynchronous.
+        """
+        is_async = (
+            inspect.isasyncgenfunction(self.callback) or
+            inspect.iscoroutinefunction(self.callback)
+        )
+        with self._stats_lock:
+            inflight = self._inflight
+            if inflight:
+                self._stats['overruns'] += 1
+        if inflight and (is_async or not state._thread_pool):
+            # Skip the tick until the previous execution completed
+            return None
         busy_event_id = None
         if not self._background:
             busy_event_id = f'periodic-{uuid.uuid4().hex}'
@@ -121,24 +296,31 @@ class PeriodicCallback(param.Parameterized):
             _periodic_logger.info(
                 LOG_PERIODIC_START, id(self._doc), cbname, self.counter
             )
-        is_async = (
-            inspect.isasyncgenfunction(self.callback) or
-            inspect.iscoroutinefunction(self.callback)
-        )
+        start = time.monotonic()
         if state._thread_pool and not is_async:
+            with self._stats_lock:
+                self._inflight += 1
             future = state._thread_pool.submit(self._exec_callback, True, busy_event_id)
+            future.add_done_callback(partial(self._finish_threaded, start))
             future.add_done_callback(partial(state._handle_future_exception, doc=self._doc))
-            return
+            return None
         try:
             cb = self._exec_callback()
-            if inspect.isawaitable(cb):
-                if self._doc:
-                    with set_curdoc(self._doc):
-                        await cb
-                else:
-                    await cb
-        finally:
+        except Exception:
+            self._record_execution(start)
             self._post_callback(busy_event_id)
+            raise
+        if inspect.isawaitable(cb):
+            self._inflight += 1
+            return self._await_callback(cb, busy_event_id, start)
+        self._record_execution(start)
+        self._post_callback(busy_event_id)
+        return None
+
+    async def _periodic_callback(self):
+        awaitable = self._execute()
+        if awaitable is not None:
+            await awaitable
 
     async def _async_repeat(self, func):
         """
@@ -173,7 +355,8 @@ class PeriodicCallback(param.Parameterized):
         if state.curdoc and state.curdoc.session_context and not state._is_pyodide and self.session_scoped:
             self._doc = state.curdoc
             if state._unblocked(state.curdoc):
-                self._cb = self._doc.add_periodic_callback(self._periodic_callback, self.period)
+                self._scheduled = self._cb = _scheduler.add(self)
+                self._doc.on_session_destroyed(self._cleanup)
             else:
                 self._doc.add_next_tick_callback(self.start)
         elif state._thread_id and state._thread_id != state._current_thread:
@@ -201,11 +384,9 @@ class PeriodicCallback(param.Parameterized):
         with param.discard_events(self):
             self.counter = 0
         self._timeout = None
-        if self._doc and self._cb and not state._is_pyodide:
-            if self._doc._session_context:
-                self._doc.callbacks.remove_session_callback(self._cb)
-            elif self._cb in self._doc.callbacks.session_callbacks:
-                self._doc.callbacks._session_callbacks.remove(self._cb)
+        if self._scheduled is not None:
+            _scheduler.remove(self, self._scheduled)
+            self._scheduled = None
         elif self._cb:
             self._cb.cancel()
         self._cb = None
@@ -213,6 +394,6 @@ class PeriodicCallback(param.Parameterized):
         if doc and self.session_scoped:
             doc.callbacks.session_destroyed_callbacks = {
                 cb for cb in doc.callbacks.session_destroyed_callbacks
-                if cb is not self._cleanup
+                if cb != self._cleanup
             }
             self._doc = None
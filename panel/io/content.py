@@ -0,0 +1,128 @@
+"""
+Registry of binary pane content, e.g. large images and media, which
+is served by URL from a content-addressed endpoint instead of being
+embedded in the model as base64.
+
+Content is keyed by its SHA-256 hash, which makes the URLs immutable
+and allows browsers to cache them indefinitely. Content remains
+available as long as the object which registered it is alive and
+still displays it, other entries are evicted in least-recently-used
+order once the store exceeds its size limit.
+"""
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import threading
+import weakref
+
+from collections import OrderedDict
+
+from ..config import config
+from .resources import CONTENT_PATH
+from .state import state
+
+#: Maximum number of bytes held by content no longer in use
+MAX_CONTENT_BYTES = 512 * 1024 * 1024
+
+
+class _Content:
+
+    __slots__ = ('data', 'mime_type')
+
+    def __init__(self, data: bytes, mime_type: str):
+        self.data = data
+        self.mime_type = mime_type
+
+
+_store: OrderedDict[str, _Content] = OrderedDict()
+_store_bytes = 0
+_owners: weakref.WeakKeyDictionary[object, str] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _evict() -> None:
+    global _store_bytes
+    if _store_bytes <= MAX_CONTENT_BYTES:
+        return
+    in_use = set(_owners.values())
+    for key in [key for key in _store if key not in in_use]:
+        _store_bytes -= len(_store.pop(key).data)
+        if _store_bytes <= MAX_CONTENT_BYTES:
+            break
+
+
+def register_content(data: bytes, mime_type: str, owner: object | None = None) -> str:
+    """
+    Registers the content and returns the hash it is served under.
+
+    Arguments
+    ---------
+    data: bytes
+        The content to serve.
+    mime_type: str
+        The MIME type of the content.
+    owner: object | None
+        An object displaying the content. The content is kept alive
+        until the owner is garbage collected or registers different
+        content.
+
+    Returns
+    -------
+    The SHA-256 hash of the content.
+    """
+    global _store_bytes
+    key = hashlib.sha256(data).hexdigest()
+    with _lock:
+        if key in _store:
+            _store.move_to_end(key)
+        else:
+            _store[key] = _Content(data, mime_type)
+            _store_bytes += len(data)
+        if owner is not None:
+            _owners[owner] = key
+        _evict()
+    return key
+
+
+def resolve_content(key: str) -> tuple[bytes, str] | None:
+    """
+    Returns the content and MIME type registered under the hash.
+    """
+    with _lock:
+        entry = _store.get(key)
+        if entry is None:
+            return None
+        _store.move_to_end(key)
+    return entry.data, entry.mime_type
+
+
+def content_url(data: bytes, mime_type: str, owner: object | None = None) -> str | None:
+    """
+    Returns the URL the content is served at if it should not be
+    embedded in the model, i.e. if it is rendered in a server session
+    and exceeds the `config.content_url_threshold`.
+    """
+    threshold = config.content_url_threshold
+    if (
+        threshold is None or len(data) <= threshold or state._is_pyodide or
+        not (state.curdoc and state.curdoc.session_context)
+    ):
+        return None
+    key = register_content(data, mime_type, owner)
+    path = f'{CONTENT_PATH}{key}{mimetypes.guess_extension(mime_type) or ""}'
+    return f'{state.rel_path}/{path}' if state.rel_path else path
+
+
+def clear_content() -> None:
+    """
+    Clears all registered content.
+    """
+    global _store_bytes
+    with _lock:
+        _store.clear()
+        _owners.clear()
+        _store_bytes = 0
+
+
+__all__ = ['clear_content', 'content_url', 'register_content', 'resolve_content']
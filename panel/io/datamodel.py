@@ -13,7 +13,6 @@ from bokeh.core.property.bases import Property
 from bokeh.model import DataModel, Model
 from bokeh.models import ColumnDataSource
 
-from ..reactive import Syncable
 from ..viewable import Child, Children, Viewable
 from .document import unlocked
 from .notebook import push
@@ -174,6 +173,7 @@ def construct_data_model(parameterized, name=None, ignore=[], types={}, extras={
     -------
     DataModel
     """
+    from ..reactive import Syncable
     properties = {}
     for pname in parameterized.param:
         if pname in ignore:
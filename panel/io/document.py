@@ -25,6 +25,7 @@ from bokeh.document.events import (
 )
 from bokeh.model.util import visit_immediate_value_references
 from bokeh.models import CustomJS
+from bokeh.protocol.message import Message
 
 from ..config import config
 from .loading import LOADING_INDICATOR_CSS_CLASS
@@ -37,7 +38,6 @@ if t.TYPE_CHECKING:
 
     from bokeh.core.enums import HoldPolicyType
     from bokeh.core.has_props import HasProps
-    from bokeh.protocol.message import Message
     from bokeh.server.connection import ServerConnection
     from pyviz_comms import Comm
 
@@ -52,6 +52,10 @@ _HOLD_LOCK: WeakKeyDictionary[Document, threading.Lock] = WeakKeyDictionary()
 _WRITE_FUTURES: WeakKeyDictionary[Document, list[Future]] = WeakKeyDictionary()
 _WRITE_MSGS: WeakKeyDictionary[Document, dict[ServerConnection, list[Message]]] = WeakKeyDictionary()
 _WRITE_BLOCK: WeakKeyDictionary[Document, bool] = WeakKeyDictionary()
+_WRITE_BYTES: WeakKeyDictionary[Document, dict[ServerConnection, int]] = WeakKeyDictionary()
+_WRITE_STATS: WeakKeyDictionary[Document, WriteStats] = WeakKeyDictionary()
+_WRITERS: WeakKeyDictionary[Document, set[ServerConnection]] = WeakKeyDictionary()
+_PENDING_WRITES: WeakKeyDictionary[Document, set[Future]] = WeakKeyDictionary()
 _UNCONNECTED_EVENTS: WeakKeyDictionary[Document, list[DocumentChangedEvent]] = WeakKeyDictionary()
 
 _panel_last_cleanup = None
@@ -66,6 +70,19 @@ class Request:
     arguments : dict
 
 
+@dataclasses.dataclass
+class WriteStats:
+    """
+    Statistics about the messages written to the connections of a
+    session.
+    """
+
+    sent_messages: int = 0
+    sent_bytes: int = 0
+    coalesced_events: int = 0
+    dropped_connections: int = 0
+
+
 class MockSessionContext(SessionContext):
 
     def __init__(self, *args, document=None, **kwargs):
@@ -204,12 +221,8 @@ def _cleanup_doc(doc, destroy=True):
     # Destroy document
     doc.destroy(None)
 
-async def _run_write_futures(doc):
-    """
-    Ensure that all write_message calls are awaited and handled.
-    """
+async def _await_writes(futures: Sequence[Future]) -> None:
     from tornado.websocket import WebSocketClosedError
-    futures = _WRITE_FUTURES.pop(doc, [])
     for future in futures:
         try:
             await future
@@ -218,6 +231,12 @@ async def _run_write_futures(doc):
         except Exception as e:
             logger.warning(f"Failed sending message due to following error: {e}")
 
+async def _run_write_futures(doc):
+    """
+    Ensure that all write_message calls are awaited and handled.
+    """
+    await _await_writes(_WRITE_FUTURES.pop(doc, []))
+
 def _dispatch_write_task(doc, func, *args, **kwargs):
     """
     Schedules tasks that write messages to the socket.
@@ -229,46 +248,195 @@ def _dispatch_write_task(doc, func, *args, **kwargs):
     except RuntimeError:
         doc.add_next_tick_callback(partial(func, *args, **kwargs))
 
-async def _dispatch_msgs(doc):
+def _dispatch(
+    conn: ServerConnection,
+    events: list[DocumentPatchedEvent] | None = None,
+    msg: Message | None = None,
+    stats: WriteStats | None = None
+) -> Sequence[Future]:
     """
-    Writes messages to a socket, ensuring that the write_lock is not
-    set, otherwise re-schedules the write task on the event loop.
+    Writes events or a message to a connection using the handler
+    matching the type of socket.
     """
-    if doc not in _WRITE_BLOCK:
-        return
     from tornado.websocket import WebSocketHandler
-    remaining = {}
-    futures = []
-    conn_msgs = _WRITE_MSGS.pop(doc, {})
-    for conn, msgs in conn_msgs.items():
-        socket = conn._socket
-        if hasattr(socket, 'write_lock') and socket.write_lock._block._value == 0:
-            remaining[conn] = msgs
+    if isinstance(conn._socket, WebSocketHandler):
+        return dispatch_tornado(conn, events, msg=msg, stats=stats)
+    elif (socket_type:= type(conn._socket)) in extra_socket_handlers:
+        if msg is None:
+            return extra_socket_handlers[socket_type](conn, events)
+        return extra_socket_handlers[socket_type](conn, msg=msg)
+    return dispatch_django(conn, events, msg=msg, stats=stats)
+
+def _message_size(msg: Message) -> int:
+    """
+    Number of bytes written to the socket when sending the message.
+    """
+    if not isinstance(msg, Message):
+        return 0
+    nbytes = len(msg.header_json) + len(msg.metadata_json) + len(msg.content_json)
+    for buffer in msg._buffers:
+        data = buffer.data
+        nbytes += data.nbytes if isinstance(data, memoryview) else len(data)
+    return nbytes
+
+def _has_definitions(value: t.Any) -> bool:
+    """
+    Whether a serialized value contains the definition of a model,
+    which subsequent messages may refer to by id only.
+    """
+    if isinstance(value, dict):
+        if value.get('type') == 'object' and 'id' in value:
+            return True
+        return any(_has_definitions(v) for v in value.values())
+    elif isinstance(value, list):
+        return any(_has_definitions(v) for v in value)
+    return False
+
+# Events which update a property in place and are therefore also
+# superseded by a ModelChanged event setting the same property
+_PROPERTY_UPDATES = ('ColumnsStreamed', 'ColumnsPatched', 'ColumnDataChanged')
+
+def _is_superseded(event: dict[str, t.Any], changed: set[tuple[str, str]]) -> bool:
+    """
+    Whether a queued event is superseded by the changed properties.
+    """
+    kind = event.get('kind')
+    if kind == 'ModelChanged':
+        value = event.get('new')
+    elif kind in _PROPERTY_UPDATES:
+        value = event.get('patches', event.get('data'))
+    else:
+        return False
+    return (
+        (event['model']['id'], event['attr']) in changed and
+        not _has_definitions(value)
+    )
+
+def _coalesce_messages(queue: list[Message], msg: Message) -> tuple[int, int]:
+    """
+    Removes events from the queued messages which are superseded by
+    a ModelChanged event setting the same property in the new message,
+    i.e. ModelChanged events and any events streaming or patching data
+    into the property. Events defining new models are always kept since
+    later messages may reference the models. Returns the number of
+    removed events and the change in the size of the queue in bytes.
+    """
+    if not isinstance(msg, Message):
+        return 0, 0
+    changed = {
+        (event['model']['id'], event['attr']) for event in msg.content.get('events', [])
+        if event.get('kind') == 'ModelChanged'
+    }
+    if not changed:
+        return 0, 0
+    removed, delta = 0, 0
+    for queued in list(queue):
+        if not isinstance(queued, Message):
             continue
-        for msg in msgs:
-            if isinstance(conn._socket, WebSocketHandler):
-                futures += dispatch_tornado(conn, msg=msg)
-            elif (socket_type:= type(conn._socket)) in extra_socket_handlers:
-                futures += extra_socket_handlers[socket_type](conn, msg=msg)
-            else:
-                futures += dispatch_django(conn, msg=msg)
-    if futures:
-        if doc in _WRITE_FUTURES:
-            _WRITE_FUTURES[doc] += futures
+        events = queued.content.get('events', [])
+        kept = [event for event in events if not _is_superseded(event, changed)]
+        if len(kept) == len(events):
+            continue
+        removed += len(events) - len(kept)
+        size = _message_size(queued)
+        if kept:
+            queued.content = dict(queued.content, events=kept)
+            delta += _message_size(queued) - size
         else:
-            _WRITE_FUTURES[doc] = futures
-        await _run_write_futures(doc)
-    if not remaining:
-        if doc in _WRITE_BLOCK:
-            del _WRITE_BLOCK[doc]
+            queue.remove(queued)
+            delta -= size
+    return removed, delta
+
+def _drop_connection(doc: Document, conn: ServerConnection, nbytes: int) -> None:
+    """
+    Discards the queued messages of a connection which cannot keep up
+    and closes it.
+    """
+    from tornado.websocket import WebSocketHandler
+    _WRITE_MSGS.get(doc, {}).pop(conn, None)
+    _WRITE_BYTES.get(doc, {}).pop(conn, None)
+    _WRITE_STATS.setdefault(doc, WriteStats()).dropped_connections += 1
+    session_id = doc.session_context.id if doc.session_context else None
+    logger.warning(
+        "Closing connection of session %s since %d bytes of queued messages "
+        "exceed the websocket_queue_limit.", session_id, nbytes
+    )
+    socket = conn._socket
+    try:
+        if isinstance(socket, WebSocketHandler):
+            # 1013: Try again later
+            socket.close(1013, 'Too many queued messages')
+        elif inspect.iscoroutinefunction(getattr(socket, 'close', None)):
+            _dispatch_write_task(doc, socket.close)
+        elif hasattr(socket, 'close'):
+            socket.close()
+    except Exception as e:
+        logger.warning(f"Failed closing connection due to following error: {e}")
+
+async def _write_queue(doc: Document, conn: ServerConnection) -> None:
+    """
+    Writes the queued messages of a connection, waiting for the write
+    lock of the socket and for previous writes to complete. Messages
+    queued in the meantime are written in a single batch once the
+    connection catches up.
+    """
+    socket = conn._socket
+    lock = getattr(socket, 'write_lock', None)
+    stats = _WRITE_STATS.setdefault(doc, WriteStats())
+    try:
+        # Wait for messages written directly to flush before queuing more
+        if pending := _PENDING_WRITES.get(doc):
+            await asyncio.wait(list(pending))
+        while doc in _WRITE_BLOCK and _WRITE_MSGS.get(doc, {}).get(conn):
+            if lock is not None:
+                await lock.acquire()
+            try:
+                msgs = _WRITE_MSGS.get(doc, {}).pop(conn, [])
+                _WRITE_BYTES.get(doc, {}).pop(conn, None)
+                futures: list[Future] = []
+                for msg in msgs:
+                    futures += _dispatch(conn, msg=msg, stats=stats)
+                await _await_writes(futures)
+            finally:
+                if lock is not None:
+                    lock.release()
+    finally:
+        writers = _WRITERS.get(doc, set())
+        writers.discard(conn)
+        if not writers and not _WRITE_MSGS.get(doc):
+            _WRITE_MSGS.pop(doc, None)
+            _WRITE_BLOCK.pop(doc, None)
+
+async def _dispatch_msgs(doc):
+    """
+    Writes the queued messages of each connection. Each connection
+    is written to by a single task at a time, so messages for a slow
+    connection accumulate (and are coalesced) in its queue instead of
+    in the write buffer of the socket.
+    """
+    if doc not in _WRITE_BLOCK:
         return
-    for conn, msgs in remaining.items():
-        if doc in _WRITE_MSGS:
-            _WRITE_MSGS[doc][conn] = msgs + _WRITE_MSGS[doc].get(conn, [])
-        else:
-            _WRITE_MSGS[doc] = {conn: msgs}
-    await asyncio.sleep(0.01)
-    _dispatch_write_task(doc, _dispatch_msgs, doc)
+    writers = _WRITERS.setdefault(doc, set())
+    conns = [conn for conn in _WRITE_MSGS.get(doc, {}) if conn not in writers]
+    writers.update(conns)
+    await asyncio.gather(*(_write_queue(doc, conn) for conn in conns))
+
+def _session_write_info() -> dict[str, dict[str, int]]:
+    """
+    Returns the write statistics and current queue depth of each session.
+    """
+    info = {}
+    for doc in list(set(_WRITE_STATS) | set(_WRITE_MSGS)):
+        if not doc.session_context:
+            continue
+        stats = _WRITE_STATS.get(doc, WriteStats())
+        queues = _WRITE_MSGS.get(doc, {})
+        info[doc.session_context.id] = dict(
+            dataclasses.asdict(stats),
+            queued_messages=sum(len(msgs) for msgs in queues.values()),
+            queued_bytes=sum(_WRITE_BYTES.get(doc, {}).values())
+        )
+    return info
 
 def _garbage_collect():
     if (new_time:= time.monotonic()-_panel_last_cleanup) < GC_DEBOUNCE:
@@ -313,6 +481,10 @@ def _destroy_document(self, session):
     # Cancel any pending write tasks for this document
     _WRITE_MSGS.pop(self, None)
     _WRITE_BLOCK.pop(self, None)
+    _WRITE_BYTES.pop(self, None)
+    _WRITE_STATS.pop(self, None)
+    _WRITERS.pop(self, None)
+    _PENDING_WRITES.pop(self, None)
     _UNCONNECTED_EVENTS.pop(self, None)
     for future in _WRITE_FUTURES.pop(self, []):
         future.cancel()
@@ -354,16 +526,19 @@ def write_events(
     connections: list[ServerConnection],
     events: list[DocumentPatchedEvent]
 ):
-    from tornado.websocket import WebSocketHandler
-
     futures: list[Future] = []
+    stats = _WRITE_STATS.setdefault(doc, WriteStats())
     for conn in connections:
-        if isinstance(conn._socket, WebSocketHandler):
-            futures += dispatch_tornado(conn, events)
-        elif (socket_type:= type(conn._socket)) in extra_socket_handlers:
-            futures += extra_socket_handlers[socket_type](conn, events)
-        else:
-            futures += dispatch_django(conn, events)
+        futures += _dispatch(conn, events, stats=stats)
+
+    # Track writes which have not been flushed yet, subsequent events
+    # are queued until they complete so that slow connections are
+    # subject to coalescing and the websocket_queue_limit.
+    pending = _PENDING_WRITES.setdefault(doc, set())
+    for future in futures:
+        if asyncio.isfuture(future) and not future.done():
+            pending.add(future)
+            future.add_done_callback(pending.discard)
 
     if doc in _WRITE_FUTURES:
         _WRITE_FUTURES[doc] += futures
@@ -383,14 +558,23 @@ def schedule_write_events(
     # Set up write locks
     _WRITE_BLOCK[doc] = True
     _WRITE_MSGS[doc] = msgs = _WRITE_MSGS.get(doc, {})
+    sizes = _WRITE_BYTES.setdefault(doc, {})
+    stats = _WRITE_STATS.setdefault(doc, WriteStats())
     # Create messages for remaining events
     for conn in connections:
         # Create a protocol message for any events that cannot be immediately dispatched
         msg = conn.protocol.create('PATCH-DOC', events)
-        if conn in msgs:
-            msgs[conn].append(msg)
-        else:
-            msgs[conn] = [msg]
+        queue = msgs.setdefault(conn, [])
+        nbytes = sizes.get(conn, 0)
+        if queue:
+            # Drop queued changes superseded by the new message
+            removed, delta = _coalesce_messages(queue, msg)
+            stats.coalesced_events += removed
+            nbytes += delta
+        queue.append(msg)
+        nbytes = sizes[conn] = nbytes + _message_size(msg)
+        if config.websocket_queue_limit and nbytes > config.websocket_queue_limit:
+            _drop_connection(doc, conn, nbytes)
     _dispatch_write_task(doc, _dispatch_msgs, doc)
 
 def create_doc_if_none_exists(doc: Document | None) -> Document:
@@ -458,7 +642,8 @@ def with_lock(func: Callable) -> Callable:
 def dispatch_tornado(
     conn: ServerConnection,
     events: list[DocumentPatchedEvent] | None = None,
-    msg: Message | None = None
+    msg: Message | None = None,
+    stats: WriteStats | None = None
 ) -> Sequence[Future]:
     from tornado.websocket import WebSocketHandler
     socket = conn._socket
@@ -482,12 +667,16 @@ def dispatch_tornado(
             WebSocketHandler.write_message(socket, header),
             WebSocketHandler.write_message(socket, payload, binary=True)
         ])
+    if stats is not None:
+        stats.sent_messages += 1
+        stats.sent_bytes += _message_size(msg)
     return futures
 
 def dispatch_django(
     conn: ServerConnection,
     events: list[DocumentPatchedEvent] | None = None,
-    msg: Message | None = None
+    msg: Message | None = None,
+    stats: WriteStats | None = None
 ) -> Sequence[Future]:
     socket = conn._socket
     if msg is None:
@@ -509,6 +698,9 @@ def dispatch_django(
             socket.send(text_data=header),
             socket.send(binary_data=payload)
         ])
+    if stats is not None:
+        stats.sent_messages += 1
+        stats.sent_bytes += _message_size(msg)
     return futures
 
 @contextmanager
@@ -556,7 +748,10 @@ def unlocked(policy: HoldPolicyType = 'combine') -> Iterator:
         # by having bokeh dispatch them on calling unhold or by
         # scheduling them to be triggered later.
         connections = session._subscribed_connections
-        locked = curdoc in _WRITE_MSGS or curdoc in _WRITE_BLOCK
+        locked = (
+            curdoc in _WRITE_MSGS or curdoc in _WRITE_BLOCK or
+            bool(_PENDING_WRITES.get(curdoc))
+        )
         for conn in connections:
             socket = conn._socket
             if hasattr(socket, 'write_lock') and socket.write_lock._block._value == 0:
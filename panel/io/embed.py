@@ -1,19 +1,24 @@
 """
 Various utilities for recording and embedding state in a rendered app.
 """
+import hashlib
 import json
+import multiprocessing
 import os
 import sys
+import time
 import uuid
 
 from collections import defaultdict
 from contextlib import contextmanager
 from itertools import product
+from typing import NamedTuple
 
 import param
 
 from bokeh.core.property.bases import Property
 from bokeh.models import CustomJS
+from bokeh.settings import settings
 from param.parameterized import Watcher
 
 from .model import add_to_doc, diff
@@ -58,26 +63,118 @@ def record_events(doc):
             'content': msg.content_json}
 
 
-def save_dict(state, key=(), depth=0, max_depth=None, save_path='', load_path=None):
-    filename_dict = {}
-    for k, v in state.items():
-        curkey = key+(k,)
-        if depth < max_depth:
-            filename_dict[k] = save_dict(v, curkey, depth+1, max_depth,
-                                         save_path, load_path)
-        else:
-            filename = '_'.join([str(i) for i in curkey]) +'.json'
-            filepath = os.path.join(save_path, filename)
-            directory = os.path.dirname(filepath)
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-            with open(filepath, 'w') as f:
-                json.dump(v, f)
-            refpath = filepath
-            if load_path:
-                refpath = os.path.join(load_path, filename)
-            filename_dict[k] = refpath
-    return filename_dict
+def patch_key(events):
+    """
+    Returns the content hash recorded events are stored under. The
+    header is ignored since it only contains a unique message id.
+    """
+    return hashlib.sha256(
+        (events['metadata'] + events['content']).encode('utf-8')
+    ).hexdigest()
+
+
+def save_patches(patches, save_path='', load_path=None):
+    """
+    Saves each patch to a JSON file named by its content hash and
+    returns a dictionary mapping from the hash to the file path.
+    """
+    if not os.path.exists(save_path):
+        os.makedirs(save_path)
+    paths = {}
+    for key, patch in patches.items():
+        filepath = os.path.join(save_path, f'{key}.json')
+        with open(filepath, 'w') as f:
+            json.dump(patch, f)
+        paths[key] = os.path.join(load_path, f'{key}.json') if load_path else filepath
+    return paths
+
+
+class EmbedProgress(NamedTuple):
+    """
+    Progress of the exploration of the state space by `embed_state`.
+    """
+
+    completed: int
+
+    total: int
+
+    elapsed: float
+
+    @property
+    def eta(self) -> float | None:
+        """
+        Estimated number of seconds until all states are explored.
+        """
+        if not self.completed:
+            return None
+        return self.elapsed / self.completed * (self.total - self.completed)
+
+
+def _record_states(doc, values, keys):
+    """
+    Sets each combination of widget values and yields the path of
+    model values identifying the state along with the recorded events.
+    """
+    from ..config import config
+
+    # Drop events originating from widgets being varied
+    models = [m for v in values for m in v[1]]
+    for key in keys:
+        path = []
+        try:
+            for i, k in enumerate(key):
+                ws, m, _, g = values[i]
+                with always_changed(config.safe_embed):
+                    for w in ws:
+                        w.value = k
+                path.append(g(m[0]))
+        except Exception:
+            doc.callbacks._held_events = []
+            yield None
+            continue
+        doc.callbacks._held_events = [e for e in doc.callbacks._held_events if e.model not in models]
+        yield tuple(path), record_events(doc)
+
+
+# Document and widget values explored by forked worker processes
+_EMBED_CONTEXT = None
+
+def _record_chunk(keys):
+    # Forked workers continue the sequential model id counter of the
+    # parent, so models created in different workers would be given
+    # the same id unless globally unique ids are used.
+    settings.simple_ids.set_value(False)
+    doc, values = _EMBED_CONTEXT
+    return list(_record_states(doc, values, keys))
+
+
+def _explore_states(doc, values, cross_product, processes):
+    """
+    Yields the recorded state for each combination of widget values,
+    distributing contiguous chunks of the cross product across forked
+    worker processes if more than one process is requested.
+    """
+    global _EMBED_CONTEXT
+    if processes <= 1 or len(cross_product) < 2:
+        yield from _record_states(doc, values, cross_product)
+        return
+    elif 'fork' not in multiprocessing.get_all_start_methods():
+        param.main.param.warning(
+            'Exploring the application states in parallel requires the '
+            "'fork' start method, which is not available on this platform. "
+            'Falling back to a single process.'
+        )
+        yield from _record_states(doc, values, cross_product)
+        return
+    chunksize = max(1, -(-len(cross_product) // (processes * 4)))
+    chunks = [cross_product[i:i+chunksize] for i in range(0, len(cross_product), chunksize)]
+    _EMBED_CONTEXT = (doc, values)
+    try:
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            for chunk in pool.imap(_record_chunk, chunks):
+                yield from chunk
+    finally:
+        _EMBED_CONTEXT = None
 
 
 def get_watchers(reactive):
@@ -186,7 +283,7 @@ def links_to_jslinks(model, widget):
 
 def embed_state(panel, model, doc, max_states=1000, max_opts=3,
                 json=False, json_prefix='', save_path='./',
-                load_path=None, progress=True, states={}):
+                load_path=None, progress=True, states={}, processes=1):
     """
     Embeds the state of the application on a State model which allows
     exporting a static version of an app. This works by finding all
@@ -215,12 +312,15 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
       The path to save json files to
     load_path: str (default=None)
       The path or URL the json files will be loaded from.
-    progress: boolean (default=True)
-      Whether to report progress
+    progress: boolean or callable (default=True)
+      Whether to report progress, or a callback which is invoked
+      with an EmbedProgress after each state is explored
     states: dict (default={})
       A dictionary specifying the widget values to embed for each widget
+    processes: int (default=1)
+      The number of worker processes to explore the states in,
+      requires the 'fork' start method
     """
-    from tqdm import tqdm
 
     from ..config import config
     from ..layout import Panel
@@ -335,31 +435,26 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
 
     nested_dict = lambda: defaultdict(nested_dict)
     state_dict = nested_dict()
+    patches = {}
     changes = False
-    for key in (tqdm(cross_product, leave=False, file=sys.stdout) if progress else cross_product):
-        sub_dict = state_dict
-        skip = False
-        for i, k in enumerate(key):
-            ws, m, _, g = values[i]
-            try:
-                with always_changed(config.safe_embed):
-                    for w in ws:
-                        w.value = k
-            except Exception:
-                skip = True
-                break
-            sub_dict = sub_dict[g(m[0])]
-        if skip:
-            doc.callbacks._held_events = []
+    recorded = _explore_states(doc, values, cross_product, processes)
+    if progress is True:
+        from tqdm import tqdm
+        recorded = tqdm(recorded, total=len(cross_product), leave=False, file=sys.stdout)
+    start = time.monotonic()
+    for i, record in enumerate(recorded):
+        if callable(progress):
+            progress(EmbedProgress(i+1, len(cross_product), time.monotonic()-start))
+        if record is None or not record[0]:
             continue
-
-        # Drop events originating from widgets being varied
-        models = [m for v in values for m in v[1]]
-        doc.callbacks._held_events = [e for e in doc.callbacks._held_events if e.model not in models]
-        events = record_events(doc)
+        path, events = record
         changes |= events['content'] != '{}'
-        if events:
-            sub_dict.update(events)
+        key = patch_key(events)
+        patches.setdefault(key, events)
+        sub_dict = state_dict
+        for k in path[:-1]:
+            sub_dict = sub_dict[k]
+        sub_dict[path[-1]] = key
 
     if not changes:
         return
@@ -376,10 +471,9 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
         save_path = os.path.join(save_path, random_dir)
         if load_path is not None:
             load_path = os.path.join(load_path, random_dir)
-        state_dict = save_dict(state_dict, max_depth=len(values)-1,
-                               save_path=save_path, load_path=load_path)
+        patches = save_patches(patches, save_path=save_path, load_path=load_path)
 
-    state_model.update(json=json, state=state_dict, values=init_vals,
+    state_model.update(json=json, state=state_dict, patches=patches, values=init_vals,
                        widgets={m[0].ref['id']: i for i, (_, m, _, _) in enumerate(values)})
     doc.add_root(state_model)
     return state_model
@@ -0,0 +1,191 @@
+"""
+Fetches remote content referenced by panes, e.g. images and PDFs
+given as a URL, without blocking the event loop.
+
+Requests are made on a small thread pool sharing a pooled HTTP
+session, limiting the number of concurrent downloads. Responses are
+stored in a process-level cache keyed by URL and revalidated using
+the ETag/Last-Modified and Cache-Control max-age headers of the
+response.
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+import typing as t
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+if t.TYPE_CHECKING:
+    import requests
+
+#: Maximum number of concurrent downloads
+MAX_CONCURRENT_FETCHES = 8
+
+#: Maximum number of bytes held in the content cache
+MAX_CACHE_BYTES = 128 * 1024 * 1024
+
+#: Timeout (in seconds) of each request
+FETCH_TIMEOUT = 60
+
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+class _CacheEntry:
+
+    __slots__ = ('content', 'etag', 'expires', 'last_modified')
+
+    def __init__(
+        self, content: bytes, etag: str | None, last_modified: str | None, expires: float
+    ):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+
+_cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+_cache_bytes = 0
+_inflight: dict[str, Future] = {}
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        import requests
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_FETCHES, pool_maxsize=MAX_CONCURRENT_FETCHES
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session = session
+    return _session
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix='panel-fetch'
+        )
+    return _executor
+
+
+def _max_age(headers: t.Mapping[str, str]) -> float | None:
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control:
+        return None
+    elif 'no-cache' in cache_control:
+        return 0
+    match = _MAX_AGE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def _store(url: str, entry: _CacheEntry) -> None:
+    global _cache_bytes
+    with _lock:
+        if (old := _cache.pop(url, None)) is not None:
+            _cache_bytes -= len(old.content)
+        if len(entry.content) > MAX_CACHE_BYTES:
+            return
+        _cache[url] = entry
+        _cache_bytes += len(entry.content)
+        while _cache_bytes > MAX_CACHE_BYTES:
+            _, evicted = _cache.popitem(last=False)
+            _cache_bytes -= len(evicted.content)
+
+
+def _fetch(url: str) -> bytes:
+    with _lock:
+        entry = _cache.get(url)
+        if entry is not None:
+            _cache.move_to_end(url)
+    if entry is not None and entry.fresh:
+        return entry.content
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+    response = _get_session().get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    max_age = _max_age(response.headers)
+    if entry is not None and response.status_code == 304:
+        if max_age is not None:
+            entry.expires = time.monotonic() + max_age
+        return entry.content
+    content = response.content
+    etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+    if response.status_code == 200 and max_age is not None and (max_age or etag or last_modified):
+        _store(url, _CacheEntry(content, etag, last_modified, time.monotonic() + max_age))
+    return content
+
+
+def _fetch_shared(url: str) -> Future:
+    """
+    Submits a fetch of the URL unless one is already in flight.
+    """
+    with _lock:
+        future = _inflight.get(url)
+        if future is None:
+            future = _inflight[url] = _get_executor().submit(_fetch, url)
+            future.add_done_callback(lambda f: _discard(url, f))
+    return future
+
+
+def _discard(url: str, future: Future) -> None:
+    with _lock:
+        if _inflight.get(url) is future:
+            del _inflight[url]
+
+
+def cached_content(url: str) -> bytes | None:
+    """
+    Returns the cached content of the URL if it does not have to be
+    revalidated.
+    """
+    with _lock:
+        entry = _cache.get(url)
+    return entry.content if entry is not None and entry.fresh else None
+
+
+def fetch(url: str) -> bytes:
+    """
+    Fetches the content of the URL, blocking until it is available.
+    """
+    if (content := cached_content(url)) is not None:
+        return content
+    return _fetch_shared(url).result()
+
+
+def fetch_async(url: str) -> asyncio.Future:
+    """
+    Fetches the content of the URL on a background thread, returning
+    an asyncio Future resolving to the content on the current event
+    loop.
+    """
+    return asyncio.wrap_future(_fetch_shared(url))
+
+
+def clear_cache() -> None:
+    """
+    Clears the content cache.
+    """
+    global _cache_bytes
+    with _lock:
+        _cache.clear()
+        _cache_bytes = 0
+
+
+__all__ = ['cached_content', 'clear_cache', 'fetch', 'fetch_async']
@@ -48,7 +48,7 @@ from .resources import (
 from .state import state
 
 if t.TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from bokeh.protocol.message import Message
     from bokeh.server.server import Server
@@ -57,6 +57,7 @@ if t.TYPE_CHECKING:
     from ..models.comm_manager import CommManager
     from ..viewable import Viewable
     from ..widgets.base import Widget
+    from .embed import EmbedProgress
     from .location import Location
 
 
@@ -507,7 +508,8 @@ def show_server(panel: t.Any, notebook_url: str, port: int = 0) -> Server:
 def render_embed(
     panel, max_states: int = 1000, max_opts: int = 3, json: bool = False,
     json_prefix: str = '', save_path: str = './', load_path: str | None = None,
-    progress: bool = True, states: dict[Widget, list[t.Any]] = {}
+    progress: bool | Callable[[EmbedProgress], None] = True,
+    states: dict[Widget, list[t.Any]] = {}, processes: int = 1
 ) -> Mimebundle:
     """
     Renders a static version of a panel in a notebook by evaluating
@@ -529,10 +531,13 @@ def render_embed(
       The path to save json files to
     load_path: str (default=None)
       The path or URL the json files will be loaded from.
-    progress: boolean (default=False)
-      Whether to report progress
+    progress: boolean or callable (default=False)
+      Whether to report progress, or a callback invoked with an
+      EmbedProgress after each state is explored
     states: dict (default={})
       A dictionary specifying the widget values to embed for each widget
+    processes: int (default=1)
+      The number of worker processes to explore the states in
     """
     from ..config import config
 
@@ -542,7 +547,7 @@ def render_embed(
         model = panel.get_root(doc, comm)
         embed_state(panel, model, doc, max_states, max_opts,
                     json, json_prefix, save_path, load_path, progress,
-                    states)
+                    states, processes)
     return Mimebundle(render_model(model))
 
 def show_embed(panel, *args, **kwargs):
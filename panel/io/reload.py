@@ -31,6 +31,7 @@ except Exception:
             await asyncio.sleep(0.5)
 
 from ..util import fullpath
+from .resources import clear_bundle_cache
 from .state import state
 
 _reload_logger = logging.getLogger('panel.io.reload')
@@ -237,6 +238,9 @@ def _reload(module_paths, changes):
         if module in sys.modules:
             del sys.modules[module]
 
+    # Reloaded modules may declare different resources
+    clear_bundle_cache()
+
     for doc, loc in state._locations.items():
         if not doc.session_context:
             continue
@@ -13,9 +13,11 @@ import os
 import pathlib
 import re
 import textwrap
+import threading
 import typing as t
 import uuid
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
@@ -114,6 +116,7 @@ CDN_DIST = f"{CDN_URL}dist/"
 DOC_DIST = "https://panel.holoviz.org/_static/"
 LOCAL_DIST = "static/extensions/panel/"
 COMPONENT_PATH = "components/"
+CONTENT_PATH = "content/"
 
 BK_PREFIX_RE = re.compile(r'\.bk\.')
 
@@ -456,24 +459,67 @@ def _panel_use_mathjax(roots) -> bool:
     return _any(roots, lambda obj: isinstance(obj, PanelHTML))
 
 
-def bundle_resources(
+#: Maximum number of bundled resources held in the bundle cache
+BUNDLE_CACHE_SIZE = 32
+
+
+class _BundleEntry:
+
+    __slots__ = ('kwargs', 'rendered')
+
+    def __init__(self, kwargs: dict[str, t.Any]):
+        self.kwargs = kwargs
+        self.rendered: tuple[str, str] | None = None
+
+
+_bundle_cache: OrderedDict[tuple[t.Any, ...], _BundleEntry] = OrderedDict()
+_bundle_lock = threading.Lock()
+
+
+def _local_mtimes(files: t.Iterable[str]) -> tuple[float, ...]:
+    return tuple(os.path.getmtime(f) for f in files if os.path.isfile(f))
+
+
+def _bundle_key(
+    resources: Resources, notebook: bool, reloading: bool, use_mathjax: bool
+) -> tuple[t.Any, ...]:
+    """
+    Returns a key identifying all inputs which determine the bundled
+    resources, i.e. the resource settings, the loaded extensions and
+    components and the resource related config options.
+    """
+    from ..reactive import ReactiveMetaBase
+    return (
+        resources.mode, getattr(resources, '_root_url', None), resources.absolute,
+        resources.notebook, resources.minified, resources.dev, resources.version,
+        resources.log_level, resources.base_dir, resources.root_dir,
+        resources.path_versioner, tuple(resources.components),
+        notebook, reloading, use_mathjax, state.rel_path, state.base_url,
+        None if state._extensions is None else tuple(state._extensions),
+        tuple(extension._loaded_extensions),
+        tuple(sorted(ReactiveMetaBase._loaded_extensions)),
+        len(Model.model_class_reverse_map), config.design, config.theme,
+        tuple(config.css_files), tuple(config.js_files.items()),
+        tuple(config.js_modules.items()), tuple(config.raw_css),
+        tuple(config.global_css), config.global_loading_spinner,
+        config.loading_spinner, config.loading_color, config.loading_max_height,
+        config.npm_cdn, bool(config.notifications and state.notifications),
+        _local_mtimes([*config.css_files, *config.js_files.values()]),
+    )
+
+
+def _bundle_entry(
     roots,
     resources: BkResources,
     notebook: bool = False,
     reloading: bool = False,
     enable_mathjax: bool | t.Literal['auto'] = 'auto'
-):
+) -> _BundleEntry:
     from ..config import panel_extension as ext
     global RESOURCE_MODE
     if not isinstance(resources, Resources):
         resources = Resources.from_bokeh(resources, notebook=notebook)
-    js_resources = css_resources = resources
-    RESOURCE_MODE = mode = js_resources.mode if resources is not None else "inline"
-
-    js_files = []
-    js_raw = []
-    css_files = []
-    css_raw = []
+    RESOURCE_MODE = resources.mode if resources is not None else "inline"
 
     if isinstance(enable_mathjax, bool):
         use_mathjax = enable_mathjax
@@ -486,6 +532,75 @@ def bundle_resources(
     else:
         use_mathjax = 'mathjax' in ext._loaded_extensions
 
+    key = _bundle_key(resources, notebook, reloading, use_mathjax)
+    with _bundle_lock:
+        entry = _bundle_cache.get(key)
+        if entry is not None:
+            _bundle_cache.move_to_end(key)
+            return entry
+    entry = _BundleEntry(_bundle_resources(resources, notebook, reloading, use_mathjax))
+    with _bundle_lock:
+        _bundle_cache[key] = entry
+        while len(_bundle_cache) > BUNDLE_CACHE_SIZE:
+            _bundle_cache.popitem(last=False)
+    return entry
+
+
+def bundle_resources(
+    roots,
+    resources: BkResources,
+    notebook: bool = False,
+    reloading: bool = False,
+    enable_mathjax: bool | t.Literal['auto'] = 'auto'
+) -> Bundle:
+    """
+    Bundles the resources required to render the roots. Bundles are
+    cached and only recomputed when any of their inputs change.
+    """
+    kwargs = _bundle_entry(roots, resources, notebook, reloading, enable_mathjax).kwargs
+    return Bundle(**{
+        k: v.copy() if isinstance(v, (list, dict)) else v
+        for k, v in kwargs.items()
+    })
+
+
+def render_bundle(
+    roots,
+    resources: BkResources,
+    notebook: bool = False,
+    reloading: bool = False,
+    enable_mathjax: bool | t.Literal['auto'] = 'auto'
+) -> tuple[str, str]:
+    """
+    Returns the rendered JS and CSS of the bundled resources required
+    to render the roots, see `bundle_resources`.
+    """
+    entry = _bundle_entry(roots, resources, notebook, reloading, enable_mathjax)
+    if entry.rendered is None:
+        js, css = Bundle(**entry.kwargs)
+        entry.rendered = (js, css)
+    return entry.rendered
+
+
+def clear_bundle_cache() -> None:
+    """
+    Clears the cache of bundled resources.
+    """
+    with _bundle_lock:
+        _bundle_cache.clear()
+
+
+def _bundle_resources(
+    resources: Resources, notebook: bool, reloading: bool, use_mathjax: bool
+) -> dict[str, t.Any]:
+    js_resources = css_resources = resources
+    mode = js_resources.mode if resources is not None else "inline"
+
+    js_files = []
+    js_raw = []
+    css_files = []
+    css_raw = []
+
     if js_resources:
         js_resources = js_resources.clone()
         if not use_mathjax and "bokeh-mathjax" in js_resources.components:
@@ -532,7 +647,7 @@ def bundle_resources(
 
     hashes = js_resources.hashes if js_resources else {}
 
-    return Bundle(
+    return dict(
         css_files=[URL(css_file) for css_file in css_files],
         css_raw=css_raw,
         hashes=hashes,
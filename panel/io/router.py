@@ -0,0 +1,415 @@
+"""
+Routes HTTP and websocket traffic from a front process to a number of
+Panel server worker processes, keeping all traffic for a session on
+the worker which created it.
+
+Each worker periodically reports its load, i.e. the number of sessions
+it holds and its CPU usage, to the front process over a local UDP
+socket. New sessions are placed on the least loaded worker and the
+session id returned by the worker is used to route the websocket
+connection of the session back to the same worker.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import time
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from bokeh.util.token import get_session_id
+from tornado.httpclient import AsyncHTTPClient, HTTPRequest
+from tornado.httputil import HTTPHeaders
+from tornado.ioloop import IOLoop, PeriodicCallback
+from tornado.web import Application, HTTPError, RequestHandler
+from tornado.websocket import (
+    WebSocketClosedError, WebSocketHandler, websocket_connect,
+)
+
+if TYPE_CHECKING:
+    from bokeh.server.server import Server
+    from tornado.websocket import WebSocketClientConnection
+
+log = logging.getLogger('panel.io.router')
+
+#: Response header used by workers to announce the session id of a page
+SESSION_HEADER = 'X-Panel-Session-Id'
+
+#: Interval (in milliseconds) at which workers report their load
+REPORT_INTERVAL = 1000
+
+# Headers which are specific to a single connection and are not forwarded
+_HOP_HEADERS = {
+    'Connection', 'Keep-Alive', 'Proxy-Connection', 'Transfer-Encoding',
+    'Upgrade', 'Sec-Websocket-Key', 'Sec-Websocket-Version',
+    'Sec-Websocket-Extensions', 'Sec-Websocket-Protocol', 'Sec-Websocket-Accept',
+}
+
+# The LoadReporter of the current process if it is a worker
+_reporter: LoadReporter | None = None
+
+
+class Worker:
+    """
+    The state of a worker process as last reported to the router.
+    """
+
+    __slots__ = ('cpu', 'index', 'pending', 'pid', 'port', 'sessions', 'updated')
+
+    def __init__(self, index: int, port: int, pid: int | None = None):
+        self.index = index
+        self.port = port
+        self.pid = pid
+        self.sessions = 0
+        self.cpu = 0.0
+        # Sessions placed on the worker since its last report
+        self.pending = 0
+        self.updated = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f'Worker(index={self.index}, port={self.port}, '
+            f'sessions={self.sessions}, cpu={self.cpu:.1f})'
+        )
+
+    @property
+    def load(self) -> float:
+        """
+        Load score of the worker, the number of sessions (including
+        the sessions placed since the last report) weighted by the CPU
+        usage, so that among workers holding the same number of
+        sessions the least busy one is preferred.
+        """
+        return (self.sessions + self.pending + 1) * (1 + self.cpu / 100.)
+
+    def url(self, uri: str, websocket: bool = False) -> str:
+        protocol = 'ws' if websocket else 'http'
+        return f'{protocol}://127.0.0.1:{self.port}{uri}'
+
+
+class SessionRouter:
+    """
+    Keeps track of the load of each worker and of the worker that
+    owns each session.
+    """
+
+    def __init__(self):
+        self.workers: dict[int, Worker] = {}
+        self.sessions: dict[str, int] = {}
+        self._socket: socket.socket | None = None
+
+    def register(self, index: int, port: int, pid: int | None = None) -> Worker:
+        """
+        Registers a worker listening on the given local port.
+        """
+        worker = self.workers.get(index)
+        if worker is None or worker.port != port:
+            worker = self.workers[index] = Worker(index, port, pid)
+            log.info("Worker %d (pid %s) listening on port %d", index, pid, port)
+        return worker
+
+    def remove(self, index: int) -> None:
+        """
+        Removes a worker and all the sessions it owned.
+        """
+        self.workers.pop(index, None)
+        self.sessions = {
+            sid: widx for sid, widx in self.sessions.items() if widx != index
+        }
+
+    def update(self, report: dict[str, Any]) -> None:
+        """
+        Updates the state of a worker given a load report.
+        """
+        worker = self.register(report['index'], report['port'], report.get('pid'))
+        worker.sessions = report['sessions']
+        worker.cpu = report['cpu']
+        worker.pending = 0
+        worker.updated = time.monotonic()
+        for session_id in report.get('ended', []):
+            if self.sessions.get(session_id) == worker.index:
+                del self.sessions[session_id]
+
+    def assign(self, session_id: str, worker: Worker) -> None:
+        """
+        Records that a session is owned by the supplied worker.
+        """
+        if self.sessions.get(session_id) != worker.index:
+            self.sessions[session_id] = worker.index
+            worker.pending += 1
+
+    def least_loaded(self) -> Worker | None:
+        """
+        Returns the worker with the lowest load.
+        """
+        if not self.workers:
+            return None
+        return min(self.workers.values(), key=lambda w: (w.load, w.index))
+
+    def route(self, session_id: str | None = None) -> Worker | None:
+        """
+        Returns the worker owning the session or, if the session is
+        unknown, the least loaded worker.
+        """
+        if session_id is not None:
+            index = self.sessions.get(session_id)
+            if index in self.workers:
+                return self.workers[index]
+        return self.least_loaded()
+
+    #----------------------------------------------------------------
+    # Load reports
+    #----------------------------------------------------------------
+
+    def listen(self, io_loop: IOLoop | None = None) -> int:
+        """
+        Starts listening for load reports on a local UDP socket and
+        returns the port the workers should report to.
+        """
+        sock = self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('127.0.0.1', 0))
+        sock.setblocking(False)
+        io_loop = io_loop or IOLoop.current()
+        io_loop.add_handler(sock.fileno(), self._on_reports, IOLoop.READ)
+        return sock.getsockname()[1]
+
+    def _on_reports(self, fd: int, events: int) -> None:
+        assert self._socket is not None
+        while True:
+            try:
+                data = self._socket.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            try:
+                self.update(json.loads(data))
+            except Exception as e:
+                log.warning("Invalid worker load report: %s", e)
+
+    def close(self) -> None:
+        if self._socket is None:
+            return
+        IOLoop.current().remove_handler(self._socket.fileno())
+        self._socket.close()
+        self._socket = None
+
+    #----------------------------------------------------------------
+    # Application
+    #----------------------------------------------------------------
+
+    def application(self, **settings) -> Application:
+        """
+        Returns a tornado Application proxying all requests to the
+        workers.
+        """
+        kwargs = {'router': self}
+        return Application([
+            (r'.*/ws', WebSocketProxyHandler, kwargs),
+            (r'.*', ProxyHandler, kwargs),
+        ], **settings)
+
+
+def _forwarded_headers(request) -> HTTPHeaders:
+    headers = HTTPHeaders()
+    for name, value in request.headers.get_all():
+        if name not in _HOP_HEADERS:
+            headers.add(name, value)
+    remote_ip = request.remote_ip or ''
+    forwarded = request.headers.get('X-Forwarded-For')
+    headers['X-Forwarded-For'] = f'{forwarded}, {remote_ip}' if forwarded else remote_ip
+    headers['X-Real-Ip'] = remote_ip
+    headers['X-Forwarded-Proto'] = request.protocol
+    return headers
+
+
+class ProxyHandler(RequestHandler):
+    """
+    Forwards HTTP requests to the worker owning the session referenced
+    by the request or otherwise to the least loaded worker.
+    """
+
+    SUPPORTED_METHODS = ('GET', 'HEAD', 'POST', 'DELETE', 'PATCH', 'PUT', 'OPTIONS')  # type: ignore
+
+    _client: ClassVar[AsyncHTTPClient | None] = None
+
+    def initialize(self, router: SessionRouter):
+        self.router = router
+
+    def check_xsrf_cookie(self) -> None:
+        # XSRF cookies are validated by the workers
+        return
+
+    @classmethod
+    def _http_client(cls) -> AsyncHTTPClient:
+        if cls._client is None:
+            cls._client = AsyncHTTPClient(force_instance=True, max_clients=100)
+        return cls._client
+
+    async def _proxy(self) -> None:
+        session_id = self.get_query_argument('bokeh-session-id', None)
+        worker = self.router.route(session_id)
+        if worker is None:
+            raise HTTPError(503, 'No worker process available.')
+        body = self.request.body if self.request.method in ('POST', 'PUT', 'PATCH') else None
+        request = HTTPRequest(
+            worker.url(self.request.uri or '/'),
+            method=self.request.method or 'GET',
+            headers=_forwarded_headers(self.request),
+            body=body,
+            follow_redirects=False,
+            decompress_response=False,
+            allow_nonstandard_methods=True,
+            request_timeout=None,
+        )
+        response = await self._http_client().fetch(request, raise_error=False)
+        if response.code == 599:
+            log.warning("Request to worker %d failed: %s", worker.index, response.error)
+            raise HTTPError(502)
+        if session_id := response.headers.get(SESSION_HEADER):
+            self.router.assign(session_id, worker)
+        self.set_status(response.code, response.reason)
+        for name in ('Content-Type', 'Date', 'Server'):
+            self.clear_header(name)
+        for name, value in response.headers.get_all():
+            if name in _HOP_HEADERS or name == SESSION_HEADER:
+                continue
+            self.add_header(name, value)
+        if response.body and response.code not in (204, 304):
+            self.write(response.body)
+
+    get = head = post = delete = patch = put = options = _proxy  # type: ignore
+
+
+class WebSocketProxyHandler(WebSocketHandler):
+    """
+    Forwards websocket connections to the worker owning the session,
+    which is identified by the token the Bokeh client sends as a
+    websocket subprotocol.
+    """
+
+    def initialize(self, router: SessionRouter):
+        self.router = router
+        self._subprotocols: list[str] = []
+        self._upstream: WebSocketClientConnection | None = None
+
+    def check_origin(self, origin: str) -> bool:
+        # The origin is validated by the workers
+        return True
+
+    def select_subprotocol(self, subprotocols: list[str]) -> str | None:
+        self._subprotocols = list(subprotocols)
+        return subprotocols[0] if subprotocols else None
+
+    async def open(self, *args, **kwargs) -> None:
+        session_id = None
+        if len(self._subprotocols) > 1:
+            try:
+                session_id = get_session_id(self._subprotocols[1])
+            except Exception:
+                pass
+        worker = self.router.route(session_id)
+        if worker is None:
+            self.close(1011, 'No worker process available.')
+            return
+        request = HTTPRequest(
+            worker.url(self.request.uri or '/', websocket=True),
+            headers=_forwarded_headers(self.request)
+        )
+        try:
+            self._upstream = await websocket_connect(
+                request,
+                on_message_callback=self._on_upstream_message,
+                subprotocols=self._subprotocols or None,
+                max_message_size=self.max_message_size,
+            )
+        except Exception as e:
+            log.warning("Websocket connection to worker %d failed: %s", worker.index, e)
+            self.close(1011, 'Worker process unavailable.')
+            return
+        if session_id:
+            self.router.assign(session_id, worker)
+
+    def _on_upstream_message(self, message: str | bytes | None) -> None:
+        if message is None:
+            self._upstream = None
+            self.close()
+            return
+        try:
+            self.write_message(message, binary=isinstance(message, bytes))
+        except WebSocketClosedError:
+            pass
+
+    def on_message(self, message: str | bytes) -> None:
+        if self._upstream is not None:
+            self._upstream.write_message(message, binary=isinstance(message, bytes))
+
+    def on_close(self) -> None:
+        if self._upstream is not None:
+            self._upstream.close()
+            self._upstream = None
+
+
+class LoadReporter:
+    """
+    Periodically reports the load of a worker process to the router.
+    """
+
+    def __init__(self, server: Server, index: int, report_port: int):
+        self.server = server
+        self.index = index
+        self.report_port = report_port
+        self._sessions: set[str] = set()
+        self._cpu_time = time.process_time()
+        self._time = time.monotonic()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._cb = PeriodicCallback(self.report, REPORT_INTERVAL)
+
+    def _cpu_percent(self) -> float:
+        cpu_time, now = time.process_time(), time.monotonic()
+        elapsed = now - self._time
+        percent = 0. if elapsed <= 0 else 100 * (cpu_time - self._cpu_time) / elapsed
+        self._cpu_time, self._time = cpu_time, now
+        return percent
+
+    def report(self) -> None:
+        sessions = {session.id for session in self.server.get_sessions()}
+        ended, self._sessions = list(self._sessions - sessions), sessions
+        report = {
+            'index': self.index,
+            'pid': os.getpid(),
+            'port': self.server.port,
+            'sessions': len(sessions),
+            'cpu': self._cpu_percent(),
+            'ended': ended,
+        }
+        try:
+            self._socket.sendto(json.dumps(report).encode('utf-8'), ('127.0.0.1', self.report_port))
+        except OSError as e:
+            log.warning("Could not report worker load: %s", e)
+
+    def start(self) -> None:
+        global _reporter
+        _reporter = self
+        self.report()
+        self._cb.start()
+
+    def stop(self) -> None:
+        global _reporter
+        if _reporter is self:
+            _reporter = None
+        self._cb.stop()
+        self._socket.close()
+
+
+def is_worker() -> bool:
+    """
+    Whether the current process is a worker behind a SessionRouter.
+    """
+    return _reporter is not None
+
+
+__all__ = [
+    'LoadReporter', 'ProxyHandler', 'SessionRouter', 'WebSocketProxyHandler',
+    'Worker', 'is_worker'
+]
@@ -31,13 +31,14 @@ from .state import state
 if t.TYPE_CHECKING:
     import os
 
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from bokeh.embed.standalone import ThemeLike
     from jinja2 import Template
 
     from ..template.base import BaseTemplate
     from ..viewable import Viewable
+    from .embed import EmbedProgress
     from .resources import MODES
 
 #---------------------------------------------------------------------
@@ -194,9 +195,10 @@ def save(
     json_prefix: str = '',
     save_path: str = './',
     load_path: str | None = None,
-    progress: bool = True,
+    progress: bool | Callable[[EmbedProgress], None] = True,
     embed_states={},
     as_png: bool | None = None,
+    embed_processes: int = 1,
     **kwargs
 ) -> None:
     """
@@ -230,13 +232,16 @@ def save(
       The path to save json files to
     load_path: str (default=None)
       The path or URL the json files will be loaded from.
-    progress: boolean (default=True)
-      Whether to report progress
+    progress: boolean or callable (default=True)
+      Whether to report progress, or a callback invoked with an
+      EmbedProgress after each state is explored
     embed_states: dict (default={})
       A dictionary specifying the widget values to embed for each widget
     as_png: boolean (default=None)
         To save as a .png. If None save_png will be true if filename is
         string and ends with png.
+    embed_processes: int (default=1)
+      The number of worker processes to explore the embedded states in
     """
     from ..pane import PaneBase
     from ..template import BaseTemplate
@@ -284,7 +289,8 @@ def save(
             if embed:
                 embed_state(
                     panel, model, doc, max_states, max_opts, embed_json,
-                    json_prefix, save_path, load_path, progress, embed_states
+                    json_prefix, save_path, load_path, progress, embed_states,
+                    embed_processes
                 )
             else:
                 add_to_doc(model, doc, True)
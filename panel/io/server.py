@@ -18,7 +18,7 @@ import time
 import typing as t
 import uuid
 
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from html import escape
 from urllib.parse import urlparse
 
@@ -54,6 +54,7 @@ from bokeh.util.token import (
     get_session_id, get_token_payload,
 )
 # Tornado imports
+from tornado.httputil import HTTPHeaders, HTTPServerRequest
 from tornado.ioloop import IOLoop
 from tornado.web import (
     HTTPError, RequestHandler, StaticFileHandler, authenticated,
@@ -68,15 +69,17 @@ from .application import build_applications
 from .document import (  # noqa
     _cleanup_doc, init_doc, unlocked, with_lock,
 )
+from .content import resolve_content
 from .liveness import LivenessHandler
 from .loading import LOADING_INDICATOR_CSS_CLASS
 from .logging import LOG_SESSION_CREATED
 from .reload import record_modules
 from .resources import (
-    BASE_TEMPLATE, CDN_DIST, COMPONENT_PATH, DIST_DIR, ERROR_TEMPLATE,
-    LOCAL_DIST, Resources, _env, bundle_resources, patch_model_css,
-    resolve_custom_path,
+    BASE_TEMPLATE, CDN_DIST, COMPONENT_PATH, CONTENT_PATH, DIST_DIR,
+    ERROR_TEMPLATE, LOCAL_DIST, Resources, _env, bundle_resources, patch_model_css,
+    render_bundle, resolve_custom_path,
 )
+from .router import SESSION_HEADER, is_worker
 from .session import generate_session
 from .state import set_curdoc, state
 from .threads import StoppableThread
@@ -288,6 +291,11 @@ state._on_session_created_internal.append(_initialize_session_info)
 # Bokeh patches
 #---------------------------------------------------------------------
 
+@lru_cache(maxsize=32)
+def _template_from_string(template: str) -> Template:
+    return _env.from_string("{% extends base %}\n" + template)
+
+
 def html_page_for_render_items(
     bundle: Bundle | tuple[str, str], docs_json: dict[ID, DocJson],
     render_items: list[RenderItem], title: str, template: Template | str | None = None,
@@ -347,7 +355,7 @@ def html_page_for_render_items(
     if template is None:
         tmpl = BASE_TEMPLATE
     elif isinstance(template, str):
-        tmpl = _env.from_string("{% extends base %}\n" + template)
+        tmpl = _template_from_string(template)
     else:
         tmpl = template
 
@@ -389,7 +397,7 @@ def server_html_page_for_session(
         template = BASE_TEMPLATE
 
     with set_curdoc(doc):
-        bundle = bundle_resources(doc.roots, resources)
+        bundle = render_bundle(doc.roots, resources)
         html = html_page_for_render_items(
             bundle, {}, [render_item], title, template=template,
             template_variables=template_variables
@@ -551,6 +559,76 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
                     session.block_expiration()
         return session
 
+    def _poolable(self) -> bool:
+        """
+        Whether the request may be handed a pooled session. Pooled
+        sessions are initialized from an anonymous request, so pooling
+        is refused if the application may depend on the identity of the
+        user, i.e. if authentication is enabled or headers or cookies
+        are explicitly included, and if the request has query arguments.
+        """
+        app = self.application
+        auth = app.auth_provider
+        return not (
+            auth.get_user is not None or auth.get_user_async is not None or
+            config.authorize_callback or app.include_headers or
+            app.include_cookies or self.request.query_arguments
+        )
+
+    def _anonymous_request(self) -> tuple[HTTPServerRequest, TokenPayload]:
+        """
+        Returns a request for the current path without any headers,
+        cookies or arguments and its token payload, which pooled
+        sessions are initialized with.
+        """
+        request = HTTPServerRequest(
+            method='GET', uri=self.request.path, version=self.request.version,
+            headers=HTTPHeaders({'Host': self.request.host})
+        )
+        request.protocol = self.request.protocol
+        payload: TokenPayload = {'headers': {}, 'cookies': {}, 'arguments': {}}
+        payload.update(self.application_context.application.process_request(request))  # type: ignore
+        return request, payload
+
+    def _acquire_pooled_session(self, payload: TokenPayload) -> tuple[ServerSession, str] | None:
+        """
+        Hands out a pre-initialized session and a token for it from
+        the pool of the requested route, creating the pool on the
+        first request.
+        """
+        from .session import SessionPool
+        if not self._poolable():
+            return None
+        key_func = config.session_key_func or (lambda r: (r.path, r.arguments.get('theme', [b'default'])[0].decode('utf-8')))
+        key = key_func(self.request)
+        pool = state._session_pools.get(key)
+        if pool is None:
+            request, pool_payload = self._anonymous_request()
+            pool = state._session_pools[key] = SessionPool(
+                self.application_context, self.application, request,
+                pool_payload, config.session_pool_size
+            )
+        pool.max_size = config.session_pool_size
+        session = pool.acquire()
+        if session is None:
+            return None
+        app = self.application
+        token = generate_jwt_token(
+            session.id,
+            secret_key=app.secret_key,
+            signed=app.sign_sessions,
+            expiration=app.session_token_expiration,
+            extra_payload=payload
+        )
+        # Associate the session with the request it is handed out to
+        session_context = session.document.session_context
+        session_context._request = RequestProxy(
+            self.request, arguments=payload.get('arguments'),
+            cookies=payload.get('cookies'), headers=payload.get('headers')
+        )
+        session_context._token = session._token = token
+        return session, token
+
     def _generate_token_payload(self) -> TokenPayload:
         app = self.application
         if app.include_headers is None:
@@ -668,8 +746,13 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
         app = self.application
         key_func = state._session_key_funcs.get(self.request.path, lambda r: r.path)
         old_request = key_func(self.request) in state._sessions
-        session = await self.get_session()
-        if old_request and state._sessions.get(key_func(self.request)) is session:
+        pooled = self._acquire_pooled_session(payload) if config.session_pool_size else None
+        if pooled is not None:
+            session, token = pooled
+        else:
+            session = await self.get_session()
+            token = session.token
+        if pooled is None and old_request and state._sessions.get(key_func(self.request)) is session:
             session_id = generate_session_id(
                 secret_key=self.application.secret_key,
                 signed=self.application.sign_sessions
@@ -693,8 +776,6 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
                         token
                     )
                 )
-        else:
-            token = session.token
         logger.info(LOG_SESSION_CREATED, id(session.document))
         with set_curdoc(session.document):
             resources = Resources.from_bokeh(self.application.resources())
@@ -711,6 +792,9 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
             else:
                 page = self._render_auth_error(auth_error)
 
+        if is_worker():
+            # Allows the session router to route the websocket to this process
+            self.set_header(SESSION_HEADER, get_session_id(token))
         self.set_header("Content-Type", 'text/html')
         self.write(page)
 
@@ -745,6 +829,8 @@ class AutoloadJsHandler(BkAutoloadJsHandler):
                 app_path, absolute_url, absolute=True
             )
 
+        if is_worker():
+            self.set_header(SESSION_HEADER, session.id)
         self.set_header("Content-Type", 'application/javascript')
         self.write(js)
 
@@ -1024,6 +1110,62 @@ class ComponentResourceHandler(StaticFileHandler):
         return absolute_path
 
 
+class ContentResourceHandler(AuthenticatedStaticFileHandler):
+    """
+    A handler that serves binary pane content, e.g. large images and
+    media, registered in the content-addressed store of
+    `panel.io.content` by its hash. Since the content of a URL can
+    never change it may be cached indefinitely and supports range
+    requests, e.g. to allow seeking in audio and video.
+
+    /<endpoint>/<hash>.<extension>
+    """
+
+    def initialize(self, path: str = '', default_filename: str | None = None):
+        self.root = path
+        self.default_filename = default_filename
+
+    def parse_url_path(self, path: str) -> str:
+        return path.split('.')[0]
+
+    @classmethod
+    def get_absolute_path(cls, root: str, path: str) -> str:
+        return path
+
+    def validate_absolute_path(self, root: str, absolute_path: str) -> str:
+        if (content := resolve_content(absolute_path)) is None:
+            raise HTTPError(404)
+        self._content, self._mime_type = content
+        return absolute_path
+
+    @classmethod
+    def get_content(cls, abspath: str, start: int | None = None, end: int | None = None) -> bytes:
+        if (content := resolve_content(abspath)) is None:
+            raise HTTPError(404)
+        return content[0][start:end]
+
+    def get_content_size(self) -> int:
+        return len(self._content)
+
+    def get_content_type(self) -> str:
+        return self._mime_type
+
+    def get_modified_time(self) -> None:
+        return None
+
+    def compute_etag(self) -> str:
+        return f'"{self.absolute_path}"'
+
+    def should_return_304(self) -> bool:
+        return bool(self.request.headers.get("If-None-Match")) and self.check_etag_header()
+
+    def get_cache_time(self, path: str, modified: dt.datetime | None, mime_type: str) -> int:
+        return self.CACHE_MAX_AGE
+
+    def set_extra_headers(self, path: str) -> None:
+        self.set_header("Cache-Control", f"max-age={self.CACHE_MAX_AGE}, immutable")
+
+
 def serve(
     panels: TViewableFuncOrPath | dict[str, TViewableFuncOrPath],
     port: int = 0,
@@ -1148,6 +1290,9 @@ def get_static_routes(static_dirs):
     patterns.append((
         f'/{COMPONENT_PATH}(.*)', ComponentResourceHandler, {}
     ))
+    patterns.append((
+        f'/{CONTENT_PATH}(.*)', ContentResourceHandler, {}
+    ))
     return patterns
 
 def get_server(
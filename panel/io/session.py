@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import time
 import typing as t
 
+from collections import deque
+
 from bokeh.document import Document
 from bokeh.server.contexts import BokehSessionContext, _RequestProxy
-from bokeh.server.session import ServerSession
+from bokeh.server.session import ServerSession, current_time
 from bokeh.settings import settings
 from bokeh.util.token import generate_jwt_token, generate_session_id
+from tornado.ioloop import IOLoop
 
 if t.TYPE_CHECKING:
     from bokeh.document.events import DocumentPatchedEvent
@@ -69,3 +75,139 @@ def generate_session(application, request=None, payload=None, initialize=True):
     session = ServerSessionStub(session_id, doc, io_loop=None, token=token)
     doc.callbacks._session_callbacks = callbacks
     return session
+
+
+class SessionPool:
+    """
+    Pool of pre-initialized sessions for a single route, which are
+    handed out to incoming requests instead of running the application
+    when the request arrives. After each request the pool is refilled
+    in the background, one session at a time, up to a target size
+    derived from the recently observed arrival rate.
+
+    Since pooled sessions are initialized before the request they
+    are handed out to arrives they are only suitable for applications
+    whose initial state does not depend on the request, i.e. the
+    same applications session reuse is suitable for. Sessions are
+    therefore always initialized from the anonymous request and
+    payload the pool was created with, never from the request of a
+    client.
+    """
+
+    # Time constant (in seconds) of the decaying arrival rate estimate,
+    # the pool targets the number of requests expected in this window
+    window: t.ClassVar[float] = 10
+
+    def __init__(
+        self, application_context, tornado_app, request, payload: dict[str, t.Any],
+        max_size: int
+    ):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self._application_context = application_context
+        self._tornado_app = tornado_app
+        self._request = request
+        self._payload = payload
+        self._sessions: deque[ServerSession] = deque()
+        self._rate = 0.
+        self._last_arrival: float | None = None
+        self._filling = False
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def target_size(self) -> int:
+        if self._last_arrival is None:
+            return min(self.max_size, 1)
+        rate = self._rate * math.exp((self._last_arrival - time.monotonic()) / self.window)
+        return min(self.max_size, max(1, math.ceil(rate * self.window)))
+
+    @property
+    def stats(self) -> dict[str, t.Any]:
+        return {
+            'size': self.size, 'target_size': self.target_size,
+            'hits': self.hits, 'misses': self.misses, 'created': self.created
+        }
+
+    def _record_arrival(self) -> None:
+        now = time.monotonic()
+        if self._last_arrival is not None:
+            self._rate *= math.exp((self._last_arrival - now) / self.window)
+        self._rate += 1 / self.window
+        self._last_arrival = now
+
+    def acquire(self) -> ServerSession | None:
+        """
+        Returns a pooled session (or None if the pool is exhausted)
+        and schedules a refill of the pool.
+        """
+        self._record_arrival()
+        session = None
+        while self._sessions:
+            candidate = self._sessions.popleft()
+            if not candidate.destroyed:
+                session = candidate
+                break
+        if session is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Ensure the session does not count as unused since it was created
+            session._last_unsubscribe_time = current_time()
+            session.unblock_expiration()
+        self.refill()
+        return session
+
+    def refill(self) -> None:
+        """
+        Schedules the pool to be refilled up to its target size.
+        """
+        if not self._filling:
+            IOLoop.current().add_callback(self._fill)
+
+    async def _fill(self) -> None:
+        if self._filling:
+            return
+        self._filling = True
+        try:
+            while len(self._sessions) < self.target_size:
+                session = await self._create_session()
+                self._sessions.append(session)
+                # Give pending requests a chance to be handled
+                await asyncio.sleep(0)
+        except Exception as e:
+            log.error("Failed to create pooled session: %s", e)
+        finally:
+            self._filling = False
+
+    async def _create_session(self) -> ServerSession:
+        app = self._tornado_app
+        session_id = generate_session_id(
+            secret_key=app.secret_key, signed=app.sign_sessions
+        )
+        token = generate_jwt_token(
+            session_id,
+            secret_key=app.secret_key,
+            signed=app.sign_sessions,
+            expiration=app.session_token_expiration,
+            extra_payload=self._payload
+        )
+        session = await self._application_context.create_session_if_needed(
+            session_id, self._request, token
+        )
+        session.block_expiration()
+        self.created += 1
+        return session
+
+    def clear(self) -> None:
+        """
+        Releases all pooled sessions, allowing them to be expired.
+        """
+        while self._sessions:
+            session = self._sessions.popleft()
+            if not session.destroyed:
+                session.unblock_expiration()
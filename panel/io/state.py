@@ -5,10 +5,10 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import hashlib
 import inspect
 import logging
 import os
-import shutil
 import sys
 import threading
 import time
@@ -16,7 +16,7 @@ import typing as t
 
 from collections import Counter, defaultdict
 from collections.abc import (
-    Callable, Coroutine, Hashable, Iterator, Iterator as TIterator,
+    Awaitable, Callable, Coroutine, Hashable, Iterator, Iterator as TIterator,
 )
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
@@ -54,11 +54,12 @@ if t.TYPE_CHECKING:
     from ..widgets.indicators import BooleanIndicator
     from .application import TViewableFuncOrPath
     from .browser import BrowserInfo
-    from .cache import _Stack
+    from .cache import CacheStore, _Stack
     from .callbacks import PeriodicCallback
     from .location import Location
     from .notifications import NotificationAreaBase
     from .server import StoppableThread
+    from .session import SessionPool
 
     T = t.TypeVar("T")
     K = t.TypeVar('K', bound=Hashable)
@@ -87,6 +88,15 @@ def curdoc_locked() -> Document | None:
 
 class _Undefined: pass
 
+def _run_coroutine(fn, **kwargs):
+    return asyncio.run(fn(**kwargs))
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
 Tat: t.TypeAlias = dt.datetime | Callable[[dt.datetime], dt.datetime] | TIterator[dt.datetime]
 
 class _state(param.Parameterized):
@@ -215,9 +225,18 @@ class _state(param.Parameterized):
     # Locks
     _cache_locks: t.ClassVar[dict[str | tuple[t.Any, ...], threading.Lock]] = {'main': threading.Lock()}
 
+    # Computations of as_cached in progress and statistics per key
+    _cache_futures: t.ClassVar[dict[tuple[t.Any, ...], Future]] = {}
+    _cache_loops: t.ClassVar[WeakKeyDictionary[Future, asyncio.AbstractEventLoop]] = WeakKeyDictionary()
+    _cache_stats: t.ClassVar[dict[tuple[t.Any, ...], dict[str, t.Any]]] = {}
+
+    # Stores backing as_cached if config.cache_store is not 'memory'
+    _cache_stores: t.ClassVar[dict[str, CacheStore]] = {}
+
     # Sessions
     _sessions: t.ClassVar[dict[Hashable, ServerSession]] = {}
     _session_key_funcs: t.ClassVar[dict[str, Callable[[t.Any], t.Any]]] = {}
+    _session_pools: t.ClassVar[dict[Hashable, SessionPool]] = {}
 
     # Layout editor
     _cell_outputs: t.ClassVar[defaultdict[Hashable, list[t.Any]]] = defaultdict(list)
@@ -539,6 +558,107 @@ class _state(param.Parameterized):
         for cb in self._on_session_destroyed:
             session_context._document.on_session_destroyed(cb)
 
+    def _as_cached_store(
+        self, cache_key: tuple[t.Any, ...], fn: Callable[..., T],
+        ttl: int | None, kwargs: dict[str, t.Any]
+    ) -> T:
+        """
+        Implements as_cached on top of the configured cache store,
+        allowing entries to be shared between processes.
+        """
+        from ..config import config
+        from .cache import _TIME_FN, _generate_hash, _get_store_type
+
+        store = self._cache_stores.get(config.cache_store)
+        if store is None:
+            store = _get_store_type(config.cache_store)('as_cached')
+            self._cache_stores[config.cache_store] = store
+        hash_value = hashlib.md5(_generate_hash(cache_key)).hexdigest()
+        with store.lock(hash_value):
+            now = _TIME_FN()
+            try:
+                ret, expiry = store.hit(hash_value, now)
+            except KeyError:
+                ret, expiry = _Undefined, None
+            if ret is _Undefined or (expiry is not None and expiry < now):
+                ret = fn(**kwargs)
+                store.put(hash_value, (ret, now + ttl if ttl else None), now)
+        return ret
+
+    def _cache_lookup(
+        self, cache_key: tuple[t.Any, ...]
+    ) -> tuple[t.Any, Future | None, bool]:
+        """
+        Looks up a value cached by as_cached, returning the value if
+        it is cached and has not expired or otherwise a Future of the
+        computation and whether the caller has to compute it.
+        """
+        from concurrent.futures import Future
+        with self._cache_locks['main']:
+            stats = self._cache_stats.get(cache_key)
+            if stats is None:
+                stats = self._cache_stats[cache_key] = {
+                    'hits': 0, 'waits': 0, 'misses': 0, 'time': 0,
+                    'total_time': 0, 'size': 0
+                }
+            if cache_key in self.cache:
+                ret, expiry = self.cache[cache_key]
+                if expiry is None or expiry >= time.monotonic():
+                    stats['hits'] += 1
+                    return ret, None, False
+            if cache_key in self._cache_futures:
+                stats['waits'] += 1
+                return _Undefined, self._cache_futures[cache_key], False
+            stats['misses'] += 1
+            future = self._cache_futures[cache_key] = Future()
+            return _Undefined, future, True
+
+    def _cache_discard(self, cache_key: tuple[t.Any, ...], future: Future) -> None:
+        with self._cache_locks['main']:
+            if self._cache_futures.get(cache_key) is future:
+                del self._cache_futures[cache_key]
+            if cache_key not in self.cache:
+                self._cache_stats.pop(cache_key, None)
+
+    def _prune_cache_stats(self) -> None:
+        """
+        Drops the statistics of values which were evicted from the cache.
+        """
+        with self._cache_locks['main']:
+            for cache_key in list(self._cache_stats):
+                if cache_key not in self.cache and cache_key not in self._cache_futures:
+                    del self._cache_stats[cache_key]
+
+    def _cache_put(
+        self, cache_key: tuple[t.Any, ...], future: Future, value: t.Any,
+        ttl: int | None, duration: float
+    ) -> None:
+        from .cache import _sizeof
+        size = _sizeof(value)
+        with self._cache_locks['main']:
+            self.cache[cache_key] = (value, time.monotonic() + ttl if ttl else None)
+            if self._cache_futures.get(cache_key) is future:
+                del self._cache_futures[cache_key]
+            stats = self._cache_stats.get(cache_key)
+            if stats is not None:
+                stats['time'] = duration
+                stats['total_time'] += duration
+                stats['size'] = size
+        future.set_result(value)
+
+    def _cache_compute(
+        self, cache_key: tuple[t.Any, ...], future: Future, fn: Callable[..., t.Any],
+        ttl: int | None, kwargs: dict[str, t.Any]
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            ret = fn(**kwargs)
+        except BaseException as e:
+            self._cache_discard(cache_key, future)
+            future.set_exception(e)
+            return
+        self._cache_put(cache_key, future, ret, ttl, time.perf_counter()-start)
+
     #----------------------------------------------------------------
     # Public Methods
     #----------------------------------------------------------------
@@ -579,25 +699,108 @@ class _state(param.Parameterized):
         Returns the value returned by the cache or the value in
         the cache.
         """
+        from ..config import config
         cache_key = (key,)+tuple((k, v) for k, v in sorted(kwargs.items()))
-        new_expiry = time.monotonic() + ttl if ttl else None
+        if config.cache_store != 'memory':
+            return self._as_cached_store(cache_key, fn, ttl, kwargs)
+        ret, future, owner = self._cache_lookup(cache_key)
+        if future is None:
+            return ret
+        elif owner:
+            self._cache_compute(cache_key, future, fn, ttl, kwargs)
+        elif not future.done() and self._cache_loops.get(future, _Undefined) is _running_loop():
+            # The value is computed by a coroutine on the event loop
+            # of this thread, waiting for it would block forever
+            return fn(**kwargs)
+        return future.result()
+
+    async def as_cached_async(
+        self, key: str, fn: Callable[..., T | Awaitable[T]], ttl: int | None = None, **kwargs
+    ) -> T:
+        """
+        Awaitable variant of `as_cached`, which caches the return value
+        of a function or coroutine globally across user sessions,
+        memoizing on the given key and supplied keyword arguments.
+
+        Concurrent calls share a single computation and wait for it
+        without blocking the event loop. Synchronous functions are
+        computed on the thread pool (if `config.nthreads` is set) or
+        the default executor of the event loop.
+
+        >>> data = await pn.state.as_cached_async('data', load_data, name='penguins')
+
+        Parameters
+        ----------
+        key: (str)
+          The key to cache the return value under.
+        fn: (callable)
+          The function, callable or coroutine function whose return
+          value will be cached.
+        ttl: (int)
+          The number of seconds to keep an item in the cache, or None
+          if the cache should not expire. The default is None.
+        **kwargs: dict
+          Additional keyword arguments to supply to the function,
+          which will be memoized over as well.
+
+        Returns
+        -------
+        Returns the value returned by the cache or the value in
+        the cache.
+        """
+        from ..config import config
+        loop = asyncio.get_running_loop()
+        is_coroutine = param.parameterized.iscoroutinefunction(fn)
+        cache_key = (key,)+tuple((k, v) for k, v in sorted(kwargs.items()))
+        if config.cache_store != 'memory':
+            if is_coroutine:
+                fn = partial(_run_coroutine, fn)
+            return await loop.run_in_executor(
+                self._thread_pool, self._as_cached_store, cache_key, fn, ttl, kwargs
+            )
+        ret, future, owner = self._cache_lookup(cache_key)
+        if future is None:
+            return ret
+        elif owner and is_coroutine:
+            self._cache_loops[future] = loop
+            start = time.perf_counter()
+            error = None
+            try:
+                ret = await fn(**kwargs)
+                self._cache_put(cache_key, future, ret, ttl, time.perf_counter()-start)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                # Always resolve the future so that waiters do not hang
+                if not future.done():
+                    self._cache_discard(cache_key, future)
+                    if error is None or isinstance(error, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(error)
+        elif owner:
+            await loop.run_in_executor(
+                self._thread_pool, self._cache_compute, cache_key, future, fn, ttl, kwargs
+            )
+        return await asyncio.wrap_future(future)
+
+    @property
+    def cache_stats(self) -> list[dict[str, t.Any]]:
+        """
+        Statistics of the values cached with `as_cached` in this
+        process, listing the key, keyword arguments, number of hits,
+        of calls which waited on a computation in progress and of
+        misses, the time of the last computation and the total time
+        spent computing the value (in seconds) and its approximate
+        size (in bytes).
+        """
+        self._prune_cache_stats()
         with self._cache_locks['main']:
-            if cache_key in self._cache_locks:
-                lock = self._cache_locks[cache_key]
-            else:
-                self._cache_locks[cache_key] = lock = threading.Lock()
-        try:
-            with lock:
-                if cache_key in self.cache:
-                    ret, expiry = self.cache[cache_key]
-                else:
-                    ret, expiry = _Undefined, None
-                if ret is _Undefined or (expiry is not None and expiry < time.monotonic()):
-                    ret, _ = self.cache[cache_key] = (fn(**kwargs), new_expiry)
-        finally:
-            if not lock.locked() and cache_key in self._cache_locks:
-                del self._cache_locks[cache_key]
-        return ret
+            return [
+                dict(key=cache_key[0], kwargs=dict(cache_key[1:]), **stats)
+                for cache_key, stats in self._cache_stats.items()
+            ]
 
     def add_periodic_callback(
         self, callback: Callable[[], None] | Coroutine[t.Any, t.Any, None],
@@ -695,13 +898,9 @@ class _state(param.Parameterized):
         """
         for cache in self._memoize_cache.values():
             cache.clear()
-            if hasattr(cache, 'directory'):
-                cache.cache.close()
-                try:
-                    shutil.rmtree(cache.directory)
-                except OSError:  # Windows wonkiness
-                    pass
+            cache.close()
         self._memoize_cache.clear()
+        self._prune_cache_stats()
 
     def _execute_on_thread(self, doc, callback):
         with set_curdoc(doc):
@@ -891,6 +1090,7 @@ class _state(param.Parameterized):
         self._connected.clear()
         self._loaded.clear()
         self.cache.clear()
+        self._cache_stats.clear()
         self._busy_cleanup_scheduled = None
         with edit_readonly(self):
             self._busy_counter = []
@@ -900,10 +1100,17 @@ class _state(param.Parameterized):
             self._thread_pool = None
         self._sessions.clear()
         self._session_key_funcs.clear()
+        for pool in self._session_pools.values():
+            pool.clear()
+        self._session_pools.clear()
         self._on_session_created.clear()
         self._on_session_destroyed.clear()
         self._stylesheets.clear()
         self._scheduled.clear()
+        for callbacks in list(self._periodic.values()):
+            for cb in callbacks:
+                with suppress(Exception):
+                    cb.stop()
         self._periodic.clear()
 
     def schedule_task(
@@ -1278,6 +1485,26 @@ class _state(param.Parameterized):
         """
         return self.curdoc.session_context.request.arguments if self.curdoc and self.curdoc.session_context else {}
 
+    @property
+    def session_pool_info(self) -> dict[Hashable, dict[str, t.Any]]:
+        """
+        Returns the size, target size, hits, misses and number of created
+        sessions of the session pool of each route if
+        `config.session_pool_size` is enabled.
+        """
+        return {key: pool.stats for key, pool in self._session_pools.items()}
+
+    @property
+    def session_write_info(self) -> dict[str, dict[str, int]]:
+        """
+        Returns the number of queued messages and bytes, the number of
+        sent messages and bytes, the number of coalesced events and the
+        number of dropped connections of each session which has written
+        messages to a websocket.
+        """
+        from .document import _session_write_info
+        return _session_write_info()
+
     @property
     def route_params(self) -> dict[str, str]:
         """
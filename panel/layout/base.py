@@ -44,6 +44,34 @@ _SCROLL_MAPPING = {
 _row = namedtuple("row", ["children"]) # type: ignore
 _col = namedtuple("col", ["children"]) # type: ignore
 
+_SIZING_PROPS = ('sizing_mode', 'width', 'height', 'min_width', 'min_height')
+
+# Cache of the class defaults of sizing properties keyed by model type
+_SIZING_DEFAULTS: dict[type, tuple[t.Any, ...]] = {}
+
+
+def _sizing_props(model: t.Any) -> tuple[t.Any, ...]:
+    """
+    Returns the sizing_mode, width, height, min_width and min_height
+    of a child model. Bokeh property access resolves themes and
+    defaults on every lookup, which dominates the cost of inferring
+    the sizing of layouts with many children, so we read explicitly
+    set values directly and cache the class defaults.
+    """
+    values = getattr(model, '_property_values', None)
+    if values is None or model.themed_values():
+        return tuple(getattr(model, p) for p in _SIZING_PROPS)
+    cls = type(model)
+    defaults = _SIZING_DEFAULTS.get(cls)
+    if defaults is None:
+        defaults = _SIZING_DEFAULTS[cls] = tuple(
+            cls.lookup(p).class_default(cls) for p in _SIZING_PROPS
+        )
+    return tuple(
+        values[p] if p in values else default
+        for p, default in zip(_SIZING_PROPS, defaults)
+    )
+
 
 class SizingModeMixin:
     """
@@ -96,7 +124,7 @@ class SizingModeMixin:
         explicit_width = getattr(self, '_explicit_width_policy', False)
         explicit_height = getattr(self, '_explicit_height_policy', False)
         for child in children:
-            smode = child.sizing_mode
+            smode, cwidth, cheight, cmin_width, cmin_height = _sizing_props(child)
             if smode and 'scale' in smode:
                 scale = True
 
@@ -105,11 +133,11 @@ class SizingModeMixin:
             expand_width |= width_expanded
             expand_height |= height_expanded
             if width_expanded:
-                width = child.min_width
+                width = cmin_width
             else:
-                width = child.width
-                if not child.width:
-                    width = child.min_width
+                width = cwidth
+                if not cwidth:
+                    width = cmin_width
             if width:
                 if isinstance(margin, tuple):
                     if len(margin) == 2:
@@ -121,13 +149,13 @@ class SizingModeMixin:
                 widths.append(width)
 
             if height_expanded:
-                height = child.min_height
+                height = cmin_height
             else:
-                height = child.height
+                height = cheight
                 if height:
                     all_expand_height = False
                 else:
-                    height = child.min_height
+                    height = cmin_height
             if height:
                 if isinstance(margin, tuple):
                     if len(margin) == 2:
@@ -337,8 +365,10 @@ class Panel(Reactive, SizingModeMixin):
         from ..pane.base import RerenderError
         new_models, old_models = [], []
 
+        # Diff by identity in linear time
+        current_ids = {id(obj) for obj in self.objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in current_ids:
                 obj._cleanup(root)
 
         current_objects = list(self.objects)
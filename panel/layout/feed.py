@@ -5,7 +5,7 @@ import typing as t
 import param
 
 from ..models.feed import Feed as PnFeed, ScrollButtonClick, ScrollLatestEvent
-from ..util import edit_readonly, isIn
+from ..util import edit_readonly
 from .base import Column
 
 if t.TYPE_CHECKING:
@@ -171,20 +171,31 @@ class Feed(Column):
     ):
         # If no previously visible objects are visible now, reset the visible range
         events = self._in_process__events.get(doc, {})
-        if self._last_synced and 'visible_range' not in events and not any(isIn(obj, self.objects) for obj in old_objects[slice(*self._last_synced)]):
+        current_ids = {id(obj) for obj in self.objects}
+        if (self._last_synced and 'visible_range' not in events and
+            not any(id(obj) in current_ids for obj in old_objects[slice(*self._last_synced)])):
             with edit_readonly(self):
                 self.visible_range = None
 
         from ..pane.base import RerenderError
         new_models, old_models = [], []
+        last_synced = self._last_synced
         self._last_synced = self._synced_range
 
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in current_ids:
                 obj._cleanup(root)
 
+        # Free the models of objects which were scrolled out of the
+        # synced range, they are re-rendered when scrolled back into view
         current_objects = list(self.objects)
         ref = root.ref['id']
+        if last_synced:
+            synced_ids = {id(obj) for obj in current_objects[slice(*self._last_synced)]}
+            for obj in old_objects[slice(*last_synced)]:
+                if (id(obj) in current_ids and id(obj) not in synced_ids and
+                    ref in obj._models):
+                    obj._cleanup(root)
         for i in range(*self._last_synced):
             pane = current_objects[i]
             if ref in pane._models:
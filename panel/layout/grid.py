@@ -343,8 +343,10 @@ class GridSpec(Panel):
         if isinstance(old_objects, dict):
             old_objects = list(old_objects.values())
 
+        current_ids = {id(obj) for obj in current_objects}
+        old_ids = {id(obj) for obj in old_objects}
         for old in old_objects:
-            if old not in current_objects:
+            if id(old) not in current_ids:
                 old._cleanup(root)
 
         children, old_children = [], []
@@ -371,7 +373,7 @@ class GridSpec(Panel):
             obj.param.update(**{k: v for k, v in properties.items()
                                    if not obj.param[k].readonly})
 
-            if obj in old_objects:
+            if id(obj) in old_ids:
                 child, _ = obj._models[root.ref['id']]
                 old_children.append(child)
             else:
@@ -175,8 +175,10 @@ class Tabs(NamedListPanel):
         ref = root.ref['id']
         panels = self._panels[ref]
         rendered = self._rendered[ref]
+        current_ids = {id(obj) for obj in self.objects}
+        old_ids = {id(obj) for obj in old_objects}
         for obj in old_objects:
-            if obj in self.objects:
+            if id(obj) in current_ids:
                 continue
             obj._cleanup(root)
             panels.pop(id(obj), None)
@@ -195,7 +197,7 @@ class Tabs(NamedListPanel):
             # If object has not changed, we have not toggled between
             # hidden and unhidden state or the tabs are not
             # dynamic then reuse the panel
-            if (pane in old_objects and pref in panels and
+            if (pref in old_ids and pref in panels and
                 (not (hidden ^ prev_hidden) or not (self.dynamic or prev_hidden))):
                 new_models.append(panel)
                 continue
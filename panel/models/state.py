@@ -1,5 +1,5 @@
 from bokeh.core.properties import (
-    Any, Bool, Dict, List,
+    Any, Bool, Dict, List, String,
 )
 from bokeh.models import Model
 
@@ -8,7 +8,13 @@ class State(Model):
 
     json = Bool(False, help="Whether the values point to json files")
 
-    state = Dict(Any, Any, help="Contains the recorded state")
+    state = Dict(Any, Any, help="""
+        Maps from the values of each widget to the content hash of the
+        patch recorded for that state""")
+
+    patches = Dict(String, Any, help="""
+        Maps from content hash to the recorded patch or, if json is
+        enabled, the path of the json file containing it""")
 
     widgets = Dict(Any, Any)
 
@@ -26,6 +26,7 @@ export namespace State {
 
   export type Props = Model.Props & {
     json: p.Property<boolean>
+    patches: p.Property<{[key: string]: any}>
     state: p.Property<object>
     values: p.Property<any[]>
     widgets: p.Property<{[key: string]: number}>
@@ -54,17 +55,24 @@ export class State extends Model {
     }
   }
 
-  _receive_json(result: string, path: string): void {
-    const state = JSON.parse(result)
-    this._cache[path] = state
-    let current: any = this.state
-    for (const i of this.values) {
-      if (current instanceof Map) {
-        current = current.get(i)
+  _resolve_patch(values: any[]): any {
+    let state: any = this.state
+    for (const i of values) {
+      if (state instanceof Map) {
+        state = state.get(i)
       } else {
-        current = current[i]
+        state = state[i]
       }
     }
+    // Patches are deduplicated and referenced by their content hash
+    const patches: any = this.patches
+    return patches instanceof Map ? patches.get(state) : patches[state]
+  }
+
+  _receive_json(result: string, path: string): void {
+    const state = JSON.parse(result)
+    this._cache[path] = state
+    const current = this._resolve_patch(this.values)
     if (current === path) {
       this.apply_state(state)
     } else if (this._cache[current]) {
@@ -76,14 +84,7 @@ export class State extends Model {
     const values: any[] = copy(this.values)
     const index: any = this.widgets[widget.id]
     values[index] = value
-    let state: any = this.state
-    for (const i of values) {
-      if (state instanceof Map) {
-        state = state.get(i)
-      } else {
-        state = state[i]
-      }
-    }
+    const state = this._resolve_patch(values)
     this.values = values
     if (this.json) {
       if (this._cache[state]) {
@@ -103,6 +104,7 @@ export class State extends Model {
 
     this.define<State.Props>(({Any, Bool}) => ({
       json:    [ Bool, false ],
+      patches: [ Any,        {} ],
       state:   [ Any,        {} ],
       widgets: [ Any,        {} ],
       values:  [ Any,        [] ],
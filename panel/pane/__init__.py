@@ -29,6 +29,8 @@ other layouts, then Panel will automatically wrap it in the right pane.
 For more detail see the Getting Started Guide
 https://panel.holoviz.org/getting_started/index.html
 """
+from typing import TYPE_CHECKING
+
 from .alert import Alert  # noqa
 from .base import Pane, PaneBase, panel  # noqa
 from .deckgl import DeckGL  # noqa
@@ -55,9 +57,14 @@ from .vega import Vega  # noqa
 from .vizzu import Vizzu  # noqa
 from .vtk import VTK, VTKVolume  # noqa
 
-from ..param import (  # noqa  # isort: skip
-    ParamFunction, ParamMethod, ParamRef, ReactiveExpr,
-)
+# Ensures the param panes are registered, the module may still be
+# initializing if it was imported first
+from .. import param as _param  # noqa  # isort: skip
+
+if TYPE_CHECKING:
+    from ..param import (  # noqa
+        ParamFunction, ParamMethod, ParamRef, ReactiveExpr,
+    )
 
 __all__ = (
     "Alert",
@@ -104,3 +111,9 @@ __all__ = (
     "VTKVolume",
     "YT"
 )
+
+
+def __getattr__(name: str):
+    if name in ('ParamFunction', 'ParamMethod', 'ParamRef', 'ReactiveExpr'):
+        return getattr(_param, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
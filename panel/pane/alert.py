@@ -41,6 +41,7 @@ class Alert(Markdown):
         'warning', 'info', 'light', 'dark'.""")  # type: ignore[assignment, ty:invalid-assignment]
 
     priority: t.ClassVar[float | bool | None] = 0
+    _applies_by_type: t.ClassVar[bool] = True
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {'alert_type': None}
 
@@ -4,7 +4,9 @@ object transforming it into a Bokeh model that can be rendered.
 """
 from __future__ import annotations
 
+import types
 import typing as t
+import weakref
 
 from functools import partial
 
@@ -105,6 +107,35 @@ class RerenderError(RuntimeError):
 
 T = t.TypeVar('T', bound='PaneBase')
 
+# Candidate pane types per object type, with the panes whose applies
+# method only depends on the object type already resolved
+_pane_type_cache: weakref.WeakKeyDictionary[
+    type, list[type[PaneBase] | tuple[t.Any, bool, type[PaneBase]]]
+] = weakref.WeakKeyDictionary()
+
+# Objects whose attributes differ between instances of the same type
+_UNCACHEABLE_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.MethodType,
+    types.BuiltinFunctionType, partial
+)
+
+
+def _applies_by_type(pane_type: type[PaneBase]) -> bool:
+    """
+    Whether the applies method of the pane type only depends on the
+    type of the object. Only honored if declared on the class which
+    defines the applies method or on one of its subclasses.
+    """
+    if pane_type._applies_kw:
+        return False
+    for klass in pane_type.__mro__:
+        if '_applies_by_type' in klass.__dict__:
+            return klass.__dict__['_applies_by_type']
+        elif 'applies' in klass.__dict__:
+            return False
+    return False
+
+
 
 class PaneBase(Layoutable):
     """
@@ -147,6 +178,10 @@ class PaneBase(Layoutable):
     # Whether applies requires full set of keywords
     _applies_kw: t.ClassVar[bool] = False
 
+    # Whether applies only depends on the type of the object, allowing
+    # the result to be cached per type
+    _applies_by_type: t.ClassVar[bool] = False
+
     _skip_layoutable: tuple[str, ...] = ('css_classes', 'margin', 'name')
 
     # Whether the Pane layout can be safely unpacked
@@ -154,6 +189,11 @@ class PaneBase(Layoutable):
 
     __abstract = True
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A new pane type may apply to previously resolved types
+        _pane_type_cache.clear()
+
     def __init__(self, object=None, **params):
         self._object_changing = False
         super().__init__(object=object, **params)
@@ -261,25 +301,11 @@ class PaneBase(Layoutable):
         if isinstance(obj, Viewable):
             return type(obj)
         descendents = []
-        for p in _descendents(PaneBase, concrete=True):
-            if p.priority is None:
-                applies = True
-                try:
-                    priority = p.applies(obj, **(kwargs if p._applies_kw else {}))
-                except Exception:
-                    priority = False
-            else:
-                applies = None
-                priority = p.priority
-            if isinstance(priority, bool) and priority:
-                raise ValueError('If a Pane declares no priority '
-                                 'the applies method should return a '
-                                 'priority value specific to the '
-                                 f'object type or False, but the {p.__name__} pane '
-                                 'declares no priority.')
-            elif priority is None or priority is False:
-                continue
-            descendents.append((priority, applies, p))
+        for p in cls._pane_type_candidates(obj, kwargs):
+            if isinstance(p, tuple):
+                descendents.append(p)
+            elif (candidate := cls._pane_priority(p, obj, kwargs)) is not None:
+                descendents.append(candidate)
         pane_types = reversed(sorted(descendents, key=lambda x: x[0]))
         for _, applies, pane_type in pane_types:
             if applies is None:
@@ -292,6 +318,70 @@ class PaneBase(Layoutable):
             return pane_type
         raise TypeError(f'{type(obj).__name__} type could not be rendered.')
 
+    @classmethod
+    def _pane_priority(
+        cls, pane_type: type[PaneBase], obj: t.Any, kwargs: dict[str, t.Any]
+    ) -> tuple[t.Any, bool | None, type[PaneBase]] | None:
+        """
+        Returns the priority of the pane type for the object and
+        whether it applies, if already known, or None if it does not
+        apply.
+        """
+        if pane_type.priority is None:
+            applies = True
+            try:
+                priority = pane_type.applies(obj, **(kwargs if pane_type._applies_kw else {}))
+            except Exception:
+                priority = False
+        else:
+            applies = None
+            priority = pane_type.priority
+        if isinstance(priority, bool) and priority:
+            raise ValueError('If a Pane declares no priority '
+                             'the applies method should return a '
+                             'priority value specific to the '
+                             f'object type or False, but the {pane_type.__name__} pane '
+                             'declares no priority.')
+        elif priority is None or priority is False:
+            return None
+        return (priority, applies, pane_type)
+
+    @classmethod
+    def _pane_type_candidates(
+        cls, obj: t.Any, kwargs: dict[str, t.Any]
+    ) -> list[type[PaneBase] | tuple[t.Any, bool, type[PaneBase]]]:
+        """
+        Returns the pane types which may apply to the object. Pane
+        types whose applies method only depends on the type of the
+        object are resolved once per type and returned as a tuple of
+        the priority, True and the pane type, all other pane types
+        have to be evaluated for each object.
+        """
+        if isinstance(obj, _UNCACHEABLE_TYPES):
+            return _descendents(PaneBase, concrete=True)
+        obj_type = type(obj)
+        candidates = _pane_type_cache.get(obj_type)
+        if candidates is not None:
+            return candidates
+        candidates = []
+        for p in _descendents(PaneBase, concrete=True):
+            if not _applies_by_type(p):
+                candidates.append(p)
+                continue
+            candidate = cls._pane_priority(p, obj, kwargs)
+            if candidate is None:
+                continue
+            priority, applies, _ = candidate
+            if applies is None:
+                try:
+                    applies = p.applies(obj)
+                except Exception:
+                    applies = False
+            if applies:
+                candidates.append((priority, True, p))
+        _pane_type_cache[obj_type] = candidates
+        return candidates
+
 
 class Pane(PaneBase, Reactive):
     """
@@ -132,6 +132,7 @@ class DeckGL(ModelPane):
     _updates: t.ClassVar[bool] = True
 
     priority: t.ClassVar[float | bool | None] = None
+    _applies_by_type: t.ClassVar[bool] = True
 
     @classmethod
     def applies(cls, object: t.Any) -> float | bool | None:
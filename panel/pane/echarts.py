@@ -53,6 +53,7 @@ class ECharts(ModelPane):
        Theme to apply to plots.""")  # type: ignore[assignment, ty:invalid-assignment]
 
     priority: t.ClassVar[float | bool | None] = None
+    _applies_by_type: t.ClassVar[bool] = True
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {"object": "data"}
 
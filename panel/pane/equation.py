@@ -48,6 +48,7 @@ class LaTeX(ModelPane):
 
     # Priority is dependent on the data type
     priority: t.ClassVar[float | bool | None] = None
+    _applies_by_type: t.ClassVar[bool] = True
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {
         'renderer': None, 'object': 'text'
@@ -5,6 +5,7 @@ objects and their widgets and support for Links
 """
 from __future__ import annotations
 
+import asyncio
 import sys
 import typing as t
 
@@ -25,12 +26,16 @@ from ..layout import (
     Column, HSpacer, Row, WidgetBox,
 )
 from ..viewable import Layoutable, Viewable
-from ..widgets import (
-    DatetimeInput, DiscreteSlider, EditableFloatSlider, EditableIntSlider,
-    FloatSlider, IntSlider, Player, Select, WidgetBase,
+from ..widgets.base import WidgetBase
+from ..widgets.input import DatetimeInput
+from ..widgets.player import Player
+from ..widgets.select import Select
+from ..widgets.slider import (
+    DiscreteSlider, EditableFloatSlider, EditableIntSlider, FloatSlider,
+    IntSlider,
 )
 from .base import Pane, RerenderError, panel
-from .plot import Bokeh, Matplotlib
+from .plot import _MPL_RENDER_LOCK, Bokeh, Matplotlib
 from .plotly import Plotly
 
 if t.TYPE_CHECKING:
@@ -151,6 +156,7 @@ class HoloViews(Pane):
         be used to override the default widgets.""")
 
     priority: t.ClassVar[float | bool | None] = 0.8
+    _applies_by_type: t.ClassVar[bool] = True
 
     _alignments = {
         'left': (Row, ('start', 'center'), True),
@@ -196,6 +202,8 @@ class HoloViews(Pane):
         self._widget_container = []
         self._plots = {}
         self._syncing_props = False
+        self._update_generation = 0
+        self._update_pending = False
         self._overrides = [
             p for p, v in params.items()
             if p in Layoutable.param and v != self.param[p].default
@@ -368,24 +376,35 @@ class HoloViews(Pane):
             not self._initialized):
             self._update_layout()
 
-    def _update_plot(self, plot, pane):
+    def _plot_key(self, plot):
         from holoviews.core.util import cross_index, wrap_tuple_streams
 
         widgets = self.widget_box.objects
         if not widgets:
-            return
+            return None
         elif self.widget_type == 'scrubber':
-            key = cross_index([v for v in self._values.values()], widgets[0].value)
+            return cross_index([v for v in self._values.values()], widgets[0].value)
+        key = tuple(w.value for w in widgets)
+        if plot.dynamic:
+            widget_dims = [w.label for w in widgets]
+            dim_labels = [kdim.pprint_label for kdim in plot.dimensions]
+            key = [key[widget_dims.index(kdim)] if kdim in widget_dims else None
+                   for kdim in dim_labels]
+            key = wrap_tuple_streams(tuple(key), plot.dimensions, plot.streams)
+        return key
+
+    def _update_pane_object(self, plot, pane):
+        if hasattr(plot.renderer, 'get_plot_state'):
+            pane.object = plot.renderer.get_plot_state(plot)
         else:
-            key = tuple(w.value for w in widgets)
-            if plot.dynamic:
-                widget_dims = [w.label for w in widgets]
-                dim_labels = [kdim.pprint_label for kdim in plot.dimensions]
-                key = [key[widget_dims.index(kdim)] if kdim in widget_dims else None
-                       for kdim in dim_labels]
-                key = wrap_tuple_streams(tuple(key), plot.dimensions, plot.streams)
-
-        if plot.backend == 'bokeh':
+            # Compatibility with holoviews<1.13.0
+            pane.object = plot.state
+
+    def _update_plot(self, plot, pane):
+        key = self._plot_key(plot)
+        if key is None:
+            return
+        elif plot.backend == 'bokeh':
             if plot.comm or state._unblocked(plot.document) or not plot.document.session_context:
                 with unlocked():
                     plot.update(key)
@@ -395,15 +414,63 @@ class HoloViews(Pane):
                 plot.document.add_next_tick_callback(partial(plot.update, key))
         else:
             plot.update(key)
-            if hasattr(plot.renderer, 'get_plot_state'):
-                pane.object = plot.renderer.get_plot_state(plot)
-            else:
-                # Compatibility with holoviews<1.13.0
-                pane.object = plot.state
+            self._update_pane_object(plot, pane)
+
+    def _update_on_thread(self, plot, key):
+        if plot.backend == 'matplotlib':
+            # Matplotlib is not thread-safe so renders are serialized
+            with _MPL_RENDER_LOCK:
+                plot.update(key)
+        else:
+            plot.update(key)
+
+    async def _update_plots_async(self):
+        """
+        Renders the plots for the latest widget values, restarting
+        whenever the widgets change while a frame is rendered so that
+        stale frames are dropped instead of queued up.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                # Yield to process pending widget events before rendering
+                await asyncio.sleep(0)
+                generation = self._update_generation
+                for plot, pane in list(self._plots.values()):
+                    if generation != self._update_generation:
+                        break
+                    elif plot.backend == 'bokeh' or state._thread_pool is None:
+                        # Bokeh models can only be modified on the event loop
+                        self._update_plot(plot, pane)
+                        continue
+                    key = self._plot_key(plot)
+                    if key is None:
+                        continue
+                    await loop.run_in_executor(
+                        state._thread_pool, self._update_on_thread, plot, key
+                    )
+                    if generation == self._update_generation:
+                        self._update_pane_object(plot, pane)
+                if generation == self._update_generation:
+                    break
+        finally:
+            self._update_pending = False
 
     def _widget_callback(self, event):
-        for _, (plot, pane) in self._plots.items():
-            self._update_plot(plot, pane)
+        self._update_generation += 1
+        if self._update_pending:
+            # The pending update renders the latest widget values
+            return
+        doc = state.curdoc
+        if (
+            doc is None or not doc.session_context or state._is_pyodide or
+            any(plot.comm for plot, _ in self._plots.values())
+        ):
+            for _, (plot, pane) in self._plots.items():
+                self._update_plot(plot, pane)
+            return
+        self._update_pending = True
+        param.parameterized.async_executor(self._update_plots_async)
 
     def _track_overrides(self, *events):
         if self._syncing_props:
@@ -787,6 +854,7 @@ class Interactive(Pane):
         Bokeh model.""")
 
     priority: t.ClassVar[float | bool | None] = None
+    _applies_by_type: t.ClassVar[bool] = True
     _ignored_refs: t.ClassVar[tuple[str, ...]] = ('object',)
 
     def __init__(self, object=None, **params):
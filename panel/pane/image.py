@@ -47,6 +47,9 @@ class FileBase(HTMLBasePane):
     def __init__(self, object=None, **params):
         if isinstance(object, PurePath):
             object = str(object)
+        # The URL and content of the last remote object fetched in the background
+        self._url_content: tuple[str, bytes] | None = None
+        self._url_pending: str | None = None
         super().__init__(object=object, **params)
 
     def _type_error(self, object):
@@ -82,11 +85,15 @@ class FileBase(HTMLBasePane):
             return True
         return False
 
+    @property
+    def _mime_type(self) -> str:
+        return f'image/{self.filetype}'
+
     def _b64(self, data: str | bytes) -> str:
         if not isinstance(data, bytes):
             data = data.encode('utf-8')
         b64 = base64.b64encode(data).decode("utf-8")
-        return f"data:image/{self.filetype};base64,{b64}"
+        return f"data:{self._mime_type};base64,{b64}"
 
     def _data(self, obj: t.Any) -> bytes | None:
         filetype = self.filetype.split('+')[0]
@@ -118,11 +125,61 @@ class FileBase(HTMLBasePane):
                 _tasks.add(task)
                 task.add_done_callback(_tasks.discard)
         else:
-            import requests
-            r = requests.request(url=obj, method='GET')
-            return r.content
+            from ..io.fetch import cached_content, fetch
+            if self._url_content is not None and self._url_content[0] == obj:
+                return self._url_content[1]
+            elif (content := cached_content(obj)) is not None:
+                return content
+            elif not self._serving():
+                return fetch(obj)
+            # Render a placeholder and update once the content arrives
+            self._fetch_in_background(obj)
         return None
 
+    def _content_url(self, data: str | bytes, mime_type: str) -> str | None:
+        """
+        Returns a URL serving the data if it should not be embedded in
+        the model, see `config.content_url_threshold`.
+        """
+        if self.embed:
+            return None
+        from ..io.content import content_url
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        return content_url(data, mime_type, owner=self)
+
+    def _serving(self) -> bool:
+        """
+        Whether the pane is rendered on the event loop of a server.
+        """
+        from ..io.state import state
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return bool(state.curdoc and state.curdoc.session_context)
+
+    def _fetch_in_background(self, url: str) -> None:
+        from ..io.fetch import fetch_async
+        if self._url_pending == url:
+            return
+        self._url_pending = url
+        future = fetch_async(url)
+        _tasks.add(future)
+
+        def fetched(future):
+            _tasks.discard(future)
+            if self._url_pending == url:
+                self._url_pending = None
+            if future.cancelled() or self.object != url:
+                return
+            elif (e := future.exception()) is not None:
+                self.param.warning(f'Could not fetch {url!r}: {e}')
+                return
+            self._url_content = (url, future.result())
+            self._update_pane()
+        future.add_done_callback(fetched)
+
 
 class ImageBase(FileBase):
     """
@@ -233,7 +290,7 @@ class ImageBase(FileBase):
             width = int((self.height/height)*width)
             height = self.height
 
-        src = self._b64(data)
+        src = self._content_url(data, self._mime_type) or self._b64(data)
 
         w, h = self._img_dims(width, height)
         html = self._format_html(src, w, h)
@@ -356,11 +413,9 @@ class ICO(ImageBase):
 
     filetype: t.ClassVar[str] = 'ico'
 
-    def _b64(self, data: str | bytes) -> str:
-        if not isinstance(data, bytes):
-            data = data.encode('utf-8')
-        b64 = base64.b64encode(data).decode("utf-8")
-        return f"data:image/x-icon;base64,{b64}"
+    @property
+    def _mime_type(self) -> str:
+        return 'image/x-icon'
 
     @classmethod
     def _imgshape(cls, data):
@@ -477,7 +532,8 @@ class SVG(ImageBase):
             ws = f' width: {w};' if w else ''
             hs = f' height: {h};' if h else ''
             object_fit = "contain" if self.fixed_aspect else "fill"
-            data = f'<img src="{self._b64(data)}" style="max-width: 100%; max-height: 100%; object-fit: {object_fit};{ws}{hs}"></img>'
+            src = self._content_url(data, self._mime_type) or self._b64(data)
+            data = f'<img src="{src}" style="max-width: 100%; max-height: 100%; object-fit: {object_fit};{ws}{hs}"></img>'
         if isinstance(data, bytes):
             data = data.decode('utf-8')
         return dict(width=width, height=height, text=escape(data))
@@ -520,12 +576,15 @@ class PDF(FileBase):
         elif self.embed or not isurl(obj):
             # This is handled by the Typescript Bokeh model to be able to render large PDF files (>2MB).
             data = self._data(obj)
-            if not isinstance(data, bytes):
+            if data is None:
+                return dict(text='') if self.embed else dict(text='<embed></embed>')
+            elif not isinstance(data, bytes):
                 data = data.encode('utf-8')
-            b64 = base64.b64encode(data).decode("utf-8")
             if self.embed:
-                return dict(text=b64)
-            obj = f'data:application/pdf;base64,{b64}'
+                return dict(text=base64.b64encode(data).decode("utf-8"))
+            obj = self._content_url(data, 'application/pdf')
+            if obj is None:
+                obj = f'data:application/pdf;base64,{base64.b64encode(data).decode("utf-8")}'
 
         w, h = self.width or '100%', self.height or '100%'
         page = f'#page={self.start_page}' if getattr(self, 'start_page', None) else ''
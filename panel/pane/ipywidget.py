@@ -97,6 +97,8 @@ class IPyLeaflet(IPyWidget):
 
 class Reacton(IPyWidget):
 
+    _applies_by_type: t.ClassVar[bool] = True
+
     def __init__(self, object=None, **params):
         super().__init__(object=object, **params)
         self._rcs = {}
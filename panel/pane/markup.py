@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import functools
 import json
+import re
 import textwrap
 import typing as t
 
@@ -88,6 +89,7 @@ class HTML(HTMLBasePane):
 
     # Priority is dependent on the data type
     priority: t.ClassVar[float | bool | None] = None
+    _applies_by_type: t.ClassVar[bool] = True
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {
         'sanitize_html': None, 'sanitize_hook': None, 'stream': None
@@ -205,6 +207,8 @@ class DataFrame(HTML):
 
     _object: t.Any = param.Parameter(default=None, doc="""Hidden parameter.""")  # type: ignore[assignment, ty:invalid-assignment]
 
+    _applies_by_type: t.ClassVar[bool] = True
+
     _dask_params: t.ClassVar[list[str]] = ['max_rows']
 
     _rerender_params: t.ClassVar[list[str]] = [
@@ -318,6 +322,7 @@ class Str(HTMLBasePane):
     """
 
     priority: t.ClassVar[float | bool | None] = 0
+    _applies_by_type: t.ClassVar[bool] = True
 
     _bokeh_model: t.ClassVar[type[Model]] = _BkHTML
 
@@ -337,6 +342,51 @@ class Str(HTMLBasePane):
         return dict(object=escape(text))
 
 
+# Constructs whose rendering depends on content beyond the block they
+# are declared in, i.e. link reference and footnote definitions and
+# raw HTML blocks which may span blank lines.
+_NONLOCAL_MARKDOWN = re.compile(
+    r'^ {0,3}(\[[^\]]+\]:|<(pre|script|style|textarea|!--|\?|![A-Z]|!\[CDATA\[))',
+    re.MULTILINE | re.IGNORECASE
+)
+
+_FENCE = re.compile(r'^ {0,3}(```|~~~)', re.MULTILINE)
+
+_HEADING = re.compile(r'^ {0,3}#{1,6}[ \t]+(.*)$|^(.+)\n {0,3}(?:=+|-+)[ \t]*$', re.MULTILINE)
+
+
+def _has_duplicate_headings(text: str) -> bool:
+    headings = [(atx or setext).strip().lower() for atx, setext in _HEADING.findall(text)]
+    return len(headings) != len(set(headings))
+
+
+def _markdown_block_boundary(text: str, start: int = 0) -> int:
+    """
+    Returns the offset of the last position in the text (after start)
+    at which the markdown up to that point can be rendered
+    independently of the text which follows, i.e. a blank line
+    outside of a fenced code block which is followed by an
+    unindented block which does not continue a list or quote.
+    """
+    end = len(text)
+    while True:
+        pos = text.rfind('\n\n', start, end)
+        if pos < 0:
+            return start
+        offset = pos + 2
+        while text.startswith('\n', offset):
+            offset += 1
+        # The first line of the following block must be complete to
+        # ensure appended text cannot turn it into a list item
+        nxt = text[offset:offset+2]
+        if (text.find('\n', offset) >= 0 and not nxt[0].isspace() and
+            nxt[0] not in '>|' and
+            not re.match(r'[-*+] |\d', nxt) and
+            len(_FENCE.findall(text, start, pos)) % 2 == 0):
+            return offset
+        end = pos
+
+
 class Markdown(HTMLBasePane):
     """
     The `Markdown` pane allows rendering arbitrary markdown strings in a panel.
@@ -384,6 +434,7 @@ class Markdown(HTMLBasePane):
 
     # Priority depends on the data type
     priority: t.ClassVar[float | bool | None] = None
+    _applies_by_type: t.ClassVar[bool] = True
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {
         'hard_line_break': None, 'disable_anchors': None,
@@ -412,6 +463,10 @@ class Markdown(HTMLBasePane):
         else:
             return False
 
+    def __init__(self, object=None, **params):
+        self._stream_cache: tuple[t.Any, str, str] = (None, '', '')
+        super().__init__(object=object, **params)
+
     @classmethod
     @functools.cache
     def _get_parser(cls, renderer, plugins, hard_line_break=False, disable_anchors=True, **renderer_options):
@@ -466,15 +521,8 @@ class Markdown(HTMLBasePane):
         parser.options['highlight'] = hilite
         return parser
 
-    def _transform_object(self, obj: t.Any) -> dict[str, t.Any]:
+    def _render(self, obj: str) -> str:
         import markdown
-        if obj is None:
-            obj = ''
-        elif not isinstance(obj, str):
-            obj = obj._repr_markdown_()
-        if self.dedent:
-            obj = textwrap.dedent(obj)
-
         if self.renderer == 'markdown':
             extensions = self.extensions + ['nl2br'] if self.hard_line_break else self.extensions
             html = markdown.markdown(
@@ -494,6 +542,46 @@ class Markdown(HTMLBasePane):
                 with parser.reset_rules():
                     parser.disable('link')
                     html = parser.render(obj)
+        return html
+
+    def _render_incremental(self, obj: str) -> str:
+        """
+        Renders streamed markdown by caching the HTML of the blocks
+        which can no longer be affected by appended text, so that only
+        the trailing block has to be parsed when a token is added.
+        """
+        key = (
+            self.renderer, tuple(self.plugins), self.hard_line_break,
+            self.disable_anchors, repr(self.renderer_options)
+        )
+        cached_key, prefix, prefix_html = self._stream_cache
+        if cached_key != key or not obj.startswith(prefix):
+            prefix, prefix_html = '', ''
+        if _NONLOCAL_MARKDOWN.search(obj) or (
+            # Anchor ids are deduplicated across the whole document
+            not self.disable_anchors and _has_duplicate_headings(obj)
+        ):
+            self._stream_cache = (None, '', '')
+            return self._render(obj)
+        boundary = _markdown_block_boundary(obj, len(prefix))
+        if boundary > len(prefix):
+            prefix_html += self._render(obj[len(prefix):boundary])
+            prefix = obj[:boundary]
+        self._stream_cache = (key, prefix, prefix_html)
+        return prefix_html + self._render(obj[len(prefix):])
+
+    def _transform_object(self, obj: t.Any) -> dict[str, t.Any]:
+        if obj is None:
+            obj = ''
+        elif not isinstance(obj, str):
+            obj = obj._repr_markdown_()
+        if self.dedent:
+            obj = textwrap.dedent(obj)
+
+        if self.enable_streaming and self.renderer != 'markdown':
+            html = self._render_incremental(obj)
+        else:
+            html = self._render(obj)
         return dict(object=escape(html))
 
     def _process_param_change(self, params):
@@ -13,6 +13,7 @@ from io import BytesIO
 import numpy as np
 import param
 
+from ..io.content import content_url
 from ..models import Audio as _BkAudio, Video as _BkVideo
 from ..util import isfile, isurl
 from .base import ModelPane
@@ -130,27 +131,28 @@ class _MediaBase(ModelPane):
             data = b''
         elif isinstance(obj, bytes):
             fmt = self._detect_format(obj)
-            data = b64encode(obj)
+            data = obj
         elif isinstance(obj, (np.ndarray, TensorLike)):
             fmt = 'wav'
             buffer = self._to_buffer(obj)
-            data = b64encode(buffer.getvalue())
+            data = buffer.getvalue()
         elif isinstance(obj, BytesIO):
-            bffr = obj.read()
-            fmt = self._detect_format(bffr)
-            data = b64encode(bffr)
+            data = obj.read()
+            fmt = self._detect_format(data)
         elif os.path.isfile(obj):
             fmt = str(obj).split('.')[-1]
             with open(obj, 'rb') as f:
                 data = f.read()
-            data = b64encode(data)
         elif obj.lower().startswith('http'):
             return dict(object=obj)
         elif not obj or obj == f'data:{self._media_type}/{fmt};base64,':
             data = b''
         else:
             raise ValueError(f'Object should be either path to a {self._media_type} file or numpy array.')
-        b64 = f"data:{self._media_type}/{fmt};base64,{data.decode('utf-8')}"
+        mime_type = f'{self._media_type}/{fmt}'
+        if data and (url := content_url(data, mime_type, owner=self)):
+            return dict(object=url)
+        b64 = f"data:{mime_type};base64,{b64encode(data).decode('utf-8')}"
         return dict(object=b64)
 
 _VALID_TORCH_DTYPES_FOR_AUDIO = [
@@ -3,9 +3,12 @@ Pane class which render plots from different libraries
 """
 from __future__ import annotations
 
+import asyncio
 import re
 import sys
+import threading
 import typing as t
+import weakref
 
 from contextlib import contextmanager
 from functools import partial
@@ -30,9 +33,12 @@ from .ipywidget import IPyWidget
 from .markup import HTML
 
 if t.TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
+
+    from concurrent.futures import Future
 
     from bokeh.document import Document
+    from matplotlib.figure import Figure
     from pyviz_comms import Comm
 
 FOLIUM_BEFORE = '<div style="width:100%;"><div style="position:relative;width:100%;height:0;padding-bottom:60%;">'
@@ -79,6 +85,7 @@ class Bokeh(Pane):
         Bokeh theme to apply to the plot.""")
 
     priority: t.ClassVar[float | bool | None] = 0.8
+    _applies_by_type: t.ClassVar[bool] = True
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {
         'autodispatch': None, 'theme': None
@@ -201,6 +208,96 @@ def _make_matplotlib_svg_responsive(input_str):
 def _make_matplotlib_svg_not_preserve_aspect_ratio(input_str):
     return input_str.replace(b'height="100%"', b'height="100%" preserveAspectRatio="none"')
 
+# Rendered figures keyed by figure and by format, dpi, tight and fixed_aspect
+_MPL_RENDERS: weakref.WeakKeyDictionary[Figure, dict[tuple, bytes]] = weakref.WeakKeyDictionary()
+_MPL_INFLIGHT: dict[tuple, Future] = {}
+_MPL_CACHE_LOCK = threading.Lock()
+
+# Matplotlib is not thread-safe so renders are serialized
+_MPL_RENDER_LOCK = threading.RLock()
+
+# Ids of the figures being rendered, whose changes made while
+# rendering do not invalidate the cached renders
+_MPL_RENDERING: set[int] = set()
+
+def _discard_render(inflight: tuple, future: Future) -> None:
+    with _MPL_CACHE_LOCK:
+        if _MPL_INFLIGHT.get(inflight) is future:
+            del _MPL_INFLIGHT[inflight]
+
+def _figure_changed(callback: Callable | None, fig: Figure, val: bool) -> None:
+    """
+    Stale callback of a rendered figure which discards its cached
+    renders when one of its artists is modified.
+    """
+    if val and id(fig) not in _MPL_RENDERING:
+        with _MPL_CACHE_LOCK:
+            _MPL_RENDERS.pop(fig, None)
+    if callback is not None:
+        callback(fig, val)
+
+def _track_changes(fig: Figure) -> None:
+    """
+    Wraps the stale callback of the figure, which is called whenever
+    the figure or one of its artists is modified.
+    """
+    callback = fig.stale_callback
+    if isinstance(callback, partial) and callback.func is _figure_changed:
+        return
+    fig.stale_callback = partial(_figure_changed, callback)
+
+def _discard_figure(fig: Figure) -> None:
+    with _MPL_CACHE_LOCK:
+        _MPL_RENDERS.pop(fig, None)
+
+def _cached_figure(fig: Figure, key: tuple) -> bytes | None:
+    """
+    Returns the cached render of the figure unless it was modified
+    since it was rendered.
+    """
+    with _MPL_CACHE_LOCK:
+        return _MPL_RENDERS.get(fig, {}).get(key)
+
+def _render_figure(
+    fig: Figure, format: str, dpi: int, tight: bool, fixed_aspect: bool
+) -> bytes:
+    """
+    Renders the figure, returning a cached render if the figure was
+    not modified since it was last rendered with the same options.
+    """
+    key = (format, dpi, tight, fixed_aspect)
+    with _MPL_RENDER_LOCK:
+        if (value := _cached_figure(fig, key)) is not None:
+            return value
+        _track_changes(fig)
+        _MPL_RENDERING.add(id(fig))
+        try:
+            try:
+                fig.set_dpi(dpi)
+            except Exception as ex:
+                raise Exception("The Matplotlib backend is not configured. Try adding `matplotlib.use('agg')`") from ex
+            b = BytesIO()
+            fig.canvas.print_figure(
+                b,
+                format=format,
+                facecolor=fig.get_facecolor(),
+                edgecolor=fig.get_edgecolor(),
+                dpi=dpi,
+                bbox_inches='tight' if tight else None
+            )
+        finally:
+            _MPL_RENDERING.discard(id(fig))
+        value = b.getvalue()
+
+        if format == "svg":
+            value = _make_matplotlib_svg_responsive(value)
+            if not fixed_aspect:
+                value = _make_matplotlib_svg_not_preserve_aspect_ratio(value)
+
+        with _MPL_CACHE_LOCK:
+            _MPL_RENDERS.setdefault(fig, {})[key] = value
+    return value
+
 class Matplotlib(Image, IPyWidget):
     """
     The `Matplotlib` pane allows displaying any displayable Matplotlib figure
@@ -211,6 +308,9 @@ class Matplotlib(Image, IPyWidget):
     to automatically resize objects to fit within the pane.
     - If you have installed `ipympl` you will also be able to use the
     interactive backend.
+    - Renders are cached until the figure is modified, so a figure shared
+    by many sessions is only rendered once. When served with a thread pool
+    (see `config.nthreads`) the figure is rendered on a thread.
 
     Reference: https://panel.holoviz.org/reference/panes/Matplotlib.html
 
@@ -268,6 +368,14 @@ class Matplotlib(Image, IPyWidget):
     def __init__(self, object=None, **params):
         super().__init__(object, **params)
         self._managers = {}
+        self._render_pending: Future | None = None
+
+    def _update_pane(self, *events) -> None:
+        # Explicitly setting or triggering the object re-renders it
+        for event in events:
+            if event.name == 'object' and event.new is not None:
+                _discard_figure(event.new)
+        super()._update_pane(*events)
 
     def _get_widget(self, fig):
         import matplotlib.backends
@@ -314,11 +422,54 @@ class Matplotlib(Image, IPyWidget):
     ):
         return self._img_type._format_html(self, src, width, height)
 
+    @property
+    def _render_key(self) -> tuple[str, int, bool, bool]:
+        return (self.format, self.dpi, self.tight, self.format == 'svg' and self.fixed_aspect)
+
     def _transform_object(self, obj: t.Any) -> dict[str, t.Any]:
         if self.interactive:
             return {}
+        elif obj is not None and self._render_in_background(obj):
+            # Keep displaying the previous render until the new one is ready
+            return {} if self._models else dict(object='<img></img>')
         return self._img_type._transform_object(self, obj)
 
+    def _render_in_background(self, fig: Figure) -> bool:
+        """
+        Renders the figure on the thread pool if it is not cached and
+        the pane is rendered on the event loop of a server, returning
+        whether the render was deferred.
+        """
+        key = self._render_key
+        if (
+            state._thread_pool is None or not self._serving() or
+            _cached_figure(fig, key) is not None
+        ):
+            return False
+        inflight = (id(fig), *key)
+        with _MPL_CACHE_LOCK:
+            future = _MPL_INFLIGHT.get(inflight)
+            submit = future is None
+            if submit:
+                future = _MPL_INFLIGHT[inflight] = state._thread_pool.submit(_render_figure, fig, *key)
+        if submit:
+            future.add_done_callback(partial(_discard_render, inflight))
+        if self._render_pending is future:
+            return True
+        self._render_pending = future
+
+        def rendered(f):
+            if self._render_pending is future:
+                self._render_pending = None
+            if f.cancelled() or self.object is not fig:
+                return
+            elif (e := f.exception()) is not None:
+                self.param.warning(f'Rendering the figure failed: {e}')
+                return
+            self._update_pane()
+        asyncio.wrap_future(future).add_done_callback(rendered)
+        return True
+
     def _get_model(
         self, doc: Document, root: Model | None = None,
         parent: Model | None = None, comm: Comm | None = None
@@ -363,34 +514,7 @@ class Matplotlib(Image, IPyWidget):
     def _data(self, obj):
         if obj is None:
             return
-
-        try:
-            obj.set_dpi(self.dpi)
-        except Exception as ex:
-            raise Exception("The Matplotlib backend is not configured. Try adding `matplotlib.use('agg')`") from ex
-        b = BytesIO()
-
-        if self.tight:
-            bbox_inches = 'tight'
-        else:
-            bbox_inches = None
-
-        obj.canvas.print_figure(
-            b,
-            format=self.format,
-            facecolor=obj.get_facecolor(),
-            edgecolor=obj.get_edgecolor(),
-            dpi=self.dpi,
-            bbox_inches=bbox_inches
-        )
-        value = b.getvalue()
-
-        if self.format=="svg":
-            value = _make_matplotlib_svg_responsive(value)
-            if not self.fixed_aspect:
-                value = _make_matplotlib_svg_not_preserve_aspect_ratio(value)
-
-        return value
+        return _render_figure(obj, *self._render_key)
 
 class RGGPlot(PNG):
     """
@@ -407,6 +531,8 @@ class RGGPlot(PNG):
 
     _rerender_params = PNG._rerender_params + ['object', 'dpi', 'width', 'height']
 
+    _applies_by_type: t.ClassVar[bool] = True
+
     _rename: t.ClassVar[Mapping[str, str | None]] = {'dpi': None}
 
     @classmethod
@@ -432,6 +558,7 @@ class YT(HTML):
     """
 
     priority: t.ClassVar[float | bool | None] = 0.5
+    _applies_by_type: t.ClassVar[bool] = True
 
     @classmethod
     def applies(cls, object: t.Any) -> float | bool | None:
@@ -453,6 +580,7 @@ class Folium(HTML):
         'scale_width', 'scale_height', 'scale_both', None])  # type: ignore[assignment, ty:invalid-assignment]
 
     priority: t.ClassVar[float | bool | None] = 0.6
+    _applies_by_type: t.ClassVar[bool] = True
 
     @classmethod
     def applies(cls, object: t.Any) -> float | bool | None:
@@ -37,6 +37,8 @@ class Streamz(ReplacementPane):
     rate_limit = param.Number(default=0.1, bounds=(0, None), doc="""
         The minimum interval between events.""")
 
+    _applies_by_type: t.ClassVar[bool] = True
+
     _rename: t.ClassVar[Mapping[str, str | None]] = {'rate_limit': None, 'always_watch': None}
 
     def __init__(self, object=None, **params):
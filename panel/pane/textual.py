@@ -7,7 +7,7 @@ import param
 
 from ..io.state import state
 from ..viewable import Viewable
-from ..widgets import Terminal
+from ..widgets.terminal import Terminal
 from .base import Pane
 
 if t.TYPE_CHECKING:
@@ -30,6 +30,7 @@ class Textual(Pane):
     """
 
     priority: t.ClassVar[float | bool | None] = 1.0
+    _applies_by_type: t.ClassVar[bool] = True
 
     _updates: t.ClassVar[bool] = True
 
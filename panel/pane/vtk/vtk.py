@@ -19,7 +19,6 @@ from bokeh.models import LinearColorMapper
 from bokeh.util.serialization import make_globally_unique_id
 from pyviz_comms import JupyterComm
 
-from ...param import ParamMethod
 from ...util import isfile, lazy_load
 from ..base import Pane
 from ..plot import Bokeh
@@ -316,6 +315,7 @@ class BaseVTKRenderWindow(AbstractVTK):
             model = self._construct_colorbars(color_mappers)
             return Bokeh(model)
         else:
+            from ...param import ParamMethod
             return ParamMethod(self._construct_colorbars)
 
     def export_scene(self, filename='vtk_scene', all_data_arrays=False):
@@ -40,6 +40,7 @@ from param.reactive import rx
 from .config import config
 from .io import state
 from .io.cache import is_equal
+from .io.state import set_curdoc
 from .layout import (
     Column, HSpacer, Row, Spacer, Tabs, WidgetBox,
 )
@@ -53,14 +54,19 @@ from .util import (
 )
 from .util.checks import is_dataframe, is_mpl_axes, is_series
 from .viewable import Layoutable, Viewable
-from .widgets import (
-    ArrayInput, Button, Checkbox, ColorPicker, DataFrame, DatePicker,
-    DateRangeSlider, DatetimeInput, DatetimeRangeSlider, DiscreteSlider,
-    FileInput, FileSelector, FloatInput, FloatSlider, IntInput, IntSlider,
-    LiteralInput, MultiSelect, RangeSlider, Select, StaticText, Tabulator,
-    TextInput, Toggle, Widget, WidgetBase,
+from .widgets.base import Widget, WidgetBase
+from .widgets.button import Button, Toggle, _ButtonBase
+from .widgets.file_selector import FileSelector
+from .widgets.input import (
+    ArrayInput, Checkbox, ColorPicker, DatePicker, DatetimeInput, FileInput,
+    FloatInput, IntInput, LiteralInput, StaticText, TextInput,
 )
-from .widgets.button import _ButtonBase
+from .widgets.select import MultiSelect, Select
+from .widgets.slider import (
+    DateRangeSlider, DatetimeRangeSlider, DiscreteSlider, FloatSlider,
+    IntSlider, RangeSlider,
+)
+from .widgets.tables import DataFrame, Tabulator
 
 if t.TYPE_CHECKING:
     from bokeh.document import Document
@@ -873,6 +879,14 @@ class ParamRef(ReplacementPane):
         Whether to show a loading indicator while the pane is updating.
         Can be set as parameter or by setting panel.config.loading_indicator.""")
 
+    threaded = param.Boolean(default=None, doc="""
+        Whether to evaluate synchronous references on a thread instead
+        of blocking the event loop. Results of evaluations superseded
+        by a newer evaluation are discarded. Runs on the thread pool
+        if `config.nthreads` is set and on the event loop's default
+        executor otherwise. Can be set as parameter or by setting
+        panel.config.threaded_refs.""")
+
     priority: t.ClassVar[float | bool | None] = 0
 
     def __init__(self, object=None, **params):
@@ -880,8 +894,12 @@ class ParamRef(ReplacementPane):
             params['defer_load'] = config.defer_load
         if 'loading_indicator' not in params:
             params['loading_indicator'] = ParamMethod.loading_indicator
-        super().__init__(object, **params)
+        if 'threaded' not in params:
+            params['threaded'] = config.threaded_refs
         self._async_task = None
+        self._generation = 0
+        self._thread_future = None
+        super().__init__(object, **params)
         self._evaled = not (self.lazy or self.defer_load)
         self._link_object_params()
         if object is not None:
@@ -943,6 +961,45 @@ class ParamRef(ReplacementPane):
             self._async_task = None
             self._inner_layout.loading = False
 
+    def _eval_on_thread(self, doc, ref):
+        with set_curdoc(doc):
+            return self.eval(ref)
+
+    async def _eval_threaded(self, ref, generation):
+        loop = asyncio.get_running_loop()
+        self._thread_future = future = loop.run_in_executor(
+            state._thread_pool, partial(self._eval_on_thread, state.curdoc, ref)
+        )
+        try:
+            try:
+                new_object = await future
+            except asyncio.CancelledError:
+                return
+            except Skip:
+                new_object = Skip
+            except Exception:
+                if generation == self._generation:
+                    raise
+                return
+            if generation != self._generation:
+                # Superseded by a newer evaluation
+                return
+            if new_object is Skip or new_object is Undefined:
+                self.param.log(
+                    param.DEBUG, 'Skip event was raised, skipping update.'
+                )
+                return
+            if isinstance(new_object, Generator):
+                new_object = to_async_gen(new_object)
+            if inspect.isawaitable(new_object) or isinstance(new_object, types.AsyncGeneratorType):
+                await self._eval_async(new_object)
+            else:
+                self._update_inner(new_object)
+        finally:
+            if generation == self._generation:
+                self._thread_future = None
+                self._inner_layout.loading = False
+
     def _replace_pane(self, *args, force=False):
         deferred = self.defer_load and not state.loaded
         if not self._inner_layout.loading:
@@ -950,6 +1007,19 @@ class ParamRef(ReplacementPane):
         self._evaled |= force or not (self.lazy or deferred)
         if not self._evaled:
             return
+        self._generation += 1
+        if self._thread_future is not None:
+            # Cancel the superseded evaluation if it has not started yet
+            self._thread_future.cancel()
+            self._thread_future = None
+        if (
+            self.threaded and self.object is not None and not state._is_pyodide
+            and not iscoroutinefunction(self.object)
+        ):
+            param.parameterized.async_executor(
+                partial(self._eval_threaded, self.object, self._generation)
+            )
+            return
         try:
             if self.object is None:
                 new_object = Spacer()
@@ -1037,6 +1107,10 @@ def _update_defer_load_default(default_value):
 def _update_loading_indicator_default(default_value):
     ParamRef.param.loading_indicator.default = default_value
 
+@param.depends(config.param.threaded_refs, watch=True)
+def _update_threaded_default(default_value):
+    ParamRef.param.threaded.default = default_value
+
 
 class ParamMethod(ParamRef):
     """
@@ -1205,6 +1279,7 @@ class ReactiveExpr(Pane):
         of the reactive expression.""")  # type: ignore[assignment, ty:invalid-assignment]
 
     priority: t.ClassVar[float | bool | None] = 1
+    _applies_by_type: t.ClassVar[bool] = True
 
     _layouts = {
         'left': (Row, ('start', 'center'), True),
@@ -59,6 +59,7 @@ if t.TYPE_CHECKING:
     import pandas as pd
 
     from bokeh.document import Document
+    from bokeh.document.events import DocumentChangedEvent
     from bokeh.events import Event
     from bokeh.model import Model, ModelEvent
     from bokeh.models.sources import DataDict, Patches
@@ -1385,6 +1386,133 @@ class ReactiveData(SyncableData):
 
     __abstract = True
 
+    def __init__(self, **params):
+        self._data_patches: list[Patches | None] = []
+        self._patch_callbacks: dict[str, tuple[Document, Callable[[DocumentChangedEvent], None]]] = {}
+        super().__init__(**params)
+
+    def _cleanup(self, root: Model | None = None) -> None:
+        if root is not None and root.ref['id'] in self._patch_callbacks:
+            doc, cb = self._patch_callbacks.pop(root.ref['id'])
+            doc.remove_on_change(cb)
+        super()._cleanup(root)
+
+    def _link_data_patches(self, source: Model, doc: Document, root: Model) -> None:
+        """
+        Records the patches sent by the frontend when cells in the
+        ColumnDataSource are edited, allowing _process_data to apply
+        just the edited cells instead of diffing all the data.
+
+        Patch hints are only available to document level callbacks,
+        which on the server are invoked before the deferred processing
+        of the data change.
+        """
+        if not doc.session_context or root.ref['id'] in self._patch_callbacks:
+            return
+        cb = partial(self._record_patch, source)
+        doc.on_change(cb)
+        self._patch_callbacks[root.ref['id']] = (doc, cb)
+
+    def _record_patch(self, source: Model, event: DocumentChangedEvent) -> None:
+        from bokeh.document.events import ColumnsPatchedEvent
+        if (getattr(event, 'model', None) is not source or event.setter is None or
+            getattr(event, 'attr', 'data') != 'data'):
+            return
+        if isinstance(event, ColumnsPatchedEvent):
+            self._data_patches.append(event.patches)
+        else:
+            # Any other change to the data requires a full diff
+            self._data_patches.append(None)
+
+    def _processed_rows(self, rows: list[int]) -> list[int]:
+        """
+        Maps row positions in the ColumnDataSource onto positions in
+        the processed data.
+        """
+        return rows
+
+    def _update_cells(self, column: str, rows: list[int], values: TDataColumn) -> None:
+        """
+        Implemented by subclasses to apply edits to individual cells
+        to the data parameter.
+
+        Parameters
+        ----------
+        column: str
+          The name of the column to update.
+        rows: list[int]
+          The positions of the edited rows in the processed data.
+        values: numpy.ndarray
+          The new values of the edited cells.
+        """
+        raise NotImplementedError()
+
+    def _process_patches(self, patches: list[Patches]) -> bool:
+        """
+        Applies patches of edited cells to the data, only converting
+        and comparing the cells which were actually edited.
+
+        Returns False if the patches cannot be applied, in which case
+        the data has to be diffed in full.
+        """
+        processed = self._processed
+        if processed is None or not hasattr(processed, 'columns'):
+            return False
+        cells: dict[str, dict[int, t.Any]] = {}
+        for patch in patches:
+            for col, col_patches in patch.items():
+                for ind, value in col_patches:
+                    if not isinstance(ind, int) or ind < 0:
+                        return False
+                    cells.setdefault(col, {})[ind] = value
+        nrows = len(processed)
+        updates = []
+        for col, col_cells in cells.items():
+            col = self._renamed_cols.get(col, col)
+            if col in self.indexes or col not in processed.columns:
+                continue
+            rows = self._processed_rows(list(col_cells))
+            if any(row >= nrows for row in rows):
+                return False
+            old = processed[col].iloc[rows]
+            converted = self._convert_column(np.asarray(list(col_cells.values())), old)
+            converted = getattr(converted, 'array', converted)
+            try:
+                isequal = np.array_equal(np.asarray(old), converted, equal_nan=True)
+            except Exception:
+                try:
+                    isequal = (np.asarray(old) == np.asarray(converted)).all()
+                except Exception:
+                    isequal = False
+            if not isequal:
+                updates.append((col, rows, converted))
+
+        # Only apply the updates once all patches were validated
+        for col, rows, converted in updates:
+            self._update_cells(col, rows, converted)
+        if not updates:
+            return True
+
+        old_data = self.value # type: ignore
+        self._updating = True
+        try:
+            self.param.trigger('value')
+        finally:
+            self._updating = False
+        if old_data is not self.value: # type: ignore
+            self._update_cds()
+        return True
+
+    def _apply_data_patches(self) -> bool:
+        """
+        Applies the recorded patches, returning whether the data change
+        was fully handled.
+        """
+        patches, self._data_patches = self._data_patches, []
+        if self._updating or not patches or None in patches:
+            return False
+        return self._process_patches(patches)  # type: ignore[arg-type]
+
     def _update_selection(self, indices: list[int]) -> None:
         self.selection = indices
 
@@ -1435,7 +1563,7 @@ class ReactiveData(SyncableData):
         return values if converted is None else converted
 
     def _process_data(self, data: Mapping[str, list | dict[int, t.Any] | np.ndarray]) -> None:
-        if self._updating:
+        if self._apply_data_patches() or self._updating:
             return
         # Get old data to compare to
         old_raw, old_data = self._get_data()
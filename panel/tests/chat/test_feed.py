@@ -400,6 +400,35 @@ class TestChatFeed:
         chat_feed.stream("Goodbye", message=message, replace=True)
         await async_wait_until(lambda: chat_feed.objects[-1].object == "Goodbye")
 
+    async def test_stream_interval_generator_flushed(self, chat_feed):
+        def callback(contents, user, instance):
+            text = ""
+            for token in "abc":
+                text += token
+                yield text
+        chat_feed.message_params = {"stream_interval": 60}
+        chat_feed.callback = callback
+        chat_feed.send("Message", respond=True)
+        await async_wait_until(lambda: len(chat_feed.objects) == 2)
+        await async_wait_until(lambda: chat_feed.objects[1].object == "abc")
+
+    async def test_stream_batch_size_generator_updates(self, chat_feed):
+        objects = []
+
+        def callback(contents, user, instance):
+            text = ""
+            for token in "abcdef":
+                text += token
+                yield text
+                if len(instance.objects) > 1:
+                    objects.append(instance.objects[1].object)
+        chat_feed.message_params = {"stream_batch_size": 2}
+        chat_feed.callback = callback
+        chat_feed.send("Message", respond=True)
+        await async_wait_until(lambda: len(chat_feed.objects) == 2)
+        await async_wait_until(lambda: chat_feed.objects[1].object == "abcdef")
+        assert "abc" in objects
+
     @pytest.mark.parametrize("replace", [True, False])
     async def test_stream_originally_none_message(self, chat_feed, replace):
         def callback(contents, user, instance):
@@ -15,7 +15,7 @@ from panel.layout import Column, Row
 from panel.pane.image import PNG, SVG, Image
 from panel.pane.markup import HTML, DataFrame, Markdown
 from panel.pane.media import Audio
-from panel.tests.util import mpl_available, mpl_figure
+from panel.tests.util import async_wait_until, mpl_available, mpl_figure
 from panel.widgets.button import Button
 from panel.widgets.input import (
     FileInput, IntInput, TextAreaInput, TextInput,
@@ -171,6 +171,55 @@ class TestChatMessage:
         assert isinstance(object_pane, Markdown)
         assert object_pane.object == "I am a file"
 
+    def test_stream(self):
+        message = ChatMessage(object="Hello")
+        message.stream(" World")
+        assert message.object == "Hello World"
+        message.stream("Bye", replace=True)
+        assert message.object == "Bye"
+
+    def test_stream_batch_size(self):
+        message = ChatMessage(object="", stream_batch_size=3)
+        for token in "abcdefg":
+            message.stream(token)
+        assert message.object == "abcdef"
+        message.flush()
+        assert message.object == "abcdefg"
+
+    def test_stream_batch_size_replace(self):
+        message = ChatMessage(object="", stream_batch_size=3)
+        objects = []
+        for token in "abcdefg":
+            message.stream(token, replace=True)
+            objects.append(message.object)
+        assert objects == ["", "", "c", "c", "c", "f", "f"]
+        message.flush()
+        assert message.object == "g"
+
+    async def test_stream_batch_size_trailing_flush(self):
+        message = ChatMessage(object="", stream_batch_size=3)
+        for token in "abcd":
+            message.stream(token)
+        assert message.object == "abc"
+        await async_wait_until(lambda: message.object == "abcd")
+
+    def test_stream_interval(self):
+        message = ChatMessage(object="", stream_interval=60)
+        message.stream("a")
+        message.stream("b", replace=True)
+        message.stream("c")
+        assert message.object == "a"
+        message.flush()
+        assert message.object == "bc"
+
+    def test_stream_interval_update_discards_buffer(self):
+        message = ChatMessage(object="", stream_interval=60)
+        message.stream("a")
+        message.stream("b")
+        message.update("Final")
+        message.flush()
+        assert message.object == "Final"
+
     @pytest.mark.flaky(reruns=3, reason="Minute can change during test run")
     def test_update_timestamp(self):
         message = ChatMessage()
@@ -164,6 +164,45 @@ def test_serve_num_procs_setup(tmp_path):
         assert pid1 != pid2
 
 
+@unix_only
+def test_serve_sticky_sessions(tmp_path):
+    from bokeh.client import pull_session
+    from bokeh.util.token import get_session_id
+
+    app = "import os; import panel as pn; pn.panel(f'PID {os.getpid()}').servable()"
+    py = tmp_path / "app.py"
+    py.write_text(app)
+
+    with run_panel_serve(["--port", "0", py, "--num-procs", 2, "--sticky-sessions"], cwd=tmp_path) as p:
+        nbsr = NBSR(p.stdout)
+        port, = wait_for_regex(nbsr, regex=re.compile(r'Panel router running at: http://localhost:(\d+)/'))
+        wait_for_regex(nbsr, regex=re.compile(r'Worker \d+ \(pid (\d+)\) listening'), count=2)
+        pids = set()
+        for _ in range(4):
+            r = requests.get(f"http://localhost:{port}/app")
+            assert r.status_code == 200
+            session_id = get_session_id(re.search(r'"token": ?"([^"]+)"', r.text).group(1))
+            session_pids = set()
+            for _ in range(3):
+                with pull_session(session_id=session_id, url=f"http://localhost:{port}/app") as session:
+                    session_pids.add(re.search(r'PID (\d+)', session.document.roots[0].text).group(1))
+            # The websocket of a session always reaches the worker that created it
+            assert len(session_pids) == 1
+            pids |= session_pids
+        # New sessions are balanced across the workers
+        assert len(pids) == 2
+
+
+@pytest.mark.parametrize('args', [[], ["--num-procs", 2, "--autoreload"]])
+def test_serve_sticky_sessions_invalid(tmp_path, args):
+    app = "import panel as pn; pn.panel('Hello').servable()"
+    py = tmp_path / "app.py"
+    py.write_text(app)
+
+    with run_panel_serve(["--port", "0", py, "--sticky-sessions", *args], cwd=tmp_path) as p:
+        wait_for_regex(p.stdout, regex=re.compile(r'(--sticky-sessions (?:routes|cannot))'))
+
+
 def test_serve_setup(tmp_path):
     app = "import panel as pn; pn.panel('Hello').servable()"
     py = tmp_path / "app.py"
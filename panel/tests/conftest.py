@@ -33,7 +33,7 @@ from panel.io.compile import check_cli_tool
 from panel.io.reload import (
     _local_modules, _modules, _watched_files, async_file_watcher, watch,
 )
-from panel.io.resources import EXTENSION_CDN
+from panel.io.resources import EXTENSION_CDN, clear_bundle_cache
 from panel.io.state import set_curdoc, state
 from panel.pane import HTML, Markdown
 from panel.tests.util import (
@@ -484,6 +484,7 @@ def server_cleanup():
 @pytest.fixture(autouse=True)
 def cache_cleanup():
     state.clear_caches()
+    clear_bundle_cache()
     Design._resolve_modifiers.cache_clear()
     Design._cache.clear()
 
@@ -1,6 +1,12 @@
+import asyncio
 import datetime as dt
+import importlib
 import io
+import os
 import pathlib
+import random
+import sys
+import threading
 import time
 
 from collections import Counter
@@ -18,7 +24,10 @@ except Exception:
 diskcache_available = pytest.mark.skipif(diskcache is None, reason="requires diskcache")
 
 from panel.config import config
-from panel.io.cache import _generate_hash, cache, is_equal
+from panel.io.cache import (
+    _IDENTITY_HASHES, CacheStore, MemoryStore, SharedStore, _generate_hash,
+    _sizeof, cache, compute_hash, is_equal,
+)
 from panel.io.state import set_curdoc, state
 from panel.tests.util import serve_and_wait
 
@@ -184,6 +193,86 @@ def test_polars_series_hash():
     ser2 = ser2.replace(0.0, 3.14)
     assert not hashes_equal(ser1, ser2)
 
+def test_large_dataframe_hash_sampled():
+    df = pd.DataFrame({'a': np.arange(1_000_000), 'b': np.random.rand(1_000_000)})
+    df2 = df.copy()
+    df2.iloc[1, 0] = -1
+    assert hashes_equal(df, df.copy())
+    # Unsampled rows are not considered in the sample mode
+    assert hashes_equal(df, df2)
+    assert not hashes_equal(df, df.iloc[:-1])
+
+def test_large_dataframe_hash_full():
+    df = pd.DataFrame({'a': np.arange(1_000_000)})
+    df2 = df.copy()
+    df2.iloc[1, 0] = -1
+    assert compute_hash(None, {}, (df,), {}, 'full') != compute_hash(None, {}, (df2,), {}, 'full')
+    assert compute_hash(None, {}, (df,), {}, 'full') == compute_hash(None, {}, (df.copy(),), {}, 'full')
+
+def test_large_ndarray_hash_full():
+    arr = np.arange(1_000_000)
+    arr2 = arr.copy()
+    arr2[1] = -1
+    assert hashes_equal(arr, arr2)
+    assert compute_hash(None, {}, (arr,), {}, 'full') != compute_hash(None, {}, (arr2,), {}, 'full')
+
+@pytest.mark.parametrize('obj', [
+    lambda: np.arange(1_000_000),
+    lambda: pd.DataFrame({'a': np.arange(1_000_000)}),
+])
+def test_large_object_hash_identity(obj):
+    obj = obj()
+    hash_value = compute_hash(None, {}, (obj,), {}, 'identity')
+    assert id(obj) in _IDENTITY_HASHES
+    assert compute_hash(None, {}, (obj,), {}, 'identity') == hash_value
+    # Equal objects hash equally
+    assert compute_hash(None, {}, (obj.copy(),), {}, 'identity') == hash_value
+    key = id(obj)
+    del obj
+    assert key not in _IDENTITY_HASHES
+
+def test_large_object_hash_identity_reused():
+    df = pd.DataFrame({'a': np.arange(1_000_000)})
+    hash_value = compute_hash(None, {}, (df,), {}, 'identity')
+    # In-place modifications which do not change the shape or dtypes
+    # are not detected
+    df.iloc[0, 0] = -1
+    assert compute_hash(None, {}, (df,), {}, 'identity') == hash_value
+    df['b'] = 1
+    assert compute_hash(None, {}, (df,), {}, 'identity') != hash_value
+
+def test_cache_hash_mode_full():
+    calls = []
+
+    @cache(hash_mode='full')
+    def compute(arr):
+        calls.append(arr)
+        return arr.sum()
+
+    arr = np.zeros(1_000_000)
+    compute(arr)
+    arr2 = arr.copy()
+    arr2[1] = 1
+    assert compute(arr2) == 1
+    assert len(calls) == 2
+
+def test_override_hash_funcs_clears_resolved_hash_funcs():
+    assert hashes_equal(1, 1)
+    assert compute_hash(None, {int: lambda x: b'0'}, (1,), {}) == compute_hash(None, {int: lambda x: b'0'}, (2,), {})
+    assert not hashes_equal(1, 2)
+
+def test_predicate_hash_funcs_evaluated_per_object():
+    class Item:
+        def __init__(self, special):
+            self.special = special
+
+    hash_funcs = {lambda x: getattr(x, 'special', False): lambda x: b'special'}
+    regular = Item(False)
+    assert (
+        compute_hash(None, hash_funcs, (regular, Item(True)), {}) ==
+        compute_hash(None, hash_funcs, (regular, Item(True)), {})
+    )
+
 def test_ufunc_hash():
     assert hashes_equal(np.absolute, np.absolute)
     assert not hashes_equal(np.sin, np.cos)
@@ -363,6 +452,361 @@ def test_cache_ttl(to_disk, tmp_path):
     time.sleep(0.2)
     assert fn(0, 0) == 1
 
+def test_sizeof_arrays_and_dataframes():
+    arr = np.zeros(100_000)
+    df = pd.DataFrame({'a': arr, 'b': ['foo'] * 100_000})
+    assert _sizeof(arr) == arr.nbytes
+    assert _sizeof(df) == df.memory_usage(deep=True).sum()
+    assert _sizeof({'arr': arr, 'df': df}) > arr.nbytes + df.memory_usage(deep=True).sum()
+
+@pytest.mark.parametrize('policy', ('fifo', 'lfu', 'lru'))
+def test_cache_max_bytes(policy):
+    calls = []
+
+    @cache(max_bytes=2_500_000, policy=policy)
+    def compute(i):
+        calls.append(i)
+        return np.full(100_000, i, dtype='float64') # 800 KB
+
+    compute(0)
+    compute(0)
+    compute(1)
+    compute(2)
+    store, = state._memoize_cache.values()
+    assert store.nbytes == 2_400_000
+    compute(3) # Evicts one of the entries
+    assert store.nbytes == 2_400_000
+    assert len(store) == 3
+    evicted = 1 if policy == 'lfu' else 0
+    compute(evicted)
+    assert calls == [0, 1, 2, 3, evicted]
+
+def test_cache_max_bytes_keeps_single_large_entry():
+    @cache(max_bytes=1000)
+    def compute(i):
+        return np.zeros(1000)
+
+    compute(0)
+    compute(1)
+    store, = state._memoize_cache.values()
+    assert len(store) == 1
+    assert compute.stats()['misses'] == 2
+
+def test_cache_global_max_bytes():
+    @cache
+    def compute1(i):
+        return np.zeros(100_000)
+
+    @cache
+    def compute2(i):
+        return np.zeros(100_000)
+
+    with config.set(cache_max_bytes=2_000_000):
+        compute1(0)
+        compute2(0)
+        compute1(0)
+        compute2(1) # Evicts compute2(0) since it was least recently used
+    store1, store2 = state._memoize_cache.values()
+    assert len(store1) == 1
+    assert len(store2) == 1
+    assert store1.nbytes + store2.nbytes == 1_600_000
+
+@pytest.mark.parametrize('policy', ('FIFO', 'LFU', 'LRU'))
+def test_memory_store_evicts_like_metadata(policy):
+    store = MemoryStore('test', policy=policy)
+    rng = random.Random(1)
+    for i in range(200):
+        key = str(rng.randint(0, 30))
+        if key in store and rng.random() > 0.3:
+            store.hit(key, i)
+        elif rng.random() > 0.8 and len(store):
+            evict = store._evict_key(policy, i)
+            expected = CacheStore._evict_key(store, policy, i)
+            if policy == 'LFU':
+                # Ties between equally frequently used entries may differ
+                assert store._entries[evict][2] == store._entries[expected][2]
+            else:
+                assert evict == expected
+            del store[evict]
+        else:
+            store.put(key, i, i)
+
+def test_memory_store_cleanup_ttl():
+    store = MemoryStore('test')
+    for i in range(5):
+        store.put(str(i), i, i)
+    store.hit('0', 10)
+    store.cleanup_ttl(2, 5)
+    assert store.keys() == ['3', '4']
+
+def test_memory_store_concurrent_updates():
+    stores = [MemoryStore(f'test{i}', max_bytes=20_000, policy='LFU') for i in range(2)]
+    for store in stores:
+        state._memoize_cache[store.namespace] = store
+
+    def update(seed):
+        rng = random.Random(seed)
+        for i in range(2000):
+            store = rng.choice(stores)
+            key = str(rng.randint(0, 20))
+            try:
+                store.hit(key, i)
+            except KeyError:
+                store.put(key, np.zeros(rng.randint(1, 500)), i)
+            store.cleanup_ttl(1000, i)
+
+    interval = sys.getswitchinterval()
+    # Switch threads frequently to interleave the updates
+    sys.setswitchinterval(1e-6)
+    try:
+        with config.set(cache_max_bytes=30_000):
+            threads = [threading.Thread(target=update, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    for store in stores:
+        assert set(store._recency) == set(store._entries)
+        assert {k for bucket in store._frequencies.values() for k in bucket} == set(store._entries)
+        assert store.nbytes == sum(store._sizes.values())
+        assert set(store._sizes) == set(store._entries)
+
+def test_cache_coalesces_concurrent_misses():
+    calls = []
+
+    @cache
+    def compute(a):
+        calls.append(a)
+        time.sleep(0.2)
+        return a
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(compute(1)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1, 1, 1, 1]
+    assert calls == [1]
+    assert compute(1) == 1
+    assert compute.stats() == {'hits': 1, 'misses': 1, 'coalesced': 3}
+
+@pytest.mark.asyncio
+async def test_async_cache_coalesces_concurrent_misses():
+    calls = []
+
+    @cache
+    async def compute(a):
+        calls.append(a)
+        await asyncio.sleep(0.1)
+        return a
+
+    results = await asyncio.gather(*(compute(1) for _ in range(4)))
+    assert results == [1, 1, 1, 1]
+    assert calls == [1]
+    assert compute.stats() == {'hits': 0, 'misses': 1, 'coalesced': 3}
+
+def test_cache_coalesced_exception_not_cached():
+    calls = []
+
+    @cache
+    def compute(a):
+        calls.append(a)
+        time.sleep(0.1)
+        if len(calls) == 1:
+            raise ValueError('Failed')
+        return a
+
+    errors = []
+    def run():
+        try:
+            compute(1)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3
+    assert compute(1) == 1
+    assert calls == [1, 1]
+
+@pytest.mark.parametrize('policy', ('fifo', 'lfu', 'lru'))
+def test_shared_cache_policy(policy, tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(function_with_args, max_items=2, policy=policy, store='shared', cache_path=tmp_path)
+    assert fn(0, 0) == 0
+    assert fn(0, 0) == 0
+    assert fn(0, 1) == 1
+    assert fn(0, 2) == 2
+    assert len(list(tmp_path.glob('*/[!.]*'))) == 2
+    evicted = (0, 1) if policy == 'lfu' else (0, 0)
+    assert fn(*evicted) == sum(evicted) + 1
+
+def test_shared_cache_clear(tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(function_with_args, store='shared', cache_path=tmp_path)
+    assert fn(0, 0) == 0
+    assert fn(0, 0) == 0
+    fn.clear()
+    assert fn(0, 0) == 1
+
+def test_shared_cache_ttl(tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(function_with_args, ttl=0.1, store='shared', cache_path=tmp_path)
+    assert fn(0, 0) == 0
+    time.sleep(0.2)
+    assert fn(0, 0) == 1
+
+@pytest.mark.asyncio
+async def test_async_shared_cache(tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(async_function_with_args, store='shared', cache_path=tmp_path)
+    assert (await fn(0, 0)) == 0
+    assert (await fn(0, 0)) == 0
+
+def test_shared_cache_shared_between_stores(tmp_path):
+    # Separate store instances behave like separate processes
+    store1, store2 = SharedStore('fn', tmp_path), SharedStore('fn', tmp_path)
+    store1.put('key', {'a': 1}, 0)
+    assert 'key' in store2
+    assert store2.hit('key', 1) == {'a': 1}
+    assert list(store1.metadata()) == [('key', 0, 1, 1)]
+
+def test_shared_cache_locks_computation(tmp_path):
+    store1, store2 = SharedStore('fn', tmp_path), SharedStore('fn', tmp_path)
+    assert store1.acquire('key')
+    assert not store2.acquire('key', blocking=False)
+    store1.release('key')
+    assert store2.acquire('key', blocking=False)
+    store2.release('key')
+
+def test_shared_cache_removes_lock_files(tmp_path):
+    store = SharedStore('fn', tmp_path)
+    for key in ('a', 'b'):
+        with store.lock(key):
+            store.put(key, key, 0)
+    lock_dir = tmp_path / 'fn' / '.locks'
+    assert sorted(p.name for p in lock_dir.iterdir()) == ['a', 'b']
+    del store['a']
+    assert [p.name for p in lock_dir.iterdir()] == ['b']
+    store.clear()
+    assert list(lock_dir.iterdir()) == []
+
+def test_shared_cache_keeps_held_lock_files(tmp_path):
+    store1, store2 = SharedStore('fn', tmp_path), SharedStore('fn', tmp_path)
+    store1.put('key', 1, 0)
+    assert store2.acquire('key')
+    del store1['key']
+    assert (tmp_path / 'fn' / '.locks' / 'key').exists()
+    store2.release('key')
+
+def test_shared_cache_lock_reacquired_after_removal(tmp_path):
+    store1, store2 = SharedStore('fn', tmp_path), SharedStore('fn', tmp_path)
+    store1.put('key', 1, 0)
+    assert store1.acquire('key')
+    acquired, done = threading.Event(), threading.Event()
+
+    def wait():
+        store2.acquire('key')
+        acquired.set()
+        done.wait()
+        store2.release('key')
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    time.sleep(0.1)
+    # Removing the entry while holding the lock removes the lock file
+    del store1['key']
+    assert not (tmp_path / 'fn' / '.locks' / 'key').exists()
+    store1.release('key')
+    assert acquired.wait(5)
+    # The waiting store acquired the lock on the recreated lock file
+    assert not SharedStore('fn', tmp_path).acquire('key', blocking=False)
+    done.set()
+    thread.join()
+
+def test_shared_cache_single_computation(tmp_path):
+    calls = []
+
+    def compute(a):
+        calls.append(a)
+        time.sleep(0.2)
+        return a
+
+    fn = cache(compute, store='shared', cache_path=tmp_path)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(fn(1)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1, 1, 1, 1]
+    assert calls.count(1) == 1
+
+def test_shared_cache_max_bytes(tmp_path):
+    store = SharedStore('fn', tmp_path, max_bytes=1500)
+    store.put('a', b'0'*1000, 0)
+    store.put('b', b'0'*1000, 1)
+    assert store.keys() == ['b']
+    assert store.nbytes <= 1500
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permissions")
+def test_shared_cache_private_directory(tmp_path):
+    SharedStore('fn', tmp_path)
+    assert (tmp_path / 'fn').stat().st_mode & 0o777 == 0o700
+    assert (tmp_path / 'fn' / '.locks').stat().st_mode & 0o777 == 0o700
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permissions")
+def test_shared_cache_rejects_shared_directory(tmp_path):
+    directory = tmp_path / 'fn'
+    directory.mkdir()
+    directory.chmod(0o777)
+    with pytest.raises(PermissionError):
+        SharedStore('fn', tmp_path)
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permissions")
+def test_shared_cache_default_directory_per_user(tmp_path, monkeypatch):
+    cache_module = importlib.import_module('panel.io.cache')
+    assert str(os.getuid()) in os.path.basename(cache_module._shared_cache_dir())
+    root = tmp_path / 'shared'
+    monkeypatch.setattr(cache_module, '_shared_cache_dir', lambda: str(root))
+    SharedStore('fn')
+    assert root.stat().st_mode & 0o777 == 0o700
+
+def test_as_cached_shared_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(importlib.import_module('panel.io.cache'), '_shared_cache_dir', lambda: str(tmp_path))
+    calls = []
+
+    def load(value):
+        calls.append(value)
+        return value
+
+    try:
+        with config.set(cache_store='shared'):
+            assert state.as_cached('test', load, value=1) == 1
+            assert state.as_cached('test', load, value=1) == 1
+            assert state.as_cached('test', load, value=2) == 2
+    finally:
+        state._cache_stores.clear()
+    assert calls == [1, 2]
+    assert len(list((tmp_path / 'as_cached').glob('[!.]*'))) == 2
+
 def test_cache_on_undecorated_parameterized_method():
     class Model(param.Parameterized):
         data = param.Parameter(default=1)
@@ -0,0 +1,67 @@
+import gc
+
+import pytest
+
+from panel.config import config
+from panel.io import content
+from panel.io.content import (
+    clear_content, content_url, register_content, resolve_content,
+)
+
+
+class Owner:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    clear_content()
+    yield
+    clear_content()
+
+
+def test_register_content_by_hash():
+    key = register_content(b'abc', 'image/png')
+    assert key == register_content(b'abc', 'image/png')
+    assert resolve_content(key) == (b'abc', 'image/png')
+
+
+def test_resolve_content_unknown():
+    assert resolve_content('unknown') is None
+
+
+def test_content_url_requires_server_session(document):
+    with config.set(content_url_threshold=0):
+        assert content_url(b'abc', 'image/png') is None
+
+
+def test_content_url(server_document):
+    with config.set(content_url_threshold=2):
+        assert content_url(b'ab', 'image/png') is None
+        url = content_url(b'abc', 'image/png')
+    key = register_content(b'abc', 'image/png')
+    assert url == f'content/{key}.png'
+
+
+def test_content_evicts_unused(monkeypatch):
+    monkeypatch.setattr(content, 'MAX_CONTENT_BYTES', 5)
+    owner = Owner()
+    used = register_content(b'abc', 'image/png', owner)
+    unused = register_content(b'def', 'image/png')
+    register_content(b'ghi', 'image/png')
+    assert resolve_content(used) is not None
+    assert resolve_content(unused) is None
+
+
+def test_content_released_by_owner(monkeypatch):
+    monkeypatch.setattr(content, 'MAX_CONTENT_BYTES', 5)
+    owner = Owner()
+    old = register_content(b'abc', 'image/png', owner)
+    new = register_content(b'def', 'image/png', owner)
+    register_content(b'ghi', 'image/png')
+    assert resolve_content(old) is None
+    assert resolve_content(new) is not None
+    del owner
+    gc.collect()
+    register_content(b'jkl', 'image/png')
+    assert resolve_content(new) is None
@@ -10,14 +10,21 @@ import pytest
 import tornado.locks
 
 from bokeh.document import Document
-from bokeh.document.events import MessageSentEvent
+from bokeh.document.events import (
+    ColumnsStreamedEvent, MessageSentEvent, ModelChangedEvent,
+)
+from bokeh.models import ColumnDataSource, Div, Row
+from bokeh.protocol import Protocol
 
 import panel as pn
 
 from panel.io.document import (
-    _UNCONNECTED_EVENTS, _WRITE_BLOCK, _cleanup_doc, _destroy_document,
-    _write_tasks, extra_socket_handlers, hold, schedule_write_events, unlocked,
+    _PENDING_WRITES, _UNCONNECTED_EVENTS, _WRITE_BLOCK, _WRITE_BYTES,
+    _WRITE_MSGS, _WRITE_STATS, _cleanup_doc, _destroy_document,
+    _write_tasks, extra_socket_handlers, hold, schedule_write_events,
+    unlocked, write_events,
 )
+from panel.config import config
 from panel.io.state import _state, set_curdoc, state
 from panel.tests.util import serve_and_request, wait_until
 from panel.widgets import IntSlider
@@ -288,3 +295,149 @@ async def test_dispatch_msgs_terminates_on_document_destroy():
         assert ref() is None
     finally:
         extra_socket_handlers.pop(_FakeSocket, None)
+
+
+class _SlowSocket(_FakeSocket):
+    def __init__(self):
+        super().__init__(lock_held=True)
+        self.closed = None
+
+    def close(self, code=None, reason=None):
+        self.closed = (code, reason)
+
+
+class _SlowConn:
+    def __init__(self):
+        self._socket = _SlowSocket()
+        self.protocol = Protocol()
+
+
+@pytest.fixture
+def slow_conn():
+    extra_socket_handlers[_SlowSocket] = lambda conn, msg=None: []
+    try:
+        yield _SlowConn()
+    finally:
+        extra_socket_handlers.pop(_SlowSocket, None)
+
+
+@pytest.mark.asyncio
+async def test_schedule_write_events_coalesces_superseded_changes(slow_conn):
+    doc = Document()
+    div = Div(text='a')
+    doc.add_root(div)
+
+    for text in ('b', 'c', 'd'):
+        schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, div, 'text', text)])
+        await asyncio.sleep(0.01)
+
+    msgs = _WRITE_MSGS[doc][slow_conn]
+    assert len(msgs) == 1
+    assert msgs[0].content['events'][0]['new'] == 'd'
+    assert _WRITE_STATS[doc].coalesced_events == 2
+    assert _WRITE_BYTES[doc][slow_conn] > 0
+    doc.destroy = partial(_destroy_document, doc)
+    doc.destroy(None)
+
+
+@pytest.mark.asyncio
+async def test_schedule_write_events_coalesces_streamed_changes(slow_conn):
+    doc = Document()
+    cds = ColumnDataSource(data={'a': [1, 2]})
+    doc.add_root(cds)
+
+    schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, cds, 'data', {'a': [3]})])
+    schedule_write_events(doc, [slow_conn], [ColumnsStreamedEvent(doc, cds, 'data', {'a': [4]}, None)])
+    schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, cds, 'data', {'a': [5]})])
+    await asyncio.sleep(0.01)
+
+    msgs = _WRITE_MSGS[doc][slow_conn]
+    assert len(msgs) == 1
+    assert [e['kind'] for e in msgs[0].content['events']] == ['ModelChanged']
+    assert _WRITE_STATS[doc].coalesced_events == 2
+    doc.destroy = partial(_destroy_document, doc)
+    doc.destroy(None)
+
+
+class _PendingSocket:
+    pass
+
+
+class _PendingConn:
+    def __init__(self):
+        self._socket = _PendingSocket()
+        self.protocol = Protocol()
+        self.futures = []
+        self.written = []
+
+
+@pytest.mark.asyncio
+async def test_write_events_queues_writes_until_pending_writes_flushed():
+    def dispatch(conn, events=None, msg=None):
+        conn.written.append(msg or events)
+        future = asyncio.get_running_loop().create_future()
+        conn.futures.append(future)
+        return [future]
+
+    extra_socket_handlers[_PendingSocket] = dispatch
+    try:
+        doc = Document()
+        div = Div(text='a')
+        doc.add_root(div)
+        conn = _PendingConn()
+
+        write_events(doc, [conn], [ModelChangedEvent(doc, div, 'text', 'b')])
+        assert _PENDING_WRITES[doc] == set(conn.futures)
+
+        schedule_write_events(doc, [conn], [ModelChangedEvent(doc, div, 'text', 'c')])
+        await asyncio.sleep(0.01)
+        assert len(conn.written) == 1
+        assert len(_WRITE_MSGS[doc][conn]) == 1
+
+        conn.futures[0].set_result(None)
+        await asyncio.sleep(0.01)
+        assert not _PENDING_WRITES[doc]
+        assert len(conn.written) == 2
+
+        conn.futures[1].set_result(None)
+        doc.destroy = partial(_destroy_document, doc)
+        doc.destroy(None)
+    finally:
+        extra_socket_handlers.pop(_PendingSocket, None)
+
+
+@pytest.mark.asyncio
+async def test_schedule_write_events_keeps_model_definitions(slow_conn):
+    doc = Document()
+    row = Row()
+    doc.add_root(row)
+
+    div1, div2 = Div(text='a'), Div(text='b')
+    schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, row, 'children', [div1])])
+    schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, row, 'children', [div2])])
+    await asyncio.sleep(0.01)
+
+    assert len(_WRITE_MSGS[doc][slow_conn]) == 2
+    assert _WRITE_STATS[doc].coalesced_events == 0
+    doc.destroy = partial(_destroy_document, doc)
+    doc.destroy(None)
+
+
+@pytest.mark.asyncio
+async def test_schedule_write_events_drops_slow_connection(slow_conn):
+    doc = Document()
+    div = Div(text='a')
+    doc.add_root(div)
+
+    with config.set(websocket_queue_limit=1000):
+        schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, div, 'text', 'b')])
+        assert slow_conn._socket.closed is None
+        schedule_write_events(doc, [slow_conn], [ModelChangedEvent(doc, div, 'styles', {'a': 'b'*1000})])
+    await asyncio.sleep(0.01)
+
+    assert slow_conn._socket.closed is not None
+    assert slow_conn not in _WRITE_MSGS.get(doc, {})
+    assert _WRITE_STATS[doc].dropped_connections == 1
+    doc.destroy = partial(_destroy_document, doc)
+    doc.destroy(None)
+
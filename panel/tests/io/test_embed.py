@@ -11,9 +11,11 @@ from bokeh.models import CustomJS
 
 from panel import Row
 from panel.config import config
-from panel.io.embed import embed_state
-from panel.pane import Str
+from panel.depends import bind
+from panel.io.embed import EmbedProgress, embed_state
+from panel.pane import Markdown, Str
 from panel.param import Param
+from panel.tests.util import unix_only
 from panel.widgets import (
     Checkbox, EditableFloatSlider, FloatSlider, IntSlider, Select, StaticText,
 )
@@ -83,7 +85,7 @@ def test_embed_select_str_link(document, comm):
     _, state = document.roots
     assert set(state.state) == {'A', 'B', 'C'}
     for k, v in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 1
@@ -107,7 +109,7 @@ def test_embed_float_slider_explicit_values(document, comm):
     assert set(state.state) == {0, 1, 2}
     states = {0: 0.1, 1: 0.7, 2: 1}
     for (k, v) in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 2
@@ -136,7 +138,7 @@ def test_embed_editable_float_slider_explicit_values(document, comm):
     assert set(state.state) == {0, 1, 2}
     states = {0: 0.1, 1: 0.7, 2: 1}
     for (k, v) in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 4
@@ -201,7 +203,7 @@ def test_embed_select_explicit_values(document, comm):
     _, state = document.roots
     assert set(state.state) == {'A', 'B'}
     for k, v in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 1
@@ -251,7 +253,7 @@ def test_embed_select_str_link_two_steps(document, comm):
     _, state = document.roots
     assert set(state.state) == {'A', 'B', 'C'}
     for k, v in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 2
@@ -280,7 +282,7 @@ def test_embed_select_str_link_with_secondary_watch(document, comm):
     _, state = document.roots
     assert set(state.state) == {'A', 'B', 'C'}
     for k, v in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 1
@@ -357,7 +359,7 @@ def test_embed_checkbox_str_link(document, comm):
     _, state = document.roots
     assert set(state.state) == {False, True}
     for k, v in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 1
@@ -435,7 +437,7 @@ def test_embed_slider_str_link(document, comm):
     assert set(state.state) == {0, 1, 2}
     values = [0, 5, 10]
     for k, v in state.state.items():
-        content = json.loads(v['content'])
+        content = json.loads(state.patches[v]['content'])
         assert 'events' in content
         events = content['events']
         assert len(events) == 2
@@ -526,21 +528,21 @@ def test_embed_merged_sliders(document, comm):
     ref1, ref2 = model.children[2].ref['id'], model.children[3].ref['id']
     ref3 = model.children[0].children[0].ref['id']
     ref4 = model.children[1].children[0].ref['id']
-    state0 = json.loads(state_model.state[0]['content'])['events']
+    state0 = json.loads(state_model.patches[state_model.state[0]]['content'])['events']
     assert state0 == [
         {'attr': 'text', 'kind': 'ModelChanged', 'model': {'id': ref3}, 'new': 'A: <b>1</b>',},
         {"attr": "text", "kind": "ModelChanged", "model": {"id": ref1}, "new": "1"},
         {'attr': 'text', 'kind': 'ModelChanged', 'model': {'id': ref4}, 'new': 'A: <b>1</b>',},
         {"attr": "text", "kind": "ModelChanged", "model": {"id": ref2}, "new": "1"}
     ]
-    state1 = json.loads(state_model.state[1]['content'])['events']
+    state1 = json.loads(state_model.patches[state_model.state[1]]['content'])['events']
     assert state1 == [
         {'attr': 'text', 'kind': 'ModelChanged', 'model': {'id': ref3}, 'new': 'A: <b>5</b>'},
         {"attr": "text", "kind": "ModelChanged", "model": {"id": ref1}, "new": "5"},
         {'attr': 'text', 'kind': 'ModelChanged', 'model': {'id': ref4}, 'new': 'A: <b>5</b>'},
         {"attr": "text", "kind": "ModelChanged", "model": {"id": ref2}, "new": "5"}
     ]
-    state2 = json.loads(state_model.state[2]['content'])['events']
+    state2 = json.loads(state_model.patches[state_model.state[2]]['content'])['events']
     assert state2 == [
         {'attr': 'text', 'kind': 'ModelChanged', 'model': {'id': ref3}, 'new': 'A: <b>9</b>'},
         {"attr": "text", "kind": "ModelChanged", "model": {"id": ref1}, "new": "9"},
@@ -549,6 +551,86 @@ def test_embed_merged_sliders(document, comm):
     ]
 
 
+def test_embed_deduplicates_patches(document, comm):
+    select = Select(options=['A', 'B', 'C', 'D'])
+    string = Str()
+    def link(target, event):
+        target.object = 'X' if event.new in 'BD' else 'Y'
+    select.link(string, callbacks={'value': link})
+    panel = Row(select, string)
+    with config.set(embed=True):
+        model = panel.get_root(document, comm)
+    state_model = embed_state(panel, model, document, states={select: ['A', 'B', 'C', 'D']})
+    assert set(state_model.state) == {'A', 'B', 'C', 'D'}
+    assert state_model.state['A'] == state_model.state['C']
+    assert state_model.state['B'] == state_model.state['D']
+    assert state_model.state['A'] != state_model.state['B']
+    assert set(state_model.patches) == set(state_model.state.values())
+
+
+def test_embed_progress_callback(document, comm):
+    select = Select(options=['A', 'B', 'C'])
+    string = Str()
+    def link(target, event):
+        target.object = event.new
+    select.link(string, callbacks={'value': link})
+    panel = Row(select, string)
+    with config.set(embed=True):
+        model = panel.get_root(document, comm)
+    reports = []
+    embed_state(panel, model, document, progress=reports.append)
+    assert [r.completed for r in reports] == [1, 2, 3]
+    assert all(r.total == 3 for r in reports)
+    assert reports[-1].eta == 0
+    assert EmbedProgress(0, 3, 0).eta is None
+
+
+@unix_only
+def test_embed_processes(document, comm):
+    slider = IntSlider(start=0, end=10)
+    string = Str()
+    def link(target, event):
+        target.object = event.new
+    slider.link(string, callbacks={'value': link})
+    panel = Row(slider, string)
+    with config.set(embed=True):
+        model = panel.get_root(document, comm)
+    state_model = embed_state(panel, model, document, max_opts=6, processes=2)
+    assert set(state_model.state) == {0, 1, 2, 3, 4, 5}
+    values = []
+    for v in state_model.state.values():
+        events = json.loads(state_model.patches[v]['content'])['events']
+        values.append(next(e['new'] for e in events if e['new'].startswith('&lt;pre')))
+    assert sorted(values) == sorted(f'&lt;pre&gt;{v}&lt;/pre&gt;' for v in (0, 2, 4, 6, 8, 10))
+
+
+def _defined_models(obj, models):
+    if isinstance(obj, dict):
+        if obj.get('type') == 'object' and 'attributes' in obj:
+            models.append(obj)
+        for v in obj.values():
+            _defined_models(v, models)
+    elif isinstance(obj, list):
+        for v in obj:
+            _defined_models(v, models)
+    return models
+
+
+@unix_only
+def test_embed_processes_unique_model_ids(document, comm):
+    select = Select(options=list('ABCDEFGH'))
+    panel = Row(select, bind(lambda v: Markdown(f'# {v}'), select))
+    with config.set(embed=True):
+        model = panel.get_root(document, comm)
+    state_model = embed_state(panel, model, document, processes=4)
+    ids = []
+    for patch in state_model.patches.values():
+        models = _defined_models(json.loads(patch['content']), [])
+        ids.extend({m['id'] for m in models if m['name'].endswith('HTML')})
+    assert len(ids) == 8
+    assert len(set(ids)) == len(ids)
+
+
 def test_save_embed_bytesio():
     checkbox = Checkbox()
     string = Str()
@@ -588,10 +670,11 @@ def test_save_embed_json(tmpdir):
     paths = glob.glob(os.path.join(str(tmpdir), '*'))
     paths.remove(filename)
     assert len(paths) == 1
-    json_files = sorted(glob.glob(os.path.join(paths[0], '*.json')))
+    json_files = glob.glob(os.path.join(paths[0], '*.json'))
     assert len(json_files) == 2
 
-    for jf, v in zip(json_files, ('False', 'True')):
+    values = []
+    for jf in json_files:
         with open(jf) as f:
             state = json.load(f)
         assert 'content' in state
@@ -601,7 +684,8 @@ def test_save_embed_json(tmpdir):
         event = events[0]
         assert event['kind'] == 'ModelChanged'
         assert event['attr'] == 'text'
-        assert event['new'] == f'&lt;pre&gt;{v}&lt;/pre&gt;'
+        values.append(event['new'])
+    assert sorted(values) == ['&lt;pre&gt;False&lt;/pre&gt;', '&lt;pre&gt;True&lt;/pre&gt;']
 
 def test_embed_widget_disabled(document, comm):
     select = Select(options=['A', 'B', 'C'], disabled=True)
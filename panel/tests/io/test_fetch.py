@@ -0,0 +1,102 @@
+import asyncio
+import http.server
+import threading
+
+import pytest
+
+from panel.io import fetch as fetch_mod
+from panel.io.fetch import cached_content, clear_cache, fetch, fetch_async
+from panel.pane import PNG
+
+with open(__file__.replace('io/test_fetch.py', 'test_data/logo.png'), 'rb') as f:
+    LOGO = f.read()
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+    cache_control = 'max-age=0'
+    requests: list = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == '"logo"':
+            self.send_response(304)
+            self.send_header('Cache-Control', self.cache_control)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(LOGO)))
+        self.send_header('ETag', '"logo"')
+        self.send_header('Cache-Control', self.cache_control)
+        self.end_headers()
+        self.wfile.write(LOGO)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    clear_cache()
+    _Handler.requests = []
+    _Handler.cache_control = 'max-age=0'
+    httpd = http.server.ThreadingHTTPServer(('localhost', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://localhost:{httpd.server_port}'
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        clear_cache()
+
+
+def test_fetch_revalidates_with_etag(http_server):
+    url = f'{http_server}/logo.png'
+    assert fetch(url) == LOGO
+    assert fetch(url) == LOGO
+    assert _Handler.requests == [('/logo.png', None), ('/logo.png', '"logo"')]
+
+
+def test_fetch_uses_max_age(http_server):
+    _Handler.cache_control = 'max-age=60'
+    url = f'{http_server}/logo.png'
+    assert fetch(url) == LOGO
+    assert cached_content(url) == LOGO
+    assert fetch(url) == LOGO
+    assert len(_Handler.requests) == 1
+
+
+def test_fetch_no_store(http_server):
+    _Handler.cache_control = 'no-store'
+    url = f'{http_server}/logo.png'
+    fetch(url)
+    assert url not in fetch_mod._cache
+
+
+@pytest.mark.asyncio
+async def test_fetch_async_shares_inflight_requests(http_server):
+    url = f'{http_server}/logo.png'
+    results = await asyncio.gather(*(fetch_async(url) for _ in range(5)))
+    assert all(r == LOGO for r in results)
+    assert len(_Handler.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_image_fetches_url_in_background(http_server, document, comm):
+    url = f'{http_server}/logo.png'
+    png = PNG(url, embed=True)
+    model = png.get_root(document, comm)
+    png._serving = lambda: True
+    png._url_content = None
+    clear_cache()
+
+    png.object = f'{url}?v=2'
+    assert model.text == '<img></img>'
+
+    for _ in range(50):
+        if png._url_content is not None:
+            break
+        await asyncio.sleep(0.1)
+    assert model.text.startswith('&lt;img src=&quot;data:image/png;base64')
@@ -9,8 +9,9 @@ from packaging.version import Version
 from panel.config import config, panel_extension as extension
 from panel.custom import JSComponent
 from panel.io.resources import (
-    CDN_DIST, DIST_DIR, JS_VERSION, PANEL_DIR, Resources,
-    component_resource_path, resolve_custom_path, resolve_resource_cdn,
+    CDN_DIST, DIST_DIR, JS_VERSION, PANEL_DIR, Resources, _bundle_cache,
+    bundle_resources, clear_bundle_cache, component_resource_path,
+    render_bundle, resolve_custom_path, resolve_resource_cdn,
     resolve_stylesheet, set_resource_mode,
 )
 from panel.io.state import set_curdoc, state
@@ -230,6 +231,43 @@ def test_resources_global_loading_indicator_cdn():
         assert resources.css_raw[0].count('https://cdn.holoviz.org/panel/') == 5
         assert resources.css_raw[0].count('/dist/assets/') == 5
 
+def test_bundle_resources_cached():
+    resources = Resources(mode='cdn')
+    bundle = bundle_resources(None, resources)
+    assert len(_bundle_cache) == 1
+    cached = bundle_resources(None, resources)
+    assert len(_bundle_cache) == 1
+    assert cached is not bundle
+    assert cached.js_files == bundle.js_files
+    assert cached.css_files == bundle.css_files
+    assert tuple(cached) == render_bundle(None, resources)
+
+def test_bundle_resources_cached_copy_not_mutated():
+    resources = Resources(mode='cdn')
+    bundle = bundle_resources(None, resources)
+    bundle.js_raw.append('console.log("mutated")')
+    assert 'console.log("mutated")' not in bundle_resources(None, resources).js_raw
+
+def test_bundle_resources_invalidated_by_config():
+    resources = Resources(mode='cdn')
+    bundle_resources(None, resources)
+    with config.set(raw_css=['.custom { color: red; }']):
+        bundle = bundle_resources(None, resources)
+        assert '.custom { color: red; }' in bundle.css_raw
+    assert len(_bundle_cache) == 2
+    assert '.custom { color: red; }' not in bundle_resources(None, resources).css_raw
+
+def test_bundle_resources_keyed_by_mode():
+    cdn = bundle_resources(None, Resources(mode='cdn'))
+    server = bundle_resources(None, Resources(mode='server'))
+    assert cdn.js_files != server.js_files
+    assert len(_bundle_cache) == 2
+
+def test_clear_bundle_cache():
+    bundle_resources(None, Resources(mode='cdn'))
+    clear_bundle_cache()
+    assert len(_bundle_cache) == 0
+
 def test_component_resource_path_ext_dir():
     assert component_resource_path(
         Button, '_stylesheets', DIST_DIR / 'css' / 'button.css'
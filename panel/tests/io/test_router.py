@@ -0,0 +1,55 @@
+from panel.io.router import SessionRouter
+
+
+def test_router_least_loaded_by_sessions():
+    router = SessionRouter()
+    router.update({'index': 0, 'port': 5000, 'sessions': 3, 'cpu': 0})
+    router.update({'index': 1, 'port': 5001, 'sessions': 1, 'cpu': 0})
+    assert router.least_loaded().index == 1
+
+
+def test_router_least_loaded_by_cpu():
+    router = SessionRouter()
+    router.update({'index': 0, 'port': 5000, 'sessions': 2, 'cpu': 90})
+    router.update({'index': 1, 'port': 5001, 'sessions': 2, 'cpu': 10})
+    assert router.least_loaded().index == 1
+
+
+def test_router_assign_counts_pending_sessions():
+    router = SessionRouter()
+    w0 = router.register(0, 5000)
+    w1 = router.register(1, 5001)
+    assert router.route() is w0
+    router.assign('a', w0)
+    assert router.route() is w1
+    router.assign('b', w1)
+    assert router.route() is w0
+
+
+def test_router_routes_known_session_to_owner():
+    router = SessionRouter()
+    w0 = router.register(0, 5000)
+    router.register(1, 5001)
+    router.assign('a', w0)
+    router.assign('b', w0)
+    assert router.route('a') is w0
+    assert router.route('unknown').index == 1
+
+
+def test_router_report_removes_ended_sessions():
+    router = SessionRouter()
+    w0 = router.register(0, 5000)
+    router.assign('a', w0)
+    router.update({'index': 0, 'port': 5000, 'sessions': 0, 'cpu': 0, 'ended': ['a']})
+    assert router.sessions == {}
+    assert w0.pending == 0
+
+
+def test_router_remove_worker():
+    router = SessionRouter()
+    w0 = router.register(0, 5000)
+    w1 = router.register(1, 5001)
+    router.assign('a', w0)
+    router.remove(0)
+    assert router.sessions == {}
+    assert router.route('a') is w1
@@ -1,7 +1,10 @@
+import asyncio
 import time
 
 from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+
 from panel.io.state import state
 
 
@@ -46,3 +49,143 @@ def test_as_cached_ttl():
     assert state.as_cached('test', test_fn, ttl=0.1) == 1
     time.sleep(0.11)
     assert state.as_cached('test', test_fn, ttl=0.1) == 2
+
+
+def test_as_cached_exception_not_cached():
+    def test_fn(i=[0]):
+        i[0] += 1
+        if i[0] == 1:
+            raise ValueError('Failed')
+        return i[0]
+
+    with pytest.raises(ValueError):
+        state.as_cached('test', test_fn)
+    assert state.as_cached('test', test_fn) == 2
+    assert state._cache_futures == {}
+
+def test_as_cached_stats():
+    def test_fn(a):
+        return list(range(a))
+
+    state.as_cached('test', test_fn, a=10)
+    state.as_cached('test', test_fn, a=10)
+    state.as_cached('test', test_fn, a=10)
+
+    stats, = state.cache_stats
+    assert stats['key'] == 'test'
+    assert stats['kwargs'] == {'a': 10}
+    assert stats['hits'] == 2
+    assert stats['waits'] == 0
+    assert stats['misses'] == 1
+    assert stats['time'] >= 0
+    assert stats['total_time'] == stats['time']
+    assert stats['size'] > 0
+
+def test_as_cached_stats_pruned_on_eviction():
+    state.as_cached('test', lambda a: a, a=1)
+    state.as_cached('test', lambda a: a, a=2)
+    del state.cache[('test', ('a', 1))]
+
+    stats, = state.cache_stats
+    assert stats['kwargs'] == {'a': 2}
+
+    state.cache.clear()
+    state.clear_caches()
+    assert state._cache_stats == {}
+
+def test_as_cached_stats_discarded_on_exception():
+    def test_fn():
+        raise ValueError('Failed')
+
+    with pytest.raises(ValueError):
+        state.as_cached('test', test_fn)
+    assert state.cache_stats == []
+
+async def test_as_cached_async_coroutine():
+    async def test_fn(a, i=[0]):
+        i[0] += 1
+        await asyncio.sleep(0.1)
+        return i[0]
+
+    results = await asyncio.gather(*(
+        state.as_cached_async('test', test_fn, a=1) for _ in range(4)
+    ))
+    assert results == [1, 1, 1, 1]
+    assert await state.as_cached_async('test', test_fn, a=1) == 1
+    stats, = state.cache_stats
+    assert stats['hits'] == 1
+    assert stats['waits'] == 3
+    assert stats['misses'] == 1
+    assert stats['time'] >= 0.1
+
+async def test_as_cached_async_sync_function_off_loop():
+    def test_fn(i=[0]):
+        i[0] += 1
+        time.sleep(0.2)
+        return i[0]
+
+    ticks = []
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    results = await asyncio.gather(
+        state.as_cached_async('test', test_fn),
+        state.as_cached_async('test', test_fn),
+        tick()
+    )
+    assert results[:2] == [1, 1]
+    # The event loop kept running while the value was computed
+    assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.2
+
+async def test_as_cached_async_shares_computation_with_sync():
+    def test_fn(i=[0]):
+        i[0] += 1
+        time.sleep(0.1)
+        return i[0]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(state.as_cached, 'test', test_fn)
+        await asyncio.sleep(0.02)
+        assert await state.as_cached_async('test', test_fn) == 1
+    assert future.result() == 1
+
+async def test_as_cached_async_exception():
+    async def test_fn():
+        raise ValueError('Failed')
+
+    with pytest.raises(ValueError):
+        await state.as_cached_async('test', test_fn)
+    assert state._cache_futures == {}
+
+async def test_as_cached_sync_does_not_block_on_loop_computation():
+    async def test_fn():
+        await asyncio.sleep(0.1)
+        return 'async'
+
+    async def sync_lookup():
+        await asyncio.sleep(0.01)
+        return state.as_cached('test', lambda: 'sync')
+
+    results = await asyncio.wait_for(asyncio.gather(
+        state.as_cached_async('test', test_fn), sync_lookup()
+    ), 1)
+    assert results == ['async', 'sync']
+    assert state.as_cached('test', lambda: 'sync') == 'async'
+
+async def test_as_cached_async_base_exception_resolves_waiters():
+    class Interrupt(BaseException):
+        pass
+
+    async def test_fn():
+        await asyncio.sleep(0.05)
+        raise Interrupt()
+
+    owner = asyncio.ensure_future(state.as_cached_async('test', test_fn))
+    await asyncio.sleep(0.01)
+    with pytest.raises(Interrupt):
+        await asyncio.wait_for(state.as_cached_async('test', test_fn), 1)
+    with pytest.raises(Interrupt):
+        await owner
+    assert state._cache_futures == {}
@@ -800,3 +800,28 @@ def test_compute_sizing_mode_inference_downgrade_does_not_warn(document, comm, c
 
     assert root.sizing_mode == 'stretch_both'
     assert 'being overridden' not in caplog.text
+
+def test_compute_sizing_mode_themed_child(document, comm):
+    col = Column(Markdown('foo'), sizing_mode='stretch_width')
+    root = col.get_root(document, comm=comm)
+    root.children[0].apply_theme({'min_width': 150})
+
+    new_props = col._compute_sizing_mode(root.children, {'margin': 0})
+
+    assert new_props == {'min_width': 150, 'sizing_mode': 'stretch_width'}
+
+def test_append_reuses_existing_child_models(document, comm):
+    mds = [Markdown(str(i)) for i in range(3)]
+    col = Column(*mds)
+    root = col.get_root(document, comm=comm)
+    children = list(root.children)
+
+    col.append(Markdown('new'))
+
+    assert root.children[:3] == children
+    assert len(root.children) == 4
+
+    col.remove(mds[0])
+
+    assert root.children[:2] == children[1:]
+    assert root.ref['id'] not in mds[0]._models
@@ -1,4 +1,5 @@
 from panel import Feed
+from panel.util import edit_readonly
 
 
 def test_feed_init():
@@ -25,3 +26,22 @@ def test_feed_set_objects():
     feed = Feed(height=100)
     feed.objects = list(range(1000))
     assert [o.object for o in feed.objects] == list(range(1000))
+
+
+def test_feed_frees_models_out_of_synced_range(document, comm):
+    feed = Feed(*list(range(100)), load_buffer=10)
+    root = feed.get_root(document, comm=comm)
+    ref = root.ref['id']
+
+    assert [i for i, o in enumerate(feed.objects) if ref in o._models] == list(range(10))
+
+    with edit_readonly(feed):
+        feed.visible_range = (50, 55)
+
+    assert [i for i, o in enumerate(feed.objects) if ref in o._models] == list(range(40, 65))
+    assert [c.text for c in root.children] == [f'&lt;pre&gt;{i}&lt;/pre&gt;' for i in range(40, 65)]
+
+    with edit_readonly(feed):
+        feed.visible_range = (0, 5)
+
+    assert [i for i, o in enumerate(feed.objects) if ref in o._models] == list(range(15))
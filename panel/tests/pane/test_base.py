@@ -9,9 +9,10 @@ from panel.io.loading import LOADING_INDICATOR_CSS_CLASS
 from panel.layout import Row
 from panel.links import CallbackGenerator
 from panel.pane import (
-    Bokeh, HoloViews, Interactive, IPyWidget, Markdown, PaneBase, RGGPlot,
-    Vega,
+    JSON, PNG, Bokeh, HoloViews, Interactive, IPyWidget, Markdown, PaneBase,
+    RGGPlot, Str, Vega,
 )
+from panel.pane.base import _pane_type_cache
 from panel.param import (
     Param, ParamFunction, ParamMethod, ParamRef, ReactiveExpr,
 )
@@ -127,3 +128,41 @@ def test_pane_pad_layout_by_margin():
 
     assert md.layout.width == 354
     assert md.layout.height == 339
+
+
+def test_pane_type_cached_by_type():
+    _pane_type_cache.clear()
+    assert PaneBase.get_pane_type(1) is Str
+    candidates = _pane_type_cache[int]
+    assert PaneBase.get_pane_type(2) is Str
+    assert _pane_type_cache[int] is candidates
+    assert (0, True, Str) in candidates
+    assert Markdown not in candidates
+
+
+def test_pane_type_value_dependent_panes_not_cached():
+    assert PaneBase.get_pane_type('# Title') is Markdown
+    assert PaneBase.get_pane_type('https://panel.holoviz.org/logo.png') is PNG
+    assert PaneBase.get_pane_type({'a': 1}) is JSON
+    assert PNG in _pane_type_cache[str]
+    assert JSON in _pane_type_cache[dict]
+
+
+def test_pane_type_cache_invalidated_by_new_pane():
+    class Custom:
+        pass
+
+    assert PaneBase.get_pane_type(Custom()) is Str
+    assert Custom in _pane_type_cache
+
+    class CustomPane(Markdown):
+
+        priority = 1
+
+        @classmethod
+        def applies(cls, obj):
+            return isinstance(obj, Custom)
+
+    assert Custom not in _pane_type_cache
+    assert PaneBase.get_pane_type(Custom()) is CustomPane
+    assert CustomPane in _pane_type_cache[Custom]
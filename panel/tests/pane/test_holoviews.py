@@ -29,7 +29,10 @@ from panel.layout import (
     Column, FlexBox, HSpacer, Row,
 )
 from panel.pane import HoloViews, PaneBase, panel
-from panel.tests.util import hv_available, mpl_available
+from panel.io.state import set_curdoc, state
+from panel.tests.util import (
+    hv_available, mpl_available, serve_and_request, wait_until,
+)
 from panel.theme import Native
 from panel.util.warnings import PanelDeprecationWarning
 from panel.widgets import (
@@ -425,6 +428,68 @@ def test_holoviews_widgets_update_plot(document, comm):
     assert cds.data['y'] == np.array([1])
 
 
+def _serve_hv_pane(hv_pane):
+    serve_and_request(hv_pane)
+    wait_until(lambda: bool(hv_pane._plots))
+    plot, _ = next(iter(hv_pane._plots.values()))
+    keys = []
+    update = plot.update
+    def recording_update(key):
+        keys.append(key)
+        return update(key)
+    plot.update = recording_update
+    return plot, keys
+
+
+def _execute_on_session(doc, callback):
+    def wrapper():
+        with set_curdoc(doc):
+            callback()
+    with set_curdoc(doc):
+        state.execute(wrapper, schedule=True)
+
+
+@hv_available
+def test_holoviews_widgets_coalesce_updates_on_server():
+    hmap = hv.HoloMap({(i, chr(65+i)): hv.Curve([i]) for i in range(3)}, kdims=['X', 'Y'])
+    hv_pane = HoloViews(hmap, backend='bokeh')
+    plot, keys = _serve_hv_pane(hv_pane)
+    cds = plot.state.select_one({'type': ColumnDataSource})
+
+    def change_widgets():
+        hv_pane.widget_box[0].value = 1
+        hv_pane.widget_box[1].value = 'B'
+
+    _execute_on_session(plot.document, change_widgets)
+
+    wait_until(lambda: list(cds.data['y']) == [1])
+    # Both widget events are rendered as a single frame
+    assert keys == [(1, 'B')]
+
+
+@hv_available
+def test_holoviews_widgets_drop_stale_updates_on_server():
+    hmap = hv.HoloMap({(i, chr(65+i)): hv.Curve([i]) for i in range(3)}, kdims=['X', 'Y'])
+    hv_pane = HoloViews(hmap, backend='bokeh')
+    plot, keys = _serve_hv_pane(hv_pane)
+    cds = plot.state.select_one({'type': ColumnDataSource})
+    update = plot.update
+
+    def slow_update(key):
+        if not keys:
+            # Widget events arriving while the first frame is rendered
+            hv_pane.widget_box[0].value = 2
+            hv_pane.widget_box[1].value = 'C'
+        return update(key)
+
+    plot.update = slow_update
+    _execute_on_session(plot.document, lambda: setattr(hv_pane.widget_box[0], 'value', 1))
+
+    wait_until(lambda: list(cds.data['y']) == [2])
+    # The intermediate frames are never rendered
+    assert keys == [(1, 'A'), (2, 'C')]
+
+
 @hv_available
 def test_holoviews_dynamic_widgets_with_unit_updates_plot(document, comm):
     def function(f):
@@ -9,6 +9,8 @@ import pytest
 
 from requests.exceptions import MissingSchema
 
+from panel.config import config
+from panel.io.content import resolve_content
 from panel.pane import (
     AVIF, GIF, ICO, JPG, PDF, PNG, SVG, WebP,
 )
@@ -135,6 +137,35 @@ def test_image_from_bytes():
     image_data = image_pane._data(img)
     assert b'PNG' in image_data
 
+def test_image_content_url(server_document, comm):
+    with open(Path(__file__).parent.parent / 'test_data' / 'logo.png', 'rb') as f:
+        img = f.read()
+
+    with config.set(content_url_threshold=1000):
+        model = PNG(img).get_root(server_document, comm)
+
+    assert 'data:image/png' not in model.text
+    key = model.text.split('content/')[1].split('.png')[0]
+    assert resolve_content(key) == (img, 'image/png')
+
+def test_image_content_url_below_threshold(server_document, comm):
+    with open(Path(__file__).parent.parent / 'test_data' / 'logo.png', 'rb') as f:
+        img = f.read()
+
+    with config.set(content_url_threshold=len(img)):
+        model = PNG(img).get_root(server_document, comm)
+
+    assert 'data:image/png;base64' in model.text
+
+def test_image_content_url_embed(server_document, comm):
+    with open(Path(__file__).parent.parent / 'test_data' / 'logo.png', 'rb') as f:
+        img = f.read()
+
+    with config.set(content_url_threshold=0):
+        model = PNG(img, embed=True).get_root(server_document, comm)
+
+    assert 'data:image/png;base64' in model.text
+
 def test_loading_a_image_from_pathlib():
     """Tests the loading of a image from a pathlib"""
     filepath = Path(__file__).parent.parent / "test_data" / "logo.png"
@@ -216,6 +216,48 @@ def test_markdown_pane_extensions(document, comm):
     pane.extensions = ["extra", "smarty"]
     assert model.text.startswith('&lt;pre&gt;&lt;code class=&quot;language-python')
 
+_STREAMED_MARKDOWN = """# Title
+
+Some *text* with `code`.
+
+- item 1
+- item 2
+
+  continuation
+
+- item 3
+
+```python
+def f():
+
+    return 1
+```
+
+> quote
+
+Closing paragraph with a [link](http://example.com).
+"""
+
+@pytest.mark.parametrize('step', [1, 3, 7])
+def test_markdown_pane_incremental_streaming(step):
+    pane = Markdown(enable_streaming=True)
+    reference = Markdown()
+    for i in range(1, len(_STREAMED_MARKDOWN)+step, step):
+        text = _STREAMED_MARKDOWN[:i]
+        assert pane._transform_object(text) == reference._transform_object(text)
+    assert pane._stream_cache[1].startswith('# Title\n\nSome')
+
+def test_markdown_pane_incremental_streaming_reference_links():
+    pane = Markdown(enable_streaming=True)
+    text = "A [ref] link.\n\nMore text\n\n[ref]: http://example.com\n"
+    for i in range(1, len(text)+1):
+        assert pane._transform_object(text[:i]) == Markdown()._transform_object(text[:i])
+
+def test_markdown_pane_incremental_streaming_replaced_text():
+    pane = Markdown(enable_streaming=True)
+    pane._transform_object("First paragraph\n\nSecond\n")
+    assert pane._transform_object("Other\n") == Markdown()._transform_object("Other\n")
+
 def test_html_pane(document, comm):
     pane = HTML("<h1>Test</h1>")
 
@@ -11,6 +11,8 @@ try:
 except Exception:
     wavfile = None
 
+from panel.config import config
+from panel.io.content import resolve_content
 from panel.pane import Audio, Video
 from panel.pane.media import TensorLike, _is_1_or_2dim_int_or_float_tensor
 
@@ -88,6 +90,15 @@ def test_local_audio(document, comm):
 
     assert model.value == 'data:audio/mp3;base64,/+MYxAAAAANIAAAAAExBTUUzLjk4LjIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA' # noqa
 
+def test_local_audio_content_url(server_document, comm):
+    with config.set(content_url_threshold=0):
+        model = Audio(str(ASSETS / 'mp3.mp3')).get_root(server_document, comm=comm)
+
+    assert model.value.startswith('content/')
+    key = model.value.split('/')[1].split('.')[0]
+    with open(ASSETS / 'mp3.mp3', 'rb') as f:
+        assert resolve_content(key) == (f.read(), 'audio/mp3')
+
 def test_local_audio_path(document, comm):
     audio = Audio(ASSETS / 'mp3.mp3')
     model = audio.get_root(document, comm=comm)
@@ -1,8 +1,13 @@
+import asyncio
+
+import pytest
+
 from bokeh.models import Div, Row as BkRow
 
 import panel as pn
 
 from panel.pane import Bokeh, Matplotlib, PaneBase
+from panel.pane.plot import _cached_figure
 from panel.tests.util import mpl_available, mpl_figure
 
 
@@ -73,6 +78,94 @@ def test_matplotlib_pane(document, comm):
     assert pane._models == {}
 
 
+def _count_renders(fig):
+    renders = []
+    print_figure = fig.canvas.print_figure
+    def counting_print_figure(*args, **kwargs):
+        renders.append(kwargs['format'])
+        return print_figure(*args, **kwargs)
+    fig.canvas.print_figure = counting_print_figure
+    return renders
+
+
+@mpl_available
+def test_matplotlib_pane_render_cached(document, comm):
+    fig = mpl_figure()
+    renders = _count_renders(fig)
+    pane1 = pn.pane.Matplotlib(fig)
+    pane2 = pn.pane.Matplotlib(fig)
+
+    model1 = pane1.get_root(document, comm=comm)
+    model2 = pane2.get_root(document, comm=comm)
+
+    assert model1.text == model2.text
+    assert renders == ['png']
+
+    pane1.width = 200
+    assert renders == ['png']
+
+    pane2.dpi = 72
+    assert renders == ['png', 'png']
+
+
+@mpl_available
+def test_matplotlib_pane_render_cache_invalidated_on_change(document, comm):
+    fig = mpl_figure()
+    renders = _count_renders(fig)
+    pane = pn.pane.Matplotlib(fig)
+    model = pane.get_root(document, comm=comm)
+    text = model.text
+    assert _cached_figure(fig, pane._render_key) is not None
+
+    fig.axes[0].set_title('Title')
+    assert _cached_figure(fig, pane._render_key) is None
+    pane.param.trigger('object')
+
+    assert renders == ['png', 'png']
+    assert model.text != text
+
+
+@mpl_available
+def test_matplotlib_pane_render_cache_discarded_on_trigger(document, comm):
+    fig = mpl_figure()
+    renders = _count_renders(fig)
+    pane = pn.pane.Matplotlib(fig)
+    pane.get_root(document, comm=comm)
+    assert fig.stale
+
+    pane.param.trigger('object')
+
+    assert renders == ['png', 'png']
+
+
+@mpl_available
+@pytest.mark.asyncio
+async def test_matplotlib_pane_render_in_background(server_document, comm, threads):
+    fig = mpl_figure()
+    pane = pn.pane.Matplotlib(fig)
+    pane._serving = lambda: True
+    model = pane.get_root(server_document, comm=comm)
+    assert model.text == '<img></img>'
+
+    for _ in range(50):
+        if model.text != '<img></img>':
+            break
+        await asyncio.sleep(0.1)
+    assert model.text.startswith('&lt;img src=&quot;data:image/png;base64,')
+
+    text = model.text
+    fig.axes[0].set_title('Title')
+    pane.param.trigger('object')
+    assert model.text == text
+
+    for _ in range(50):
+        if model.text != text:
+            break
+        await asyncio.sleep(0.1)
+    assert model.text.startswith('&lt;img src=&quot;data:image/png;base64,')
+    assert model.text != text
+
+
 @mpl_available
 def test_matplotlib_pane_svg_render(document, comm):
     pane = pn.pane.Matplotlib(mpl_figure(), format='svg', encode=True)
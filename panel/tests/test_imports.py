@@ -3,6 +3,8 @@ import sys
 from subprocess import check_output
 from textwrap import dedent
 
+import pytest
+
 
 def test_no_blocklist_imports():
     check = """\
@@ -19,3 +21,42 @@ def test_no_blocklist_imports():
     output = check_output([sys.executable, '-c', dedent(check)])
 
     assert output == b""
+
+
+def test_lazy_submodules_not_imported():
+    check = """\
+    import sys
+    import panel
+
+    lazy = {"panel.layout", "panel.pane", "panel.template", "panel.widgets"}
+    mods = lazy & set(sys.modules)
+
+    if mods:
+        print(", ".join(sorted(mods)), end="")
+    """
+
+    output = check_output([sys.executable, '-c', dedent(check)])
+
+    assert output == b""
+
+
+def test_lazy_attributes_resolve():
+    check = """\
+    import panel as pn
+    from panel.interact import interact
+    from panel.layout import Row
+    from panel.pane import ParamFunction, panel
+
+    assert pn.Row is Row
+    assert pn.panel is panel
+    assert pn.pane.ParamFunction is ParamFunction
+    assert pn.interact is interact
+    assert "Row" in dir(pn)
+    """
+
+    check_output([sys.executable, '-c', dedent(check)])
+
+
+@pytest.mark.parametrize('module', ['panel.param', 'panel.widgets', 'panel.template', 'panel.chat'])
+def test_import_submodule_first(module):
+    check_output([sys.executable, '-c', f'import {module}'])
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import threading
 import typing as t
 
 import pandas as pd
@@ -2078,3 +2079,74 @@ def test_param_widget_updates_from_own_callback(document, comm, param_type, init
 
     assert instance.value == expected_value
     assert widget.value == expected_value
+
+
+async def test_param_function_pane_threaded(document, comm):
+    number = NumberInput(value=0)
+    main_thread = threading.get_ident()
+    threads = []
+
+    def function(value):
+        threads.append(threading.get_ident())
+        return Markdown(f"{value}")
+
+    pane = ParamFunction(bind(function, number), threaded=True)
+    root = pane.get_root(document, comm)
+
+    await async_wait_until(lambda: root.children[0].text == '&lt;p&gt;0&lt;/p&gt;\n')
+
+    number.value = 1
+
+    await async_wait_until(lambda: root.children[0].text == '&lt;p&gt;1&lt;/p&gt;\n')
+    assert threads and main_thread not in threads
+
+
+async def test_param_function_pane_threaded_latest_wins(document, comm):
+    number = NumberInput(value=0)
+    release = threading.Event()
+
+    def function(value):
+        if value == 1:
+            # Slow evaluation which is superseded by a newer one
+            release.wait(timeout=5)
+        return Markdown(f"{value}")
+
+    pane = ParamFunction(bind(function, number), threaded=True)
+    root = pane.get_root(document, comm)
+    await async_wait_until(lambda: root.children[0].text == '&lt;p&gt;0&lt;/p&gt;\n')
+
+    number.value = 1
+    await asyncio.sleep(0.05)
+    number.value = 2
+    await async_wait_until(lambda: root.children[0].text == '&lt;p&gt;2&lt;/p&gt;\n')
+
+    release.set()
+    await asyncio.sleep(0.1)
+    assert root.children[0].text == '&lt;p&gt;2&lt;/p&gt;\n'
+
+
+async def test_param_function_pane_threaded_skip(document, comm):
+    number = NumberInput(value=0)
+
+    def function(value):
+        if value == 1:
+            raise Skip()
+        return Markdown(f"{value}")
+
+    pane = ParamFunction(bind(function, number), threaded=True)
+    root = pane.get_root(document, comm)
+    await async_wait_until(lambda: root.children[0].text == '&lt;p&gt;0&lt;/p&gt;\n')
+
+    number.value = 1
+    await asyncio.sleep(0.1)
+    assert root.children[0].text == '&lt;p&gt;0&lt;/p&gt;\n'
+    assert not pane._inner_layout.loading
+
+
+def test_param_function_pane_config_threaded():
+    config.threaded_refs = True
+    try:
+        assert ParamFunction(bind(lambda v: v, NumberInput()), lazy=True).threaded
+    finally:
+        config.threaded_refs = False
+    assert not ParamFunction(bind(lambda v: v, NumberInput()), lazy=True).threaded
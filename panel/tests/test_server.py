@@ -18,6 +18,7 @@ from packaging.version import Version
 from panel.config import config
 from panel.io import state
 from panel.io.application import Application
+from panel.io.content import register_content
 from panel.io.resources import DIST_DIR, JS_VERSION
 from panel.io.server import (
     _MAX_APP_PATH_CHARS, _MAX_ROUTE_PARAM_VALUE_CHARS, INDEX_HTML, RootHandler,
@@ -513,6 +514,150 @@ def test_server_periodic_async_callback(server_implementation, threads):
     wait_until(lambda: len(counts) >= 5 and counts == list(range(len(counts))))
 
 
+def test_server_periodic_callbacks_share_timer(server_implementation):
+    from panel.io.callbacks import _scheduler
+
+    counts, callbacks = [], []
+
+    def app():
+        for i in range(3):
+            callbacks.append(state.add_periodic_callback(partial(counts.append, i), 100))
+        def loaded():
+            state._schedule_on_load(state.curdoc, None)
+        state.execute(loaded, schedule=True)
+        return Row()
+
+    serve_and_request(app, n=2)
+
+    wait_until(lambda: all(counts.count(i) >= 4 for i in range(3)))
+    assert len(callbacks) == 6
+    keys = {cb._scheduled for cb in callbacks}
+    assert len(keys) == 1 and keys <= set(_scheduler._timers)
+    assert all(cb.stats['executions'] > 0 for cb in callbacks)
+
+
+def test_server_periodic_callback_overrun_stats(server_implementation):
+    cbs = []
+
+    async def slow_cb():
+        await asyncio.sleep(0.25)
+
+    def app():
+        cbs.append(state.add_periodic_callback(slow_cb, 100))
+        def loaded():
+            state._schedule_on_load(state.curdoc, None)
+        state.execute(loaded, schedule=True)
+        return Row()
+
+    serve_and_request(app)
+
+    wait_until(lambda: cbs and cbs[0].stats['executions'] >= 2)
+    stats = cbs[0].stats
+    assert stats['overruns'] >= stats['executions']
+    assert stats['max_duration'] >= 0.25
+
+
+def test_server_periodic_callback_stopped_with_session(server_implementation):
+    from panel.io.callbacks import _scheduler
+
+    cbs = []
+
+    def app():
+        cbs.append(state.add_periodic_callback(lambda: None, 123))
+        def loaded():
+            state._schedule_on_load(state.curdoc, None)
+        state.execute(loaded, schedule=True)
+        return Row()
+
+    serve_and_request(app)
+
+    wait_until(lambda: cbs and cbs[0].stats['executions'] > 0)
+    doc = cbs[0]._doc
+    cbs[0].stop()
+    assert not any(doc in docs for docs in _scheduler._groups.values())
+    assert not any(key[1] == 123 for key in _scheduler._timers)
+
+
+def test_server_periodic_callback_stopped_on_session_destroyed(server_implementation):
+    from panel.io.callbacks import PeriodicCallback, _scheduler
+
+    cbs = []
+
+    def app():
+        cb = PeriodicCallback(callback=lambda: None, period=124)
+        cb.start()
+        cbs.append(cb)
+        return Row()
+
+    serve_and_request(app)
+
+    wait_until(lambda: cbs and cbs[0].stats['executions'] > 0)
+    cb = cbs[0]
+    doc = cb._doc
+    for hook in list(doc.session_destroyed_callbacks):
+        hook(doc.session_context)
+    assert not cb.running
+    assert not any(doc in docs for docs in _scheduler._groups.values())
+    assert not any(key[1] == 124 for key in _scheduler._timers)
+
+
+def test_server_periodic_callback_dropped_with_dead_session(server_implementation):
+    from panel.io.callbacks import PeriodicCallback, _scheduler
+
+    cbs = []
+
+    def app():
+        cb = PeriodicCallback(callback=lambda: None, period=50)
+        cb.start()
+        cbs.append(cb)
+        return Row()
+
+    serve_and_request(app)
+
+    wait_until(lambda: cbs and cbs[0].stats['executions'] > 0)
+    key = cbs[0]._scheduled
+    doc = cbs[0]._doc
+    doc._session_context = None
+    wait_until(lambda: doc not in _scheduler._groups.get(key, {}))
+    wait_until(lambda: key not in _scheduler._timers)
+
+
+def test_server_periodic_callback_resumed_on_reconnect(server_implementation):
+    from panel.io.callbacks import PeriodicCallback, _scheduler
+
+    cbs = []
+
+    def app():
+        cb = PeriodicCallback(callback=lambda: None, period=50)
+        cb.start()
+        cbs.append(cb)
+        return Row()
+
+    serve_and_request(app)
+
+    wait_until(lambda: cbs and cbs[0].stats['executions'] > 0)
+    cb = cbs[0]
+    doc = cb._doc
+    session = doc.session_context._session
+    connection = object()
+    session.subscribe(connection)
+    wait_until(lambda: doc in _scheduler._connected)
+
+    # Disconnected sessions are skipped but not unregistered
+    session.unsubscribe(connection)
+    time.sleep(0.2)
+    executions = cb.stats['executions']
+    time.sleep(0.2)
+    assert cb.stats['executions'] == executions
+    assert doc in _scheduler._groups[cb._scheduled]
+    assert cb.running
+
+    # Callbacks resume once the session reconnects
+    session.subscribe(connection)
+    wait_until(lambda: cb.stats['executions'] > executions)
+    session.unsubscribe(connection)
+
+
 def test_server_cancel_task(server_implementation):
     state.cache['count'] = 0
     def periodic_cb():
@@ -703,6 +848,100 @@ def test_server_reuse_sessions(reuse_sessions):
     assert session.token in r1.content.decode('utf-8')
     assert session.token not in r2.content.decode('utf-8')
 
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool(port):
+    session_args = []
+    def app():
+        session_args.append(dict(state.session_args))
+        return '# Pooled'
+
+    config.session_pool_size = 2
+    try:
+        serve_and_wait(app, port=port)
+
+        r1 = requests.get(f"http://localhost:{port}/", cookies={'user': 'foo'})
+        assert r1.ok
+        wait_until(lambda: state.session_pool_info.get(('/', 'default'), {}).get('size') == 1)
+
+        pool = state._session_pools[('/', 'default')]
+        pooled = pool._sessions[0]
+        r2 = requests.get(f"http://localhost:{port}/", cookies={'user': 'bar'})
+        assert r2.ok
+        assert pooled.token in r2.content.decode('utf-8')
+
+        info = state.session_pool_info[('/', 'default')]
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+        # The pooled session was initialized before the request but is
+        # associated with the request it was handed out to
+        assert pooled.document.session_context.request.cookies == {'user': 'bar'}
+        assert not pooled.expiration_blocked
+    finally:
+        config.session_pool_size = 0
+
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool_initialized_anonymously(port):
+    cookies = []
+    def app():
+        cookies.append(dict(state.cookies))
+        return '# Pooled'
+
+    config.session_pool_size = 2
+    try:
+        serve_and_wait(app, port=port)
+
+        assert requests.get(f"http://localhost:{port}/", cookies={'user': 'foo'}).ok
+        wait_until(lambda: state.session_pool_info.get(('/', 'default'), {}).get('size') == 1)
+
+        # The first session ran for the request, the pooled session must
+        # not see the cookies of the request that triggered the refill
+        assert cookies == [{'user': 'foo'}, {}]
+    finally:
+        config.session_pool_size = 0
+
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool_bypassed_with_query_arguments(port):
+    session_args = []
+    def app():
+        session_args.append(dict(state.session_args))
+        return '# Pooled'
+
+    config.session_pool_size = 2
+    try:
+        serve_and_wait(app, port=port)
+
+        assert requests.get(f"http://localhost:{port}/").ok
+        wait_until(lambda: state.session_pool_info.get(('/', 'default'), {}).get('size') == 1)
+
+        pooled = state._session_pools[('/', 'default')]._sessions[0]
+        r = requests.get(f"http://localhost:{port}/?arg=bar")
+        assert r.ok
+        assert pooled.token not in r.content.decode('utf-8')
+        assert {'arg': [b'bar']} in session_args
+        assert state.session_pool_info[('/', 'default')]['hits'] == 0
+    finally:
+        config.session_pool_size = 0
+
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool_disabled_with_auth(port):
+    def app():
+        return '# Pooled'
+
+    config.session_pool_size = 2
+    try:
+        serve_and_wait(app, port=port, basic_auth='my_password', cookie_secret='my_secret')
+
+        with requests.Session() as session:
+            r = session.post(
+                f"http://localhost:{port}/login",
+                data={'username': 'user', 'password': 'my_password'}
+            )
+            assert r.ok
+            assert session.get(f"http://localhost:{port}/").ok
+        assert state.session_pool_info == {}
+    finally:
+        config.session_pool_size = 0
+
 def test_server_session_args(port, server_implementation):
     session_args = []
     def app():
@@ -1484,6 +1723,26 @@ def test_server_template_custom_resources(port):
     with open(pathlib.Path(__file__).parent / 'assets' / 'custom.css', encoding='utf-8') as f:
         assert f.read() == r.content.decode('utf-8').replace('\r\n', '\n')
 
+def test_server_content_resource(port):
+    data = bytes(range(256)) * 10
+    key = register_content(data, 'audio/wav')
+
+    r = serve_and_request(Markdown('# Content'), port=port, suffix=f"/content/{key}.wav")
+
+    assert r.content == data
+    assert r.headers['Content-Type'] == 'audio/wav'
+    assert 'immutable' in r.headers['Cache-Control']
+
+    url = f"http://localhost:{port}/content/{key}.wav"
+    r = requests.get(url, headers={'Range': 'bytes=10-19'})
+    assert r.status_code == 206
+    assert r.content == data[10:20]
+
+    r = requests.get(url, headers={'If-None-Match': r.headers['Etag']})
+    assert r.status_code == 304
+
+    assert requests.get(f"http://localhost:{port}/content/unknown.wav").status_code == 404
+
 def test_server_template_custom_resources_on_proxy(reverse_proxy):
     template = CustomBootstrapTemplate()
 
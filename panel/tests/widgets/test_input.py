@@ -1,5 +1,6 @@
 from datetime import date, datetime, time as dt_time
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
 import param
@@ -10,8 +11,8 @@ from bokeh.models.widgets import FileInput as BkFileInput
 from panel import config
 from panel.widgets import (
     ArrayInput, Checkbox, DatePicker, DateRangePicker, DatetimeInput,
-    DatetimePicker, DatetimeRangeInput, DatetimeRangePicker, FileInput,
-    FloatInput, IntInput, LiteralInput, StaticText, TextInput, TimePicker,
+    DatetimePicker, DatetimeRangeInput, DatetimeRangePicker, FileDropper,
+    FileInput, FloatInput, IntInput, LiteralInput, StaticText, TextInput, TimePicker,
 )
 
 
@@ -216,6 +217,147 @@ def test_file_input(document, comm):
     assert file_input.filename == 'testfile'
 
 
+@pytest.mark.parametrize('storage', ['tempfile', 'directory'])
+def test_file_input_storage(storage, document, comm, tmp_path):
+    file_input = FileInput(storage=storage, upload_dir=str(tmp_path))
+    file_input.get_root(document, comm=comm)
+
+    file_input._process_events({'mime_type': 'text/plain', 'value': 'U29tZSB0ZXh0Cg==', 'filename': 'testfile'})
+
+    if storage == 'directory':
+        assert isinstance(file_input.value, Path)
+        assert file_input.value.name == 'testfile'
+        assert file_input.value.parent.parent == tmp_path
+        assert file_input.value.read_bytes() == b'Some text\n'
+    else:
+        assert file_input.value.read() == b'Some text\n'
+
+    fpath = tmp_path / 'out.txt'
+    file_input.save(str(fpath))
+    assert fpath.read_text() == 'Some text\n'
+
+    if storage == 'tempfile':
+        file_input.value.close()
+
+
+@pytest.mark.parametrize('storage', ['tempfile', 'directory'])
+def test_file_input_storage_discards_replaced_upload(storage, document, comm, tmp_path):
+    file_input = FileInput(storage=storage, upload_dir=str(tmp_path))
+    file_input.get_root(document, comm=comm)
+
+    file_input._process_events({'mime_type': 'text/plain', 'value': 'U29tZSB0ZXh0Cg==', 'filename': 'testfile'})
+    upload = file_input.value
+    file_input._process_events({'mime_type': 'text/plain', 'value': 'U29tZSB0ZXh0Cg==', 'filename': 'testfile'})
+
+    if storage == 'directory':
+        assert not upload.exists()
+        assert file_input.value.exists()
+    else:
+        assert upload.closed
+        assert not file_input.value.closed
+        file_input.value.close()
+
+
+@pytest.mark.parametrize('storage', ['tempfile', 'directory'])
+def test_file_input_clear_discards_upload(storage, document, comm, tmp_path):
+    file_input = FileInput(storage=storage, upload_dir=str(tmp_path))
+    file_input.get_root(document, comm=comm)
+
+    file_input._process_events({'mime_type': 'text/plain', 'value': 'U29tZSB0ZXh0Cg==', 'filename': 'testfile'})
+    upload = file_input.value
+    file_input.clear()
+
+    assert file_input.value is None
+    assert file_input.filename is None
+    if storage == 'directory':
+        assert not upload.exists()
+        assert list(tmp_path.iterdir()) == []
+    else:
+        assert upload.closed
+
+
+def test_file_input_discards_upload_on_session_destroyed(document, tmp_path):
+    file_input = FileInput(storage='directory', upload_dir=str(tmp_path))
+    file_input.get_root(document)
+
+    file_input._process_events({'mime_type': 'text/plain', 'value': 'U29tZSB0ZXh0Cg==', 'filename': 'testfile'})
+    upload = file_input.value
+    for callback in document.session_destroyed_callbacks:
+        callback(SimpleNamespace(_document=document))
+
+    assert not upload.exists()
+
+
+def _upload_chunks(widget, name, chunks, mime_type='text/plain'):
+    for i, chunk in enumerate(chunks):
+        widget._process_event(_DropperEvent('upload_event', {
+            'name': name, 'chunk': i+1, 'total_chunks': len(chunks),
+            'data': chunk, 'type': mime_type
+        }))
+
+
+class _DropperEvent:
+
+    def __init__(self, event_name, data):
+        self.event_name = event_name
+        self.data = data
+
+
+def test_file_dropper_memory():
+    dropper = FileDropper()
+    _upload_chunks(dropper, 'test.txt', [b'Some ', b'text'])
+    assert dropper.value == {'test.txt': 'Some text'}
+    assert dropper.mime_type == {'test.txt': 'text/plain'}
+
+
+@pytest.mark.parametrize('storage', ['tempfile', 'directory'])
+def test_file_dropper_storage(storage, tmp_path):
+    chunks = []
+    dropper = FileDropper(
+        storage=storage, upload_dir=str(tmp_path),
+        chunk_callback=lambda *args: chunks.append(args)
+    )
+    _upload_chunks(dropper, '../test.bin', [b'\x00\x01', b'\x02'], 'application/octet-stream')
+
+    assert chunks == [
+        ('../test.bin', b'\x00\x01', 1, 2), ('../test.bin', b'\x02', 2, 2)
+    ]
+    upload = dropper.value['../test.bin']
+    if storage == 'directory':
+        assert upload.name == 'test.bin'
+        assert upload.parent.parent == tmp_path
+        assert upload.read_bytes() == b'\x00\x01\x02'
+    else:
+        assert upload.read() == b'\x00\x01\x02'
+
+    dropper._process_event(_DropperEvent('delete_event', {'name': '../test.bin'}))
+    assert dropper.value == {}
+    if storage == 'directory':
+        assert not upload.exists()
+    else:
+        assert upload.closed
+
+
+def test_file_dropper_discards_uploads_on_session_destroyed(document, tmp_path):
+    dropper = FileDropper(storage='directory', upload_dir=str(tmp_path))
+    dropper.get_root(document)
+
+    _upload_chunks(dropper, 'complete.txt', [b'Some text'])
+    # Only the first of two chunks is received
+    dropper._process_event(_DropperEvent('upload_event', {
+        'name': 'aborted.txt', 'chunk': 1, 'total_chunks': 2,
+        'data': b'Some ', 'type': 'text/plain'
+    }))
+    buffer = dropper._file_buffer['aborted.txt']
+
+    for callback in document.session_destroyed_callbacks:
+        callback(SimpleNamespace(_document=document))
+
+    assert buffer.closed
+    assert dropper._file_buffer == {}
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_literal_input(document, comm):
 
     literal = LiteralInput(value={}, type=dict, label='Literal')
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from panel.widgets.table_backends import NarwhalsBackend, get_backend
+from panel.widgets.tables import DataFrame, Tabulator
+
+pl = pytest.importorskip("polars")
+
+
+def make_polars_df():
+    return pl.DataFrame({
+        'A': np.arange(20),
+        'B': np.arange(20) % 3,
+        'C': [f'Foo{i}' for i in range(20)],
+    })
+
+
+@pytest.fixture(params=['eager', 'lazy'])
+def polars_value(request):
+    df = make_polars_df()
+    return df if request.param == 'eager' else df.lazy()
+
+
+def test_get_backend_pandas_none():
+    assert get_backend(None) is None
+    assert get_backend(pd.DataFrame({'A': [1]})) is None
+
+
+def test_get_backend_polars(polars_value):
+    backend = get_backend(polars_value)
+    assert isinstance(backend, NarwhalsBackend)
+    assert list(backend.schema.columns) == ['A', 'B', 'C']
+    assert len(backend.schema) == 0
+
+
+def test_narwhals_backend_query(polars_value):
+    backend = NarwhalsBackend(polars_value)
+    query = backend.query([('B', '=', 1)], [('A', False)])
+    assert backend.count(query) == 7
+    page = backend.fetch(query, 2, 3)
+    assert list(page.index) == [2, 3, 4]
+    np.testing.assert_array_equal(page.A.values, np.array([13, 10, 7]))
+
+
+def test_narwhals_backend_sort_strings_case_insensitive():
+    backend = NarwhalsBackend(pl.DataFrame({'A': ['b', 'A', 'a', 'C']}).lazy())
+    query = backend.query([], [('A', True)])
+    page = backend.fetch(query, 0, 4)
+    assert list(page.columns) == ['A']
+    assert list(page.A) == ['A', 'a', 'b', 'C']
+    assert backend.to_native(query).collect_schema().names() == ['A']
+
+
+def test_tabulator_backend_forces_remote_pagination(polars_value):
+    table = Tabulator(polars_value, pagination='local', page_size=5)
+
+    assert table.pagination == 'remote'
+    assert table._length == 20
+    np.testing.assert_array_equal(table._data['A'], np.arange(5))
+
+    with pytest.raises(ValueError, match="pagination='remote'"):
+        table.pagination = None
+
+
+def test_tabulator_backend_pagination_updates_model(polars_value, document, comm):
+    df = pd.DataFrame({'A': np.arange(50)})
+    table = Tabulator(df)
+
+    model = table.get_root(document, comm)
+    assert model.pagination is None
+
+    table.value = polars_value
+    assert table.pagination == 'remote'
+    assert model.pagination == 'remote'
+    assert model.max_page == 1
+    np.testing.assert_array_equal(model.source.data['A'], np.arange(20))
+
+    table.value = df
+    assert table.pagination is None
+    assert model.pagination is None
+    assert len(model.source.data['A']) == 50
+
+
+def test_tabulator_backend_restores_explicit_pagination(polars_value, document, comm):
+    df = pd.DataFrame({'A': np.arange(50)})
+    table = Tabulator(df, pagination='local', page_size=10)
+
+    model = table.get_root(document, comm)
+    table.value = polars_value
+    assert model.pagination == 'remote'
+
+    table.value = df
+    assert table.pagination == 'local'
+    assert model.pagination == 'local'
+    assert table._explicit_pagination
+
+
+def test_tabulator_backend_page(polars_value, document, comm):
+    table = Tabulator(polars_value, page_size=5)
+
+    model = table.get_root(document, comm)
+
+    assert model.max_page == 4
+    assert [c.field for c in model.columns] == ['index', 'A', 'B', 'C']
+    assert not model.editable
+
+    table.page = 3
+
+    np.testing.assert_array_equal(model.source.data['index'], np.arange(10, 15))
+    np.testing.assert_array_equal(model.source.data['A'], np.arange(10, 15))
+
+
+def test_tabulator_backend_header_filters_and_sorters(polars_value, document, comm):
+    table = Tabulator(polars_value, page_size=5)
+
+    model = table.get_root(document, comm)
+
+    table.filters = [{'field': 'C', 'type': 'like', 'value': 'foo1'}]
+    table.sorters = [{'field': 'A', 'dir': 'desc'}]
+
+    assert model.max_page == 3
+    np.testing.assert_array_equal(model.source.data['A'], np.array([19, 18, 17, 16, 15]))
+
+    view = table.current_view
+    assert isinstance(view, type(polars_value))
+
+
+def test_tabulator_backend_add_filter(polars_value):
+    table = Tabulator(polars_value, page_size=5)
+
+    table.add_filter((2, 4), 'A')
+    table.add_filter([0, 1], 'B')
+
+    np.testing.assert_array_equal(table._data['A'], np.array([3, 4]))
+
+
+def test_tabulator_backend_selection(polars_value, document, comm):
+    table = Tabulator(polars_value, page_size=5, page=2)
+
+    model = table.get_root(document, comm)
+
+    table._process_events({'indices': [0, 2]})
+    assert table.selection == [5, 7]
+    assert model.source.selected.indices == [0, 2]
+
+    np.testing.assert_array_equal(table.selected_dataframe.A.values, np.array([5, 7]))
+
+    table.page = 1
+    assert model.source.selected.indices == []
+
+
+def test_tabulator_backend_stream_raises(polars_value):
+    table = Tabulator(polars_value)
+
+    with pytest.raises(ValueError, match='not supported'):
+        table.stream({'A': [1], 'B': [1], 'C': ['foo']})
+
+    with pytest.raises(ValueError, match='not supported'):
+        table.patch({'A': [(0, 1)]})
+
+
+def test_dataframe_widget_backend_raises():
+    with pytest.raises(ValueError, match='use the Tabulator widget'):
+        DataFrame(make_polars_df())
+
+
+def test_tabulator_backend_duckdb(document, comm):
+    duckdb = pytest.importorskip("duckdb")
+    rel = duckdb.sql('SELECT range AS A, range % 3 AS B FROM range(20)')
+
+    table = Tabulator(rel, page_size=5, sorters=[{'field': 'A', 'dir': 'desc'}])
+
+    model = table.get_root(document, comm)
+
+    np.testing.assert_array_equal(model.source.data['A'], np.array([19, 18, 17, 16, 15]))
+
+    table.filters = [{'field': 'B', 'type': '=', 'value': 0}]
+    table.page = 2
+
+    np.testing.assert_array_equal(model.source.data['A'], np.array([3, 0]))
@@ -169,6 +169,71 @@ def test_dataframe_process_data_event(dataframe):
     pd.testing.assert_frame_equal(table.value, df)
 
 
+@pytest.mark.parametrize('widget', [DataFrame, Tabulator])
+def test_dataframe_process_data_patch(dataframe, widget, document):
+    from bokeh.document.events import ColumnsPatchedEvent
+
+    table = widget(dataframe)
+    model = table.get_root(document)
+    source = model.source
+    events = []
+    table.param.watch(events.append, 'value')
+
+    patches = {'int': [(1, 8)], 'str': [(2, 'D')]}
+    table._record_patch(source, ColumnsPatchedEvent(document, source, 'data', patches, setter=object()))
+    # The data received from the frontend is ignored if patches were recorded
+    table._process_events({'data': {}})
+
+    assert list(table.value['int']) == [1, 8, 3]
+    assert list(table.value['str']) == ['A', 'B', 'D']
+    assert len(events) == 1
+    assert table._data_patches == []
+
+
+def test_dataframe_process_data_patch_ignores_python_changes(dataframe, document):
+    from bokeh.document.events import ColumnsPatchedEvent
+
+    table = DataFrame(dataframe)
+    source = table.get_root(document).source
+    table._record_patch(source, ColumnsPatchedEvent(document, source, 'data', {'int': [(0, 4)]}))
+    assert table._data_patches == []
+
+
+def test_dataframe_process_data_patch_falls_back_on_full_change(dataframe, document):
+    from bokeh.document.events import ColumnsPatchedEvent, ModelChangedEvent
+
+    table = DataFrame(dataframe)
+    source = table.get_root(document).source
+    setter = object()
+    table._record_patch(source, ColumnsPatchedEvent(document, source, 'data', {'int': [(0, 4)]}, setter=setter))
+    table._record_patch(source, ModelChangedEvent(document, source, 'data', {}, setter=setter))
+    table._process_events({'data': {'int': [5, 7, 9]}})
+    assert list(table.value['int']) == [5, 7, 9]
+
+
+def test_tabulator_process_data_patch_remote_pagination(document):
+    from bokeh.document.events import ColumnsPatchedEvent
+
+    df = pd.DataFrame({'A': np.arange(10), 'B': list('abcdefghij')}, index=np.arange(10)[::-1])
+    table = Tabulator(df.copy(), pagination='remote', page_size=3, page=2)
+    source = table.get_root(document).source
+    edits = []
+    table.on_edit(edits.append)
+
+    table._record_patch(source, ColumnsPatchedEvent(document, source, 'data', {'B': [(1, 'X')]}, setter=object()))
+    table._process_events({'data': {}})
+    table._process_event(TableEditEvent(model=None, column='B', row=1))
+
+    expected = df.copy()
+    expected.iloc[4, 1] = 'X'
+    pd.testing.assert_frame_equal(table.value, expected)
+    assert table._processed.iloc[4, 1] == 'X'
+    assert len(edits) == 1
+    assert edits[0].old == 'e'
+    assert edits[0].value == 'X'
+    assert edits[0].row == 4
+
+
 @pytest.mark.parametrize('widget', [DataFrame, Tabulator])
 def test_dataframe_process_data_no_unsync(dataframe, widget):
     df = dataframe.copy()
@@ -1396,7 +1461,6 @@ def test_tabulator_sorters_unnamed_index(document, comm):
     table.sorters = [{'field': 'index', 'sorter': 'number', 'dir': 'desc'}]
     res = table.current_view
     exp = df.sort_index(ascending=False)
-    exp.columns = exp.columns.astype(object)
 
     pd.testing.assert_frame_equal(res, exp)
     assert df.columns.dtype == np.int64
@@ -1409,7 +1473,6 @@ def test_tabulator_sorters_int_name_column(document, comm):
     table.sorters = [{'field': '0', 'dir': 'desc'}]
     res = table.current_view
     exp = df.sort_values([0], ascending=False)
-    exp.columns = exp.columns.astype(object)
 
     pd.testing.assert_frame_equal(res, exp)
     assert df.columns.dtype == np.int64
@@ -2047,6 +2110,88 @@ def test_tabulator_paginated_sorted_selection(document, comm):
     assert table.selection == [1]
 
 
+def test_tabulator_remote_pagination_page_change_reuses_query(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2)
+    table.filters = [{'field': 'B', 'type': '=', 'value': 0}]
+    table.sorters = [{'field': 'A', 'sorter': 'number', 'dir': 'desc'}]
+
+    model = table.get_root(document, comm)
+    filtered = table._query_cache['filtered'][1]
+    order = table._query_cache['sorted'][1]
+    np.testing.assert_array_equal(order, np.array([4, 2, 0]))
+
+    table.page = 2
+
+    assert table._query_cache['sorted'][1] is order
+    np.testing.assert_array_equal(model.source.data['A'], np.array([0]))
+
+    table.sorters = [{'field': 'A', 'sorter': 'number', 'dir': 'asc'}]
+
+    assert table._query_cache['sorted'][1] is not order
+    assert table._query_cache['filtered'][1] is filtered
+    np.testing.assert_array_equal(table._processed.A.values, np.array([0, 2, 4]))
+
+
+def test_tabulator_remote_pagination_page_change_takes_page_rows(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2, selection=[0])
+    table.sorters = [{'field': 'A', 'sorter': 'number', 'dir': 'desc'}]
+
+    model = table.get_root(document, comm)
+    table.page = 3
+
+    # The rows of the sorted view are not taken from the value
+    assert table._processed_query is not None
+    assert table._length == 5
+    np.testing.assert_array_equal(model.source.data['A'], np.array([0]))
+    assert model.source.selected.indices == [0]
+    assert table._index_mapping == {4: 0}
+
+    pd.testing.assert_frame_equal(table.current_view, df.iloc[::-1])
+    assert table._processed_query is None
+
+
+def test_tabulator_remote_pagination_stream_filtered(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2)
+    table.filters = [{'field': 'B', 'type': '=', 'value': 1}]
+
+    model = table.get_root(document, comm)
+
+    stream_value = pd.DataFrame({
+        'A': [5, 6],
+        'B': [1, 0],
+        'C': ['foo6', 'foo7'],
+        'D': [dt.datetime(2009, 1, 8), dt.datetime(2009, 1, 9)]
+    })
+    table.stream(stream_value, follow=True)
+
+    assert table.page == 2
+    np.testing.assert_array_equal(table._processed.A.values, np.array([1, 3, 5]))
+    np.testing.assert_array_equal(model.source.data['A'], np.array([5]))
+
+
+def test_tabulator_remote_pagination_patch_sorted(document, comm):
+    df = makeMixedDataFrame()
+    table = Tabulator(df, pagination='remote', page_size=2)
+    table.sorters = [{'field': 'A', 'sorter': 'number', 'dir': 'desc'}]
+
+    model = table.get_root(document, comm)
+    order = table._query_cache['sorted'][1]
+
+    table.patch({'C': [(4, 'foo10')]})
+
+    assert table._query_cache['sorted'][1] is order
+    assert table._processed.C.iloc[0] == 'foo10'
+    np.testing.assert_array_equal(model.source.data['C'], np.array(['foo10', 'foo4']))
+
+    table.patch({'A': [(4, -1)]})
+
+    assert table._query_cache['sorted'][1] is not order
+    np.testing.assert_array_equal(model.source.data['A'], np.array([3, 2]))
+
+
 def test_tabulator_stream_dataframe(document, comm):
     df = makeMixedDataFrame()
     table = Tabulator(df)
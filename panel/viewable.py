@@ -58,6 +58,8 @@ if t.TYPE_CHECKING:
     from bokeh.server.server import Server
     from jinja2 import Template
     from pyviz_comms import Comm
+
+    from .io.embed import EmbedProgress
     from typing_extensions import Self
 
     from .io.location import Location
@@ -957,7 +959,8 @@ class Viewable(Renderable, Layoutable, ServableMixin):
     def embed(
         self, max_states: int = 1000, max_opts: int = 3, json: bool = False,
         json_prefix: str = '', save_path: str = './', load_path: str | None = None,
-        progress: bool = False, states={}
+        progress: bool | Callable[[EmbedProgress], None] = False, states={},
+        processes: int = 1
     ) -> Mimebundle:
         """
         Renders a static version of a panel in a notebook by evaluating
@@ -979,14 +982,17 @@ class Viewable(Renderable, Layoutable, ServableMixin):
           The path to save json files to
         load_path: str (default=None)
           The path or URL the json files will be loaded from.
-        progress: boolean (default=False)
-          Whether to report progress
+        progress: boolean or callable (default=False)
+          Whether to report progress, or a callback invoked with an
+          EmbedProgress after each state is explored
         states: dict (default={})
           A dictionary specifying the widget values to embed for each widget
+        processes: int (default=1)
+          The number of worker processes to explore the states in
         """
         return render_embed(
             self, max_states, max_opts, json, json_prefix, save_path,
-            load_path, progress, states
+            load_path, progress, states, processes
         )
 
     def save(
@@ -995,8 +1001,9 @@ class Viewable(Renderable, Layoutable, ServableMixin):
         template_variables: dict[str, t.Any] = {}, embed: bool = False,
         max_states: int = 1000, max_opts: int = 3, embed_json: bool = False,
         json_prefix: str='', save_path: str='./', load_path: str | None = None,
-        progress: bool = True, embed_states: dict[t.Any, t.Any] = {},
-        as_png: bool | None = None, **kwargs
+        progress: bool | Callable[[EmbedProgress], None] = True,
+        embed_states: dict[t.Any, t.Any] = {}, as_png: bool | None = None,
+        embed_processes: int = 1, **kwargs
     ) -> None:
         """
         Saves Panel objects to file.
@@ -1027,19 +1034,22 @@ class Viewable(Renderable, Layoutable, ServableMixin):
            The path to save json files to
         load_path: str (default=None)
            The path or URL the json files will be loaded from.
-        progress: boolean (default=True)
-          Whether to report progress
+        progress: boolean or callable (default=True)
+          Whether to report progress, or a callback invoked with an
+          EmbedProgress after each state is explored
         embed_states: dict (default={})
           A dictionary specifying the widget values to embed for each widget
         as_png: boolean (default=None)
           To save as a .png. If None save_png will be true if filename is
           string and ends with png.
+        embed_processes: int (default=1)
+          The number of worker processes to explore the embedded states in
         """
         return save(
             self, filename, title, resources, template,
             template_variables, embed, max_states, max_opts,
             embed_json, json_prefix, save_path, load_path, progress,
-            embed_states, as_png, **kwargs
+            embed_states, as_png, embed_processes, **kwargs
         )
 
     def server_doc(
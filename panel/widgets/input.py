@@ -5,13 +5,18 @@ a text field or similar.
 from __future__ import annotations
 
 import ast
+import io
 import json
+import os
+import shutil
+import tempfile
 import typing as t
 
 from base64 import b64decode
 from collections.abc import Iterable, Mapping
 from datetime import date, datetime, time as dt_time
 from html import escape
+from pathlib import Path
 
 import numpy as np
 import param
@@ -45,6 +50,87 @@ if t.TYPE_CHECKING:
     from ..layout.base import ListLike, NamedListLike
     from ..models.file_dropper import DeleteEvent, UploadEvent
 
+    Upload = t.IO[bytes] | Path
+
+
+# Size up to which uploads stored in a SpooledTemporaryFile are kept in memory
+_SPOOL_MAX_SIZE = 10_000_000
+
+# Number of base64 characters decoded at a time (must be a multiple of 4)
+_B64_CHUNK_SIZE = 4 * 1_000_000
+
+
+def _open_upload(storage: str, upload_dir: str | None, filename: str | None) -> t.IO[bytes]:
+    """
+    Opens a file to write an upload to for the tempfile and directory
+    storage modes. In directory mode each upload is written to a
+    unique sub-directory of the upload_dir so the file can keep its
+    base name without clashing with (or escaping to) other paths.
+    """
+    if storage == 'tempfile':
+        return tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    if upload_dir is not None:
+        os.makedirs(upload_dir, exist_ok=True)
+    folder = tempfile.mkdtemp(dir=upload_dir)
+    name = os.path.basename(filename or '') or 'upload'
+    return open(os.path.join(folder, name), 'wb')
+
+
+def _close_upload(storage: str, upload: t.IO[bytes]) -> Upload:
+    """
+    Finalizes an upload returning the value exposed on the widget,
+    i.e. the rewound file object or the path of the written file.
+    """
+    if storage == 'tempfile':
+        upload.seek(0)
+        return upload
+    upload.close()
+    return Path(upload.name)
+
+
+def _write_upload(upload: bytes | Upload, f: t.IO[bytes]) -> None:
+    """
+    Writes an upload held in any storage mode to a file object.
+    """
+    if isinstance(upload, bytes):
+        f.write(upload)
+    elif isinstance(upload, Path):
+        with open(upload, 'rb') as src:
+            shutil.copyfileobj(src, f)
+    else:
+        upload.seek(0)
+        shutil.copyfileobj(upload, f)
+        upload.seek(0)
+
+
+def _discard_upload(upload: t.Any) -> None:
+    """
+    Releases the resources held by an upload which was removed.
+    """
+    if isinstance(upload, Path):
+        upload.unlink(missing_ok=True)
+        try:
+            upload.parent.rmdir()
+        except OSError:
+            pass
+    elif isinstance(upload, io.BufferedWriter):
+        # A file of the directory storage which was not completed
+        upload.close()
+        _discard_upload(Path(upload.name))
+    elif hasattr(upload, 'close'):
+        upload.close()
+
+
+def _displayed_elsewhere(widget: Widget, session_context: t.Any) -> bool:
+    """
+    Whether the widget is still displayed in a session other than the
+    one being destroyed, in which case its uploads must be kept.
+    """
+    doc = session_context._document
+    return any(
+        model.document not in (None, doc) for model, _ in widget._models.values()
+    )
+
 
 class _TextInputBase(Widget):
 
@@ -236,12 +322,29 @@ class FileInput(Widget):
         Whether to allow uploading multiple files. If enabled value
         parameter will return a list.""")
 
+    storage: t.Literal['memory', 'tempfile', 'directory'] = param.Selector(
+        default='memory', objects=['memory', 'tempfile', 'directory'], doc="""
+        How the uploaded file(s) are stored:
+
+        - memory: The value holds the contents as bytes.
+        - tempfile: The contents are decoded into a SpooledTemporaryFile,
+          which only rolls over to disk for large files, and the value
+          holds the file object.
+        - directory: The contents are decoded into a file in the
+          upload_dir and the value holds its pathlib.Path.""")  # type: ignore[assignment, ty:invalid-assignment]
+
+    upload_dir = param.String(default=None, doc="""
+        Directory uploads are written to if storage='directory'.
+        Defaults to the system temporary directory.""")
+
     value = param.Parameter(default=None, doc="""
         The uploaded file(s) stored as a single bytes object if
-        multiple is False or a list of bytes otherwise.""")
+        multiple is False or a list of bytes otherwise. Depending
+        on the storage mode files may instead be represented as a
+        file object or path.""")
 
     _rename: t.ClassVar[Mapping[str, str | None]] = {
-        'filename': None
+        'filename': None, 'storage': None, 'upload_dir': None
     }
 
     _source_transforms: t.ClassVar[Mapping[str, str | None]] = {
@@ -263,19 +366,58 @@ class FileInput(Widget):
         properties = super()._linked_properties
         return properties + ('filename',)
 
+    def _get_model(
+        self, doc: Document, root: Model | None = None,
+        parent: Model | None = None, comm: Comm | None = None
+    ) -> Model:
+        model = super()._get_model(doc, root, parent, comm)
+        if comm is None:
+            doc.on_session_destroyed(self._on_session_destroyed)
+        return model
+
+    def _on_session_destroyed(self, session_context):
+        if not _displayed_elsewhere(self, session_context):
+            self._discard_uploads()
+
+    def _discard_uploads(self) -> None:
+        """
+        Releases the files held by the uploaded value.
+        """
+        uploads = self.value if isinstance(self.value, list) else [self.value]
+        for upload in uploads:
+            _discard_upload(upload)
+
     def _process_property_change(self, props: dict[str, t.Any]) -> dict[str, t.Any]:
         params = super()._process_property_change(props)
         if 'value' in params:
+            filename = params.get('filename', self.filename)
             if isinstance(params['value'], str):
-                params['value'] = b64decode(params['value']) if params['value'] else None
+                params['value'] = self._decode(params['value'], filename) if params['value'] else None
             else:
-                params['value'] = [b64decode(content) for content in params['value']]
+                filenames = filename if isinstance(filename, list) else []
+                params['value'] = [
+                    self._decode(content, filenames[i] if i < len(filenames) else None)
+                    for i, content in enumerate(params['value'])
+                ]
+            # Release the files held by the upload being replaced
+            old = self.value if isinstance(self.value, list) else [self.value]
+            for upload in old:
+                _discard_upload(upload)
         if 'filename' in params and len(params['filename']) == 0:
             params['filename'] = None
         if 'mime_type' in params and len(params['mime_type']) == 0:
             params['mime_type'] = None
         return params
 
+    def _decode(self, content: str, filename: str | None) -> bytes | Upload:
+        if self.storage == 'memory':
+            return b64decode(content)
+        # Decode incrementally to avoid holding a second copy in memory
+        upload = _open_upload(self.storage, self.upload_dir, filename)
+        for i in range(0, len(content), _B64_CHUNK_SIZE):
+            upload.write(b64decode(content[i:i+_B64_CHUNK_SIZE]))
+        return _close_upload(self.storage, upload)
+
     def save(self, filename):
         """
         Saves the uploaded FileInput data object(s) to file(s) or
@@ -306,15 +448,17 @@ class FileInput(Widget):
         for val, fn in zip(value, filename):
             if isinstance(fn, str):
                 with open(fn, 'wb') as f:
-                    f.write(val)
+                    _write_upload(val, f)
             else:
-                fn.write(val)
+                _write_upload(val, fn)
 
     def clear(self):
         """
         Clear the file(s) in the FileInput widget
         """
         self._send_event(ClearInput)
+        self._discard_uploads()
+        self.param.update(value=None, filename=None, mime_type=None)
 
 
 class FileDropper(Widget):
@@ -339,6 +483,12 @@ class FileDropper(Widget):
         or wild cards.For instance ['image/*'] will accept all images.
         ['.png', 'image/jpeg'] will only accepts PNGs and JPEGs.""")  # type: ignore[assignment, ty:invalid-assignment]
 
+    chunk_callback = param.Callable(default=None, doc="""
+        Callback invoked with the filename, the bytes of the chunk,
+        the index of the chunk (starting at 1) and the total number
+        of chunks as each chunk of an upload is received, allowing
+        uploads to be processed while they are streamed.""")
+
     chunk_size = param.Integer(default=10_000_000, doc="""
         Size in bytes per chunk transferred across the WebSocket.""")
 
@@ -374,20 +524,40 @@ class FileDropper(Widget):
         - image: Adds support for image previews.
         - pdf: Adds support for PDF previews.""")
 
+    storage: t.Literal['memory', 'tempfile', 'directory'] = param.Selector(
+        default='memory', objects=['memory', 'tempfile', 'directory'], doc="""
+        How the uploaded file(s) are stored:
+
+        - memory: Chunks are buffered in memory and the value holds the
+          contents as bytes (or str for files with a text/* mimetype).
+        - tempfile: Chunks are written to a SpooledTemporaryFile as they
+          arrive, which only rolls over to disk for large files, and the
+          value holds the file object.
+        - directory: Chunks are written to a file in the upload_dir as
+          they arrive and the value holds its pathlib.Path.""")  # type: ignore[assignment, ty:invalid-assignment]
+
+    upload_dir = param.String(default=None, doc="""
+        Directory uploads are written to if storage='directory'.
+        Defaults to the system temporary directory.""")
+
     value = param.Dict(default={}, doc="""
         A dictionary containing the uploaded file(s) as bytes or string
         objects indexed by the filename. Files that have a text/* mimetype
-        will automatically be decoded as utf-8.""")
+        will automatically be decoded as utf-8. Depending on the storage
+        mode files may instead be represented as a file object or path.""")
 
     width = param.Integer(default=300, allow_None=True, doc="""
       Width of this component. If sizing_mode is set to stretch
       or scale mode this will merely be used as a suggestion.""")
 
-    _rename = {'value': None}
+    _rename = {
+        'value': None, 'chunk_callback': None, 'storage': None,
+        'upload_dir': None
+    }
 
     def __init__(self, **params):
         super().__init__(**params)
-        self._file_buffer = {}
+        self._file_buffer: dict[str, list[bytes] | t.IO[bytes]] = {}
 
     def _get_model(
         self, doc: Document, root: Model | None = None,
@@ -399,8 +569,25 @@ class FileDropper(Widget):
         )
         model = super()._get_model(doc, root, parent, comm)
         self._register_events('delete_event', 'upload_event', model=model, doc=doc, comm=comm)
+        if comm is None:
+            doc.on_session_destroyed(self._on_session_destroyed)
         return model
 
+    def _on_session_destroyed(self, session_context):
+        if not _displayed_elsewhere(self, session_context):
+            self._discard_uploads()
+
+    def _discard_uploads(self) -> None:
+        """
+        Releases the files held by the uploaded value and by uploads
+        which were never completed.
+        """
+        for buffer in self._file_buffer.values():
+            _discard_upload(buffer)
+        self._file_buffer.clear()
+        for upload in self.value.values():
+            _discard_upload(upload)
+
     def _process_event(self, event: DeleteEvent | UploadEvent):
         data = event.data
         name = data['name']
@@ -408,23 +595,41 @@ class FileDropper(Widget):
             if name in self.mime_type:
                 del self.mime_type[name]
             if name in self.value:
-                del self.value[name]
+                _discard_upload(self.value.pop(name))
             self.param.trigger('mime_type', 'value')
             return
 
+        storage = self.storage
         if data['chunk'] == 1:
-            self._file_buffer[name] = []
-        self._file_buffer[name].append(data['data'])
+            if name in self._file_buffer:
+                _discard_upload(self._file_buffer[name])
+            if storage == 'memory':
+                self._file_buffer[name] = []
+            else:
+                self._file_buffer[name] = _open_upload(storage, self.upload_dir, name)
+        buffer = self._file_buffer[name]
+        if isinstance(buffer, list):
+            buffer.append(data['data'])
+        else:
+            buffer.write(data['data'])
+        if self.chunk_callback:
+            self.chunk_callback(name, data['data'], data['chunk'], data['total_chunks'])
         if data['chunk'] != data['total_chunks']:
             return
 
-        buffers = self._file_buffer.pop(name)
-        file_buffer: bytes | str = b''.join(buffers)
-        if data['type'].startswith('text/') and isinstance(file_buffer, bytes):
-            try:
-                file_buffer = file_buffer.decode('utf-8')
-            except UnicodeDecodeError:
-                pass
+        buffer = self._file_buffer.pop(name)
+        file_buffer: bytes | str | Upload
+        if isinstance(buffer, list):
+            file_buffer = b''.join(buffer)
+            if data['type'].startswith('text/'):
+                try:
+                    file_buffer = file_buffer.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+        else:
+            file_buffer = _close_upload(storage, buffer)
+        if name in self.value:
+            _discard_upload(self.value[name])
         self.value[name] = file_buffer
         self.mime_type[name] = data['type']
         self.param.trigger('mime_type', 'value')
@@ -32,9 +32,8 @@ from ..util import (
     value_as_datetime,
 )
 from ..viewable import Layoutable
-from ..widgets import FloatInput, IntInput
 from .base import CompositeWidget, Widget, WidgetBase
-from .input import StaticText
+from .input import FloatInput, IntInput, StaticText
 
 if t.TYPE_CHECKING:
     from collections.abc import Mapping
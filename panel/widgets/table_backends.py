@@ -0,0 +1,253 @@
+"""
+Backends allowing table widgets to display data which is not held in
+memory as a pandas DataFrame, e.g. lazy Polars frames, DuckDB
+relations or Arrow tables.
+
+A backend pushes filtering, sorting and pagination down to the
+underlying data library and only materializes the rows which are
+actually displayed as a pandas DataFrame.
+"""
+from __future__ import annotations
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import narwhals.stable.v2 as nw
+    import pandas as pd
+
+    FilterSpec = tuple[str, str, t.Any] | Callable[[t.Any], t.Any]
+    SorterSpec = tuple[str, bool]
+
+
+class TableBackend:
+    """
+    Base class for table backends.
+
+    A backend wraps the value of a table and implements a small query
+    protocol which is used by the `Tabulator` widget when paginating
+    remotely:
+
+      * `schema`: An empty pandas DataFrame declaring the columns and
+        dtypes of the data.
+      * `query`: Applies filters and sorters and returns a query object.
+      * `count`: Returns the number of rows matched by a query.
+      * `fetch`: Materializes a slice of the query as a pandas DataFrame.
+      * `to_native`: Converts a query back to the native data type.
+
+    Filters are declared as tuples of the form `(column, op, value)`,
+    where op may be one of '=', '!=', '<', '>', '<=', '>=', 'in', 'like',
+    'like_any', 'starts' and 'ends', or as a callable accepting and
+    returning the native data object. Sorters are declared as tuples
+    of the form `(column, ascending)`.
+
+    New backends can be registered by subclassing `TableBackend` and
+    implementing the `applies` classmethod.
+    """
+
+    # Backends with higher priority are checked first
+    priority: t.ClassVar[int] = 0
+
+    def __init__(self, data: t.Any):
+        self.data = data
+
+    @classmethod
+    def applies(cls, data: t.Any) -> bool:
+        """
+        Whether the backend can be used to query the supplied data.
+        """
+        return False
+
+    @property
+    def schema(self) -> pd.DataFrame:
+        """
+        Empty pandas DataFrame with the columns and dtypes of the data.
+        """
+        raise NotImplementedError
+
+    def query(self, filters: Sequence[FilterSpec], sorters: Sequence[SorterSpec]) -> t.Any:
+        """
+        Returns a query with the filters and sorters applied.
+        """
+        raise NotImplementedError
+
+    def count(self, query: t.Any) -> int:
+        """
+        Returns the number of rows matched by the query.
+        """
+        raise NotImplementedError
+
+    def fetch(self, query: t.Any, offset: int, limit: int) -> pd.DataFrame:
+        """
+        Materializes `limit` rows of the query starting at `offset`
+        as a pandas DataFrame indexed by the row position in the query.
+        """
+        raise NotImplementedError
+
+    def to_native(self, query: t.Any) -> t.Any:
+        """
+        Converts the query to the native type of the data.
+        """
+        return query
+
+
+class NarwhalsBackend(TableBackend):
+    """
+    Backend for any eager or lazy dataframe supported by narwhals,
+    including Polars DataFrame and LazyFrame objects, DuckDB relations
+    and PyArrow Tables.
+    """
+
+    _sort_prefix: t.ClassVar[str] = '__panel_sort_'
+
+    def __init__(self, data: t.Any):
+        import narwhals.stable.v2 as nw
+
+        super().__init__(data)
+        self._frame = nw.from_native(data)
+        self._schema: pd.DataFrame | None = None
+
+    @classmethod
+    def applies(cls, data: t.Any) -> bool:
+        # pandas DataFrames are handled natively by the table widgets
+        if type(data).__module__.split('.')[0] == 'pandas':
+            return False
+        import narwhals.stable.v2 as nw
+        try:
+            nw.from_native(data)
+        except TypeError:
+            return False
+        return True
+
+    @property
+    def schema(self) -> pd.DataFrame:
+        if self._schema is None:
+            self._schema = self._to_pandas(self._frame.head(0))
+        return self._schema
+
+    @classmethod
+    def _to_pandas(cls, frame: nw.DataFrame | nw.LazyFrame) -> pd.DataFrame:
+        import narwhals.stable.v2 as nw
+        if isinstance(frame, nw.LazyFrame):
+            frame = frame.collect()
+        return frame.to_pandas()
+
+    @classmethod
+    def _filter_expr(cls, column: str, op: str, value: t.Any) -> nw.Expr:
+        import narwhals.stable.v2 as nw
+        col = nw.col(column)
+        if op == '=':
+            return col == value
+        elif op == '!=':
+            return col != value
+        elif op == '<':
+            return col < value
+        elif op == '>':
+            return col > value
+        elif op == '<=':
+            return col <= value
+        elif op == '>=':
+            return col >= value
+        elif op == 'in':
+            return col.is_in(list(value))
+        elif op == 'like':
+            return col.str.to_lowercase().str.contains(str(value).lower(), literal=True)
+        elif op == 'like_any':
+            exprs = [cls._filter_expr(column, 'like', v) for v in value]
+            expr = exprs[0]
+            for e in exprs[1:]:
+                expr = expr | e
+            return expr
+        elif op == 'starts':
+            return col.str.starts_with(value)
+        elif op == 'ends':
+            return col.str.ends_with(value)
+        raise ValueError(f"Filter type {op!r} not recognized.")
+
+    def query(
+        self, filters: Sequence[FilterSpec], sorters: Sequence[SorterSpec]
+    ) -> nw.DataFrame | nw.LazyFrame:
+        import narwhals.stable.v2 as nw
+
+        frame = self._frame
+        exprs = []
+        for filt in filters:
+            if callable(filt):
+                frame = nw.from_native(filt(frame.to_native()))
+            else:
+                exprs.append(self._filter_expr(*filt))
+        if exprs:
+            frame = frame.filter(*exprs)
+        if not sorters:
+            return frame
+
+        # Tabulator sorts strings case insensitively, so we sort on
+        # temporary lowercase columns, which are dropped on fetch
+        schema = frame.collect_schema()
+        by, keys = [], {}
+        for i, (col, _) in enumerate(sorters):
+            if schema[col] == nw.String:
+                key = f'{self._sort_prefix}{i}'
+                keys[key] = nw.col(col).str.to_lowercase()
+                by.append(key)
+            else:
+                by.append(col)
+        if keys:
+            frame = frame.with_columns(**keys)
+        return frame.sort(by, descending=[not asc for _, asc in sorters])
+
+    def count(self, query: nw.DataFrame | nw.LazyFrame) -> int:
+        import narwhals.stable.v2 as nw
+        if isinstance(query, nw.DataFrame):
+            return len(query)
+        return int(query.select(nw.len()).collect().item())
+
+    def fetch(self, query: nw.DataFrame | nw.LazyFrame, offset: int, limit: int) -> pd.DataFrame:
+        import narwhals.stable.v2 as nw
+        import pandas as pd
+
+        if isinstance(query, nw.DataFrame):
+            page = query[offset:offset+limit]
+        else:
+            native = query.to_native()
+            impl = query.implementation
+            if impl is nw.Implementation.POLARS:
+                page = nw.from_native(native.slice(offset, limit))
+            elif impl is nw.Implementation.DUCKDB:
+                page = nw.from_native(native.limit(limit, offset))
+            else:
+                page = query.head(offset+limit).collect()[offset:]
+        df = self._to_pandas(page)[list(self.schema.columns)]
+        df.index = pd.RangeIndex(offset, offset+len(df))
+        return df
+
+    def to_native(self, query: nw.DataFrame | nw.LazyFrame) -> t.Any:
+        columns = [c for c in query.columns if not c.startswith(self._sort_prefix)]
+        if len(columns) != len(query.columns):
+            query = query.select(columns)
+        return query.to_native()
+
+
+def _backend_types(cls: type[TableBackend]) -> list[type[TableBackend]]:
+    types = [cls]
+    for subcls in cls.__subclasses__():
+        types.extend(_backend_types(subcls))
+    return types
+
+
+def get_backend(data: t.Any) -> TableBackend | None:
+    """
+    Returns a backend instance wrapping the data or None if the
+    data does not require a backend, e.g. if it is a pandas DataFrame.
+    """
+    if data is None:
+        return None
+    backends = sorted(_backend_types(TableBackend), key=lambda b: b.priority, reverse=True)
+    for backend in backends:
+        if backend.applies(data):
+            return backend(data)
+    return None
+
+
+__all__ = ['NarwhalsBackend', 'TableBackend', 'get_backend']
@@ -38,18 +38,20 @@ from ..util.warnings import warn
 from .base import Widget
 from .button import Button
 from .input import TextInput
+from .table_backends import get_backend
 
 if t.TYPE_CHECKING:
     import pandas as pd
 
     from bokeh.document import Document
-    from bokeh.models.sources import DataDict
+    from bokeh.models.sources import DataDict, Patches
     from pyviz_comms import Comm
 
     from ..models.tabulator import (
         CellClickEvent, SelectionEvent, TableEditEvent,
     )
     from ..reactive import TDataColumn
+    from .table_backends import TableBackend
 
     class FilterSpec(t.TypedDict, total=False):
         headerFilter: str | bool
@@ -158,6 +160,9 @@ class BaseTable(ReactiveData, Widget):
 
     _data_params: t.ClassVar[list[str]] = ['value']
 
+    # Whether the widget can display data wrapped in a TableBackend
+    _supports_backends: t.ClassVar[bool] = False
+
     _manual_params: t.ClassVar[list[str]] = [
         'formatters', 'editables', 'editors', 'widths', 'titles', 'value', 'show_index'
     ]
@@ -173,6 +178,7 @@ class BaseTable(ReactiveData, Widget):
         self._filters = []
         self._index_mapping = {}
         self._edited_indexes = []
+        self._backend_cache = (None, None)
         super().__init__(value=value, **params)
         self._internal_callbacks.extend([
             self.param.watch(self._setup_on_change, ['editors', 'formatters']),
@@ -195,7 +201,9 @@ class BaseTable(ReactiveData, Widget):
             return
         if event.type == 'triggered' and self._updating:
             return
-        if self._indexes_changed(event.old, event.new):
+        if not (hasattr(event.old, 'index') and hasattr(event.new, 'index')):
+            self.selection = []
+        elif self._indexes_changed(event.old, event.new):
             selection = []
             for sel in self.selection:
                 idx = event.old.index[sel]
@@ -214,7 +222,8 @@ class BaseTable(ReactiveData, Widget):
         have to reset various settings including expanded rows,
         scroll position, pagination etc.
         """
-        if type(old) is not type(new) or isinstance(new, dict) or len(old) != len(new):
+        if (type(old) is not type(new) or isinstance(new, dict) or
+            not hasattr(new, 'index') or len(old) != len(new)):
             return True
         return (old.index != new.index).any()
 
@@ -222,17 +231,44 @@ class BaseTable(ReactiveData, Widget):
     def _length(self):
         return len(self._processed)
 
+    @property
+    def _backend(self) -> TableBackend | None:
+        """
+        The backend wrapping the value if it is not a pandas DataFrame.
+        """
+        value, backend = self._backend_cache
+        if value is not self.value:
+            backend = get_backend(self.value)
+            self._backend_cache = (self.value, backend)
+        return backend
+
+    @property
+    def _schema(self) -> pd.DataFrame:
+        """
+        A pandas DataFrame declaring the columns, index and dtypes of
+        the value, which is empty if the value is wrapped in a backend.
+        """
+        backend = self._backend
+        return self.value if backend is None else backend.schema
+
     def _validate(self, *events: param.parameterized.Event):
         if self.value is None:
             return
-        cols = self.value.columns
+        elif self._backend is not None and not self._supports_backends:
+            vtype = type(self.value)
+            raise ValueError(
+                f'{type(self).__name__} widget does not support values of '
+                f'type {vtype.__module__}.{vtype.__name__}, provide a pandas '
+                'DataFrame or use the Tabulator widget.'
+            )
+        cols = self._schema.columns
         if len(cols) != len(cols.drop_duplicates()):
             raise ValueError('Cannot display a pandas.DataFrame with '
                              'duplicate column names.')
 
     def _get_fields(self) -> list[str]:
         indexes = self.indexes
-        col_names = [] if self.value is None else list(self.value.columns)
+        col_names = [] if self.value is None else list(self._schema.columns)
         if not self.hierarchical or len(indexes) == 1:
             col_names = indexes + col_names
         else:
@@ -245,7 +281,9 @@ class BaseTable(ReactiveData, Widget):
 
         indexes = self.indexes
         fields = self._get_fields()
-        df = self.value.reset_index() if len(indexes) > 1 else self.value
+        df = self._schema
+        if len(indexes) > 1:
+            df = df.reset_index()
         return self._get_column_definitions(fields, df)
 
     def _get_column_definitions(self, col_names: list[str], df: pd.DataFrame) -> list[TableColumn]:
@@ -390,9 +428,17 @@ class BaseTable(ReactiveData, Widget):
             for i, index in enumerate(self._processed.index)
         }
 
+    def _update_processed(self) -> DataDict:
+        """
+        Updates the processed view on the value and returns the data
+        to send to the frontend.
+        """
+        self._processed, data = self._get_data()
+        return data
+
     @updating
     def _update_cds(self, *events: param.parameterized.Event):
-        self._processed, data = self._get_data()
+        data = self._update_processed()
         self._update_index_mapping()
         self._data = {k: _convert_datetime_array_ignore_list(v) for k, v in data.items()}
         named_events = {e.name: e for e in events}
@@ -422,6 +468,8 @@ class BaseTable(ReactiveData, Widget):
         root = root or model
         self._link_props(model.source, ['data'], doc, root, comm)
         self._link_props(model.source.selected, ['indices'], doc, root, comm)
+        if comm is None:
+            self._link_data_patches(model.source, doc, root)
         self._models[root.ref['id']] = (model, parent)
         return model
 
@@ -451,26 +499,37 @@ class BaseTable(ReactiveData, Widget):
     def _sort_df(self, df: pd.DataFrame) -> pd.DataFrame:
         if not self.sorters:
             return df
+        return df.iloc[self._sort_order(df)]
+
+    def _sort_order(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Computes the integer positions of the rows of the DataFrame
+        after the sorters have been applied.
+
+        Only the sorted columns are gathered into a separate frame so
+        that the DataFrame itself never has to be copied.
+        """
+        import pandas as pd
+
         fields = [self._renamed_cols.get(s['field'], s['field']) for s in self.sorters]
         ascending = [s['dir'] == 'asc' for s in self.sorters]
 
-        # Making a copy of the DataFrame because it could be a view of the original
-        # dataframe. There could be a better place to do this.
-        df = df.copy()
-        # Temporarily add _index_ column because Tabulator uses internal _index
+        keys = {}
+        for i, field in enumerate(fields):
+            if field in df.columns:
+                values = df[field].array
+            elif self.show_index and field == 'index' and df.index.name is None:
+                # Handle sort on unnamed index column if show_index=True
+                values = df.index.array
+            else:
+                values = df.index.get_level_values(field).array
+            keys[i] = pd.Series(values, copy=False)
+
+        # Add _index_ column because Tabulator uses internal _index
         # as additional sorter to break ties
-        df['_index_'] = np.arange(len(df)).astype(str)
-        fields.append('_index_')
+        keys[len(fields)] = pd.Series(np.arange(len(df)).astype(str), copy=False)
         ascending.append(True)
 
-        # Handle sort on index column if show_index=True
-        if self.show_index:
-            rename = 'index' in fields and df.index.name is None
-            if rename:
-                df.index.name = 'index'
-        else:
-            rename = False
-
         def tabulator_sorter(col):
             # Tabulator JS defines its own sorting algorithm:
             # - strings's case isn't taken into account
@@ -481,14 +540,11 @@ class BaseTable(ReactiveData, Widget):
             except Exception:
                 return col
 
-        df_sorted = df.sort_values(fields, ascending=ascending, kind='mergesort',
-                                  key=tabulator_sorter)
-
-        # Revert temporary changes to DataFrames
-        if rename:
-            df_sorted.index.name = None
-        df_sorted.drop(columns=['_index_'], inplace=True)
-        return df_sorted
+        keys_df = pd.DataFrame(keys)
+        keys_sorted = keys_df.sort_values(
+            list(keys), ascending=ascending, kind='mergesort', key=tabulator_sorter
+        )
+        return keys_sorted.index.to_numpy()
 
     def _filter_dataframe(
         self,
@@ -737,6 +793,22 @@ class BaseTable(ReactiveData, Widget):
             data = {k: v for k, v in data.items() if k not in indexes}
         return df, {k if isinstance(k, str) else str(k): self._process_column(v, k, df) for k, v in data.items()}
 
+    def _process_patches(self, patches: list[Patches]) -> bool:
+        if not isinstance(self.value, type(self._processed)) or not self.value.index.is_unique:
+            return False
+        return super()._process_patches(patches)
+
+    def _update_cells(self, column: str, rows: list[int], values: TDataColumn) -> None:
+        import pandas as pd
+
+        index = self._processed.index[rows]
+        ilocs = self.value.index.get_indexer(index)
+        with _stringdtype_error(self.value, column, values):
+            self.value.iloc[ilocs, self.value.columns.get_loc(column)] = values
+        if self._processed is not self.value:
+            with pd.option_context('mode.chained_assignment', None):
+                self._processed.iloc[rows, self._processed.columns.get_loc(column)] = values
+
     def _update_column(self, column: str, array: TDataColumn):
         import pandas as pd
 
@@ -754,16 +826,17 @@ class BaseTable(ReactiveData, Widget):
         import pandas as pd
         if self.value is None or not self.show_index:
             return []
-        elif isinstance(self.value.index, pd.MultiIndex):
+        schema = self._schema
+        if isinstance(schema.index, pd.MultiIndex):
             indexes = [
                 f'level_{i}' if n is None else n
-                for i, n in enumerate(self.value.index.names)
+                for i, n in enumerate(schema.index.names)
             ]
-            if self.value.columns.nlevels > 1:
-                indexes = [i + "_" * (self.value.columns.nlevels - 1) for i in indexes]
+            if schema.columns.nlevels > 1:
+                indexes = [i + "_" * (schema.columns.nlevels - 1) for i in indexes]
             return indexes
-        default_index = ('level_0' if 'index' in self.value.columns else 'index')
-        return [self.value.index.name or default_index]
+        default_index = ('level_0' if 'index' in schema.columns else 'index')
+        return [schema.index.name or default_index]
 
     def stream(self, stream_value, rollover=None, reset_index=True):
         """
@@ -824,6 +897,11 @@ class BaseTable(ReactiveData, Widget):
         """
         import pandas as pd
 
+        if self._backend is not None:
+            raise ValueError(
+                f"Streaming to a {type(self).__name__} displaying an object "
+                f"of type {type(self.value).__name__} is not supported."
+            )
         if not np.isfinite(self.value.index.max()):
             value_index_start = 1
         else:
@@ -1384,6 +1462,12 @@ class Tabulator(BaseTable):
     # pagination is enabled
     _MAX_ROW_LIMITS: t.ClassVar[tuple[int, int]] = (200, 10000)
 
+    _supports_backends: t.ClassVar[bool] = True
+
+    # Parameters which do not invalidate the cached filter and sort
+    # results used for remote pagination
+    _query_params: t.ClassVar[tuple[str, ...]] = ('page', 'page_size', 'sorters', 'filters')
+
     _stylesheets = [CSS_URLS['font-awesome']]
 
     def __init__(self, value=None, **params):
@@ -1401,9 +1485,16 @@ class Tabulator(BaseTable):
         self._child_panels = {}
         self._indexed_children = {}
         self._explicit_pagination = 'pagination' in params
+        # The pagination to restore once the value is no longer
+        # wrapped in a backend
+        self._backend_pagination: tuple[str | None] | None = None
         self._on_edit_callbacks = []
         self._on_click_callbacks = {}
         self._old_value = None
+        self._edited_cells = {}
+        self._query_cache = {}
+        self._processed_df = None
+        self._processed_query = None
         super().__init__(value=value, **params)
         self._configuration = configuration
         self.param.watch(self._update_children, self._content_params)
@@ -1422,21 +1513,97 @@ class Tabulator(BaseTable):
         """
         Ensure large tables automatically enable remote pagination.
         """
-        if self.value is None or self._explicit_pagination:
+        if self.value is not None and self._backend is not None:
+            # Data wrapped in a backend is only ever queried page by
+            # page, the previous pagination is restored once the value
+            # is no longer wrapped in a backend
+            if self.pagination != 'remote':
+                self._backend_pagination = (self.pagination,)
+                self._set_pagination('remote')
             return
-        with param.parameterized.discard_events(self):
-            if self.hierarchical:
-                pass
-            elif self._MAX_ROW_LIMITS[0] < len(self.value) <= self._MAX_ROW_LIMITS[1]:
-                self.pagination = 'local'
-            elif len(self.value) > self._MAX_ROW_LIMITS[1]:
-                self.pagination = 'remote'
-        self._explicit_pagination = False
+        if self._backend_pagination is not None:
+            (pagination,) = self._backend_pagination
+            self._backend_pagination = None
+            self._set_pagination(pagination)
+        if self.value is None or self._explicit_pagination or self.hierarchical:
+            return
+        elif self._MAX_ROW_LIMITS[0] < len(self.value) <= self._MAX_ROW_LIMITS[1]:
+            self._set_pagination('local')
+        elif len(self.value) > self._MAX_ROW_LIMITS[1]:
+            self._set_pagination('remote')
+
+    def _set_pagination(self, pagination: str | None):
+        """
+        Sets the pagination without marking it as explicitly set.
+        """
+        if pagination == self.pagination:
+            return
+        explicit = self._explicit_pagination
+        try:
+            self.pagination = pagination
+        finally:
+            self._explicit_pagination = explicit
 
     @param.depends('pagination', watch=True)
     def _set_explicict_pagination(self):
         self._explicit_pagination = True
 
+    @property
+    def _length(self):
+        if self.value is not None and self._backend is not None:
+            return self._get_backend_query()[1]
+        elif self._processed_query is not None:
+            df, positions = self._processed_query
+            return len(df) if positions is None else len(positions)
+        return super()._length
+
+    @property
+    def _processed(self) -> t.Any:
+        """
+        The filtered and sorted view on the value. With remote
+        pagination the rows of the view are only taken from the value
+        once the whole view is needed, so that changing the page only
+        has to take the rows on that page.
+        """
+        if self._processed_query is not None:
+            df, positions = self._processed_query
+            self._processed_query = None
+            self._processed_df = df if positions is None else df.iloc[positions]
+        return self._processed_df
+
+    @_processed.setter
+    def _processed(self, processed: t.Any) -> None:
+        self._processed_query = None
+        self._processed_df = processed
+
+    def _processed_page(self) -> pd.DataFrame | None:
+        """
+        Returns the rows of the processed view on the current page,
+        without taking all rows of the view.
+        """
+        nrows = self.page_size or self.initial_page_size
+        start = (self.page-1)*nrows
+        if self._processed_query is None:
+            df = self._processed
+            return None if df is None else df.iloc[start:start+nrows]
+        df, positions = self._processed_query
+        if positions is None:
+            return df.iloc[start:start+nrows]
+        return df.iloc[positions[start:start+nrows]]
+
+    def _update_index_mapping(self):
+        if self.pagination != 'remote' or self._backend is not None:
+            return super()._update_index_mapping()
+        # Only the rows on the current page can be clicked or edited
+        page = self._processed_page()
+        if page is None:
+            self._index_mapping = {}
+            return
+        start = (self.page-1)*(self.page_size or self.initial_page_size)
+        self._index_mapping = {
+            start+i: index for i, index in enumerate(page.index)
+        }
+
     @staticmethod
     def _validate_iloc(idx, iloc):
         # Validate that the index returned by Pandas get_loc is a single int,
@@ -1451,7 +1618,13 @@ class Tabulator(BaseTable):
 
     def _validate(self, *events):
         super()._validate(*events)
-        if self.value is not None:
+        if self.value is not None and self._backend is not None:
+            if self.pagination != 'remote':
+                raise ValueError(
+                    f"{type(self).__name__} only supports pagination='remote' "
+                    f"when displaying an object of type {type(self.value).__name__}."
+                )
+        elif self.value is not None:
             todo = []
             if self.style is not None:
                 todo = self.style._todo
@@ -1484,6 +1657,20 @@ class Tabulator(BaseTable):
             nrows = self.page_size or self.initial_page_size
             event.row = event.row+(self.page-1)*nrows
 
+        if self._backend is not None:
+            # Rows are identified by their position in the queried view
+            if event_col not in self.buttons and event.row in self._processed.index:
+                if event_col in self._processed.columns:
+                    event.value = self._processed[event_col].loc[event.row]
+                else:
+                    event.value = event.row
+            if event.event_name != 'table-edit':
+                for cb in self._on_click_callbacks.get(None, []):
+                    state.execute(partial(cb, event), schedule=False)
+                for cb in self._on_click_callbacks.get(event_col, []):
+                    state.execute(partial(cb, event), schedule=False)
+            return
+
         idx = self._index_mapping.get(event.row, event.row)
         iloc = self.value.index.get_loc(idx)
         self._validate_iloc(idx, iloc)
@@ -1504,7 +1691,9 @@ class Tabulator(BaseTable):
                 if filters and filters[0].any():
                     self._edited_indexes.append(idx)
             else:
-                if self._old_value is not None:
+                if (event_col, event.row) in self._edited_cells:
+                    event.old = self._edited_cells.pop((event_col, event.row))
+                elif self._old_value is not None:
                     event.old = self._old_value[event_col].iloc[event.row]
                 for cb in self._on_edit_callbacks:
                     state.execute(partial(cb, event), schedule=False)
@@ -1545,6 +1734,9 @@ class Tabulator(BaseTable):
 
         # It also makes a copy of the value dataframe, to use it to obtain
         # the old value in a table-edit event.
+        if self._apply_data_patches() or self._backend is not None:
+            # Data wrapped in a backend is not editable
+            return
         self._old_value = self.value.copy()
 
         import pandas as pd
@@ -1564,18 +1756,42 @@ class Tabulator(BaseTable):
         return super()._process_data(data)
 
     def _get_data(self):
-        if self.pagination != 'remote' or self.value is None:
+        if self.value is not None and self._backend is not None:
+            return self._get_backend_data()
+        elif self.pagination != 'remote' or self.value is None:
             return super()._get_data()
+        df, positions = rows = self._get_query()
+        processed = df if positions is None else df.iloc[positions]
+        return processed, self._get_page_data(rows)
+
+    def _update_processed(self):
+        if self.pagination != 'remote' or self.value is None or self._backend is not None:
+            return super()._update_processed()
+        df, positions = rows = self._get_query()
+        if df is self.value:
+            # Defer taking the rows of the view until it is needed
+            self._processed = None
+            self._processed_query = rows
+        else:
+            self._processed = df
+        return self._get_page_data(rows)
 
+    def _get_page_data(self, rows: tuple[pd.DataFrame, np.ndarray | None]) -> DataDict:
+        """
+        Returns the data of the current page of the filtered and
+        sorted view, taking only the rows on the page.
+        """
         # If data is paginated the current view on the frontend
         # and locally are identical and both paginated
         import pandas as pd
-        df = self._filter_dataframe(self.value)
-        df = self._sort_df(df)
+        df, positions = rows
         nrows = self.page_size or self.initial_page_size
         start = (self.page-1)*nrows
 
-        page_df = df.iloc[start: start+nrows]
+        if positions is None:
+            page_df = df.iloc[start: start+nrows]
+        else:
+            page_df = df.iloc[positions[start: start+nrows]]
         if isinstance(self.value.index, pd.MultiIndex):
             indexes = [
                 f'level_{i}' if n is None else n
@@ -1587,10 +1803,208 @@ class Tabulator(BaseTable):
         if len(indexes) > 1:
             page_df = page_df.reset_index()
         data = ColumnDataSource.from_df(page_df).items()
-        return df, {k if isinstance(k, str) else str(k): self._process_column(v, k, page_df) for k, v in data}
+        return {k if isinstance(k, str) else str(k): self._process_column(v, k, page_df) for k, v in data}
+
+    def _query_key(self) -> tuple[tuple[t.Any, ...], tuple[t.Any, ...]]:
+        """
+        Returns keys identifying the current filter and sort state
+        used to look up the cached query results.
+        """
+        internal = []
+        for col, filt in self._filters:
+            if isinstance(filt, param.Parameter):
+                val = getattr(filt.owner, filt.name) if filt.name else None
+                internal.append((col, id(filt), repr(val)))
+            elif isinstance(filt, (FunctionType, MethodType, partial)):
+                internal.append((col, id(filt)))
+            else:
+                internal.append((col, repr(filt)))
+        filter_key = (
+            id(self.value), tuple(internal), repr(self.filters),
+            tuple(self._edited_indexes)
+        )
+        return filter_key, (filter_key, repr(self.sorters), self.show_index)
+
+    def _get_query(self) -> tuple[pd.DataFrame, np.ndarray | None]:
+        """
+        Returns the filtered and sorted view on the value used when
+        pagination is remote as a DataFrame and the positions of the
+        rows of the view in it (or None if it contains all rows in
+        order).
+
+        Only the positions of the filtered and of the sorted rows are
+        cached, so changing the page does not have to re-apply the
+        filters and sorters and changing the sorters does not have to
+        re-apply the filters, without holding on to copies of the data.
+        """
+        filter_key, sort_key = self._query_key()
+        cached = self._query_cache.get('sorted')
+        if cached is not None and cached[0] == sort_key:
+            return self.value, cached[1]
+        cached = self._query_cache.get('filtered')
+        if cached is not None and cached[0] == filter_key:
+            positions = cached[1]
+        else:
+            df = self._filter_dataframe(self.value)
+            if df is self.value:
+                positions = None
+            elif self.value.index.is_unique:
+                positions = self.value.index.get_indexer(df.index)
+            else:
+                # The filtered rows cannot be located by their index
+                return self._sort_df(df), None
+            self._query_cache['filtered'] = (filter_key, positions, len(self.value))
+        if self.sorters:
+            order = self._sort_order(self._take_rows(positions))
+            positions = order if positions is None else positions[order]
+        self._query_cache['sorted'] = (sort_key, positions)
+        return self.value, positions
+
+    def _take_rows(self, positions: np.ndarray | None) -> pd.DataFrame:
+        """
+        Returns the rows of the value at the cached positions.
+        """
+        return self.value if positions is None else self.value.iloc[positions]
+
+    def _get_backend_filters(self) -> list[t.Any]:
+        """
+        Converts the internal and header filters to filter declarations
+        which can be pushed down to the backend.
+        """
+        schema = self._schema
+        filters: list[t.Any] = []
+        for col_name, filt in self._filters:
+            if isinstance(filt, (FunctionType, MethodType, partial)):
+                filters.append(filt)
+                continue
+            elif col_name not in schema.columns:
+                continue
+            if isinstance(filt, param.Parameter):
+                if filt.name is None:
+                    continue
+                val = getattr(filt.owner, filt.name)
+            else:
+                val = filt
+            if val is None:
+                continue
+            elif np.isscalar(val):
+                filters.append((col_name, '=', val))
+            elif isinstance(val, (list, set)):
+                if val:
+                    filters.append((col_name, 'in', list(val)))
+            elif isinstance(val, tuple):
+                start, end = val
+                if start is not None:
+                    filters.append((col_name, '>=', start))
+                if end is not None:
+                    filters.append((col_name, '<=', end))
+            else:
+                raise ValueError(f"'{col_name} filter value not "
+                                 "understood. Must be either a scalar, "
+                                 "tuple or list.")
+
+        filt_def = self.header_filters if isinstance(self.header_filters, dict) else {}
+        for filt in self.filters:
+            col_name = self._renamed_cols.get(filt['field'], filt['field'])
+            op = filt['type']
+            val = filt['value']
+            if col_name not in schema.columns:
+                continue
+
+            # Sometimes Tabulator will provide a zero/single element list
+            if isinstance(val, list):
+                if len(val) == 1:
+                    val = val[0]
+                elif not val:
+                    continue
+
+            kind = schema[col_name].dtype.kind
+            if kind in 'iufb' and not isinstance(val, list):
+                val = schema[col_name].dtype.type(val).item()
+            if op == 'in':
+                filters.append((col_name, op, val if isinstance(val, list) else [val]))
+            elif op == 'keywords':
+                match_all = filt_def.get(col_name, {}).get('matchAll', False)
+                sep = filt_def.get(col_name, {}).get('separator', ' ')
+                matches = val.split(sep)
+                if match_all:
+                    filters.extend((col_name, 'like', match) for match in matches)
+                else:
+                    filters.append((col_name, 'like_any', matches))
+            elif op == 'regex':
+                raise ValueError("Regex filtering not supported.")
+            else:
+                filters.append((col_name, op, val))
+        return filters
+
+    def _get_backend_query(self) -> tuple[t.Any, int]:
+        """
+        Returns the backend query with filters and sorters applied and
+        the number of rows it matches, caching both so that changing
+        the page only has to fetch the rows on that page.
+        """
+        _, sort_key = self._query_key()
+        cached = self._query_cache.get('backend')
+        if cached is not None and cached[0] == sort_key:
+            return cached[1], cached[2]
+        backend = self._backend
+        columns = self._schema.columns
+        sorters = [
+            (field, s['dir'] == 'asc') for s in self.sorters
+            if (field := self._renamed_cols.get(s['field'], s['field'])) in columns
+        ]
+        query = backend.query(self._get_backend_filters(), sorters)
+        length = backend.count(query)
+        self._query_cache['backend'] = (sort_key, query, length)
+        return query, length
+
+    def _get_backend_data(self) -> tuple[pd.DataFrame, DataDict]:
+        query, length = self._get_backend_query()
+        nrows = self.page_size or self.initial_page_size
+        start = (self.page-1)*nrows
+        page_df = self._backend.fetch(query, start, nrows)
+        data = ColumnDataSource.from_df(page_df).items()
+        return page_df, {k if isinstance(k, str) else str(k): self._process_column(v, k, page_df) for k, v in data}
+
+    def _append_query_cache(self, rollover: int | None = None) -> None:
+        """
+        Updates the cached filter results after rows have been streamed
+        by filtering only the appended rows. The cached sort order is
+        discarded since the new rows have to be sorted into it.
+        """
+        filtered = self._query_cache.get('filtered')
+        self._query_cache.clear()
+        if (filtered is None or rollover is not None or
+            not (self.filters or self._filters) or
+            any(col is None for col, _ in self._filters)):
+            return
+        _, positions, nrows = filtered
+        if (positions is None or len(self.value) < nrows or
+            not self.value.index.is_unique):
+            return
+        appended = self.value.iloc[nrows:]
+        new = self._filter_dataframe(appended)
+        if new is appended:
+            new_positions = np.arange(len(appended))
+        else:
+            new_positions = appended.index.get_indexer(new.index)
+        positions = np.concatenate([positions, new_positions + nrows])
+        self._query_cache['filtered'] = (self._query_key()[0], positions, len(self.value))
+
+    def _patch_query_cache(self, patch: dict[str, list[tuple[t.Any, t.Any]]]) -> None:
+        """
+        Discards the cached query results if the patched columns
+        affect the filtering or sorting.
+        """
+        columns = {self._renamed_cols.get(f['field'], f['field']) for f in self.filters}
+        columns |= {self._renamed_cols.get(s['field'], s['field']) for s in self.sorters}
+        columns |= {col for col, _ in self._filters}
+        if None in columns or columns & set(patch):
+            self._query_cache.clear()
 
     def _get_style_data(self, recompute=True):
-        if self.value is None or self.style is None or self.value.empty:
+        if (self.value is None or self.style is None or self._backend is not None or
+            self.value.empty or not self.style._todo):
             return {}
         df = self._processed
         if len(self.indexes) > 1:
@@ -1664,11 +2078,10 @@ class Tabulator(BaseTable):
     def _get_selectable(self):
         if self.value is None or self.selectable_rows is None:
             return None
-        df = self._processed
-        if self.pagination == 'remote':
-            nrows = self.page_size or self.initial_page_size
-            start = (self.page-1)*nrows
-            df = df.iloc[start:(start+nrows)]
+        if self.pagination == 'remote' and self._backend is None:
+            df = self._processed_page()
+        else:
+            df = self._processed
         return self.selectable_rows(df)
 
     def _update_style(self, recompute=True):
@@ -1700,11 +2113,10 @@ class Tabulator(BaseTable):
     def _get_children(self):
         if self.row_content is None or self.value is None:
             return {}, [], []
-        df = self._processed
-        if self.pagination == 'remote':
-            nrows = self.page_size or self.initial_page_size
-            start = (self.page-1)*nrows
-            df = df.iloc[start:(start+nrows)]
+        if self.pagination == 'remote' and self._backend is None:
+            df = self._processed_page()
+        else:
+            df = self._processed
         indexed_children, children = {}, {}
         if self.embed_content:
             indexes = list(range(len(df)))
@@ -1723,11 +2135,17 @@ class Tabulator(BaseTable):
         else:
             expanded = []
             for i in self.expanded:
-                idx = self.value.index[i]
+                if self._backend is not None:
+                    # Only rows on the current page can be rendered
+                    if i not in df.index:
+                        continue
+                    idx, row = i, df.loc[i]
+                else:
+                    idx, row = self.value.index[i], self.value.iloc[i]
                 if idx in self._indexed_children:
                     child = self._indexed_children[idx]
                 else:
-                    child = self._get_row_content_panel(self.value.iloc[i])
+                    child = self._get_row_content_panel(row)
                 try:
                     loc = df.index.get_loc(idx)
                 except KeyError:
@@ -1777,12 +2195,13 @@ class Tabulator(BaseTable):
     @updating
     def _stream(self, stream, rollover=None, follow=True):
         if self.pagination == 'remote':
+            self._append_query_cache(rollover)
             length = self._length
             nrows = self.page_size or self.initial_page_size
             max_page = max(length//nrows + bool(length%nrows), 1)
             if self.page != max_page and not follow:
                 return
-            self._processed, _ = self._get_data()
+            self._update_processed()
             return
         super()._stream(stream, rollover)
         self._update_style()
@@ -1803,6 +2222,7 @@ class Tabulator(BaseTable):
     @updating
     def _patch(self, patch):
         if self.filters or self._filters or self.sorters:
+            self._patch_query_cache(patch)
             self._updating = False
             self._update_cds()
             return
@@ -1829,7 +2249,9 @@ class Tabulator(BaseTable):
         page_events = ('page', 'page_size', 'sorters')
         if self._updating:
             return
-        elif events and all(e.name in page_events for e in events) and self.pagination == 'local':
+        if any(e.obj is not self or e.name not in self._query_params for e in events):
+            self._query_cache.clear()
+        if events and all(e.name in page_events for e in events) and self.pagination == 'local':
             return
         elif events and all(e.name in page_events for e in events) and not self.pagination:
             self._processed, _ = self._get_data()
@@ -1866,30 +2288,55 @@ class Tabulator(BaseTable):
 
     def _update_selected(self, *events: param.parameterized.Event, indices=None):
         kwargs = {}
-        if self.value is not None:
+        if self.value is not None and self._backend is not None:
+            start = self._processed.index.start
+            stop = self._processed.index.stop
+            kwargs['indices'] = [s - start for s in self.selection if start <= s < stop]
+        elif self.value is not None:
             # Compute integer indexes of the selected rows
             # on the displayed page
             index = self.value.iloc[self.selection].index
+            if self.pagination == 'remote':
+                processed = self._processed_page()
+            else:
+                processed = self._processed
             indices = []
             for ind in index.values:
                 try:
-                    iloc = self._processed.index.get_loc(ind)
+                    iloc = processed.index.get_loc(ind)
                     self._validate_iloc(ind, iloc)
-                    indices.append((ind, iloc))
+                    indices.append(iloc)
                 except KeyError:
                     continue
-            if self.pagination == 'remote':
-                nrows = self.page_size or self.initial_page_size
-                start = (self.page - 1) * nrows
-                end = start+nrows
-                p_range = self._processed.index[start:end]
-                indices = [iloc - start for ind, iloc in indices
-                           if ind in p_range]
-            else:
-                indices = [iloc for _, iloc in indices]
             kwargs['indices'] = indices
         super()._update_selected(*events, **kwargs)
 
+    def _process_patches(self, patches: list[Patches]) -> bool:
+        # With remote pagination header filters are applied on the
+        # frontend and backend, requiring the full reconciliation
+        # implemented in _process_data
+        if self._backend is not None or (self.pagination == 'remote' and self.filters):
+            return False
+        self._old_value = None
+        self._edited_cells.clear()
+        return super()._process_patches(patches)
+
+    def _processed_rows(self, rows: list[int]) -> list[int]:
+        if self.pagination != 'remote':
+            return rows
+        nrows = self.page_size or self.initial_page_size
+        start = (self.page - 1) * nrows
+        return [start+row for row in rows]
+
+    def _update_cells(self, column: str, rows: list[int], values: TDataColumn) -> None:
+        self._query_cache.clear()
+        ilocs = self.value.index.get_indexer(self._processed.index[rows])
+        old = self.value[column].iloc[ilocs]
+        self._edited_cells.update({
+            (column, int(iloc)): old_value for iloc, old_value in zip(ilocs, old)
+        })
+        super()._update_cells(column, rows, values)
+
     def _update_column(self, column: str, array: TDataColumn) -> None:
         import pandas as pd
 
@@ -1901,13 +2348,14 @@ class Tabulator(BaseTable):
             with pd.option_context('mode.chained_assignment', None):
                 self._processed[column] = array
             return
-        nrows = self.page_size or self.initial_page_size
-        start = (self.page - 1) * nrows
-        end = start+nrows
-        index = self._processed.iloc[start:end].index.values
+        self._query_cache.clear()
+        index = self._processed_page().index.values
         with _stringdtype_error(self.value, column, array):
             self.value.loc[index, column] = array
 
+        if self._processed_query is not None:
+            # The rows of the view have not been taken from the value yet
+            return
         with pd.option_context('mode.chained_assignment', None):
             self._processed.loc[index, column] = array
 
@@ -1918,10 +2366,21 @@ class Tabulator(BaseTable):
         else:
             start = 0
         ilocs = list(existing)
+        if self._backend is not None:
+            # Rows are identified by their position in the queried view
+            for iloc in (start+ind for ind in indexes):
+                if iloc >= self._length:
+                    continue
+                elif add:
+                    ilocs.append(iloc)
+                elif iloc in ilocs:
+                    ilocs.remove(iloc)
+            return list(dict.fromkeys(ilocs))
+        processed = self._processed_page() if self.pagination == 'remote' else self._processed
         try:
-            index = self._processed.iloc[[start+ind for ind in indexes]].index
+            index = processed.iloc[list(indexes)].index
         except IndexError:
-            index = self._processed.iloc[[]].index
+            index = processed.iloc[[]].index
         for v in index.values:
             try:
                 iloc = self.value.index.get_loc(v)
@@ -1975,7 +2434,10 @@ class Tabulator(BaseTable):
                 ]
         params = Reactive._process_param_change(self, params)
         if 'disabled' in params:
-            params['editable'] = not params.pop('disabled') and len(self.indexes) <= 1
+            params['editable'] = (
+                not params.pop('disabled') and len(self.indexes) <= 1 and
+                (self.value is None or self._backend is None)
+            )
         if 'frozen_rows' in params:
             length = self._length
             params['frozen_rows'] = [
@@ -1983,8 +2445,8 @@ class Tabulator(BaseTable):
             ]
         if 'hidden_columns' in params:
             import pandas as pd
-            if not self.show_index and self.value is not None and not isinstance(self.value.index, pd.MultiIndex):
-                params['hidden_columns'] = params['hidden_columns'] + [self.value.index.name or 'index']
+            if not self.show_index and self.value is not None and not isinstance(self._schema.index, pd.MultiIndex):
+                params['hidden_columns'] = params['hidden_columns'] + [self._schema.index.name or 'index']
         if 'selectable_rows' in params:
             params['selectable_rows'] = self._get_selectable()
         return params
@@ -2013,9 +2475,9 @@ class Tabulator(BaseTable):
         elif self.header_filters == True:
             if column.field in self.indexes:
                 if len(self.indexes) == 1:
-                    col = self.value.index
+                    col = self._schema.index
                 else:
-                    col = self.value.index.get_level_values(self.indexes.index(column.field))
+                    col = self._schema.index.get_level_values(self.indexes.index(column.field))
                 if col.dtype.kind in 'uif':
                     fspec['headerFilter'] = 'number'
                 elif col.dtype.kind == 'b':
@@ -2152,11 +2614,11 @@ class Tabulator(BaseTable):
                 col_dict['titleFormatterParams'] = title_formatter
             if field in self.indexes:
                 if len(self.indexes) == 1:
-                    dtype = self.value.index.dtype
+                    dtype = self._schema.index.dtype
                 else:
-                    dtype = self.value.index.get_level_values(self.indexes.index(field)).dtype
+                    dtype = self._schema.index.get_level_values(self.indexes.index(field)).dtype
             else:
-                dtype = self.value.dtypes[index]
+                dtype = self._schema.dtypes[index]
             if dtype.kind == 'M':
                 col_dict['sorter'] = 'timestamp'
             elif dtype.kind in 'iuf':
@@ -2336,10 +2798,27 @@ class Tabulator(BaseTable):
     def current_view(self) -> pd.DataFrame:
         """
         Returns the current view of the table after filtering and
-        sorting are applied.
+        sorting are applied. If the value is not a pandas DataFrame
+        the view is returned as a query of the same type.
         """
+        if self.value is not None and self._backend is not None:
+            return self._backend.to_native(self._get_backend_query()[0])
         df = self._processed
         if self.pagination == 'remote':
             return df
         df = self._filter_dataframe(df, header_filters=True, internal_filters=False)
         return self._sort_df(df)
+
+    @property
+    def selected_dataframe(self):
+        """
+        Returns a DataFrame of the currently selected rows.
+        """
+        if self.value is None or self._backend is None:
+            return super().selected_dataframe
+        elif not self.selection:
+            return self._processed.iloc[:0]
+        start, end = min(self.selection), max(self.selection)
+        query, _ = self._get_backend_query()
+        df = self._backend.fetch(query, start, end-start+1)
+        return df.loc[[s for s in self.selection if s in df.index]]
@@ -0,0 +1,80 @@
+"""
+Benchmarks the number of initial page requests per second a Panel
+server can handle, i.e. the time to create a session and render the
+HTML page for it.
+
+Usage:
+
+    python scripts/benchmark_page_requests.py [--requests N] [--app APP] [--resources MODE] [--uncached]
+"""
+import argparse
+import socket
+import time
+
+import requests
+
+import panel as pn
+
+from panel.io import resources
+
+
+def minimal_app():
+    return pn.pane.Markdown('# Benchmark')
+
+
+def layout_app():
+    return pn.Column(
+        pn.pane.Markdown('# Benchmark'),
+        pn.widgets.FloatSlider(name='Slider'),
+        pn.widgets.Select(options=['A', 'B', 'C']),
+        pn.Row(*(pn.pane.Str(i) for i in range(10))),
+    )
+
+
+APPS = {'minimal': minimal_app, 'layout': layout_app}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('', 0))
+        return sock.getsockname()[1]
+
+
+def main(n_requests, app, mode, uncached):
+    if uncached:
+        resources.BUNDLE_CACHE_SIZE = 0
+    port = free_port()
+    server = pn.serve(
+        {'app': APPS[app]}, port=port, threaded=True, show=False, resources=mode
+    )
+    url = f'http://localhost:{port}/app'
+    try:
+        with requests.Session() as session:
+            # Wait for the server to start and warm up
+            for _ in range(50):
+                try:
+                    session.get(url).raise_for_status()
+                    break
+                except requests.ConnectionError:
+                    time.sleep(0.1)
+            start = time.perf_counter()
+            for _ in range(n_requests):
+                session.get(url).raise_for_status()
+            elapsed = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    print(
+        f"{n_requests} requests ({app} app, {mode} resources, {'uncached' if uncached else 'cached'}): "
+        f"{n_requests / elapsed:.1f} requests/s, {elapsed / n_requests * 1e3:.1f} ms/request"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--requests", type=int, default=100, help="Number of page requests")
+    parser.add_argument("--app", default="minimal", choices=list(APPS), help="App to serve")
+    parser.add_argument("--resources", default="cdn", choices=["cdn", "server", "inline"], help="Resource mode")
+    parser.add_argument("--uncached", action="store_true", help="Disable the resource bundle cache")
+    args = parser.parse_args()
+    main(args.requests, args.app, args.resources, args.uncached)
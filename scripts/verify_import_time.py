@@ -0,0 +1,72 @@
+"""
+Measures the time taken by `import panel` using `python -X importtime`
+and reports the slowest modules. Timings depend on the machine so they
+are only reported; the script fails if `import panel` eagerly imports
+any of the lazily loaded submodules.
+
+Usage:
+
+    python scripts/verify_import_time.py [--repeat N] [--top N]
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+#: Submodules which must only be imported on first access
+LAZY_MODULES = (
+    "panel.chat",
+    "panel.custom",
+    "panel.layout",
+    "panel.pane",
+    "panel.param",
+    "panel.reactive",
+    "panel.template",
+    "panel.viewable",
+    "panel.widgets",
+)
+
+IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure():
+    """
+    Returns the self and cumulative import time (in microseconds)
+    of each module imported by `import panel`.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import panel"],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            times[module] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main(repeat, top):
+    # Take the fastest run to reduce the noise of the measurement
+    runs = [measure() for _ in range(repeat)]
+    times = min(runs, key=lambda run: run["panel"][1])
+
+    total = times["panel"][1] / 1e6
+    print(f"import panel: {total:.3f} s (best of {repeat})")
+    print(f"\nSlowest {top} modules by self time:")
+    for module, (self_us, cumulative_us) in sorted(
+        times.items(), key=lambda item: item[1][0], reverse=True
+    )[:top]:
+        print(f"  {self_us / 1e3:8.1f} ms  {cumulative_us / 1e3:8.1f} ms  {module}")
+
+    eager = [module for module in LAZY_MODULES if module in times]
+    assert not eager, f"Lazily loaded modules imported eagerly: {', '.join(eager)}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements")
+    parser.add_argument("--top", type=int, default=10, help="Number of modules to report")
+    args = parser.parse_args()
+    main(args.repeat, args.top)